@@ -0,0 +1,248 @@
+"""
+Realistic Spotify Web API payloads used by the benchmarks.
+
+Shapes follow the API reference. IDs are derived from an integer so fixtures are
+deterministic and distinct items can be produced cheaply.
+"""
+
+from typing import Dict, List, Optional
+from urllib.parse import parse_qsl, urlencode, urlsplit
+
+# Markets a typical track is available in (Spotify lists ~185 of them).
+MARKETS = (
+    "AD AE AG AL AM AO AR AT AU AZ BA BB BD BE BF BG BH BI BJ BN BO BR BS BT BW BY BZ "
+    "CA CD CG CH CI CL CM CO CR CV CW CY CZ DE DJ DK DM DO DZ EC EE EG ES ET FI FJ FM "
+    "FR GA GB GD GE GH GM GN GQ GR GT GW GY HK HN HR HT HU ID IE IL IN IQ IS IT JM JO "
+    "JP KE KG KH KI KM KN KR KW KZ LA LB LC LI LK LR LS LT LU LV LY MA MC MD ME MG MH "
+    "MK ML MN MO MR MT MU MV MW MX MY MZ NA NE NG NI NL NO NP NR NZ OM PA PE PG PH PK "
+    "PL PR PS PT PW PY QA RO RS RW SA SB SC SE SG SI SK SL SM SN SR ST SV SZ TD TG TH "
+    "TJ TL TN TO TR TT TV TW TZ UA UG US UY UZ VC VE VN VU WS XK ZA ZM ZW"
+).split()
+
+
+def spotify_id(kind: str, i: int) -> str:
+    return f"{kind[:2]}{i:020d}"
+
+
+def image(size: int) -> Dict:
+    return {"height": size, "url": f"https://i.scdn.co/image/{size}", "width": size}
+
+
+def simplified_artist(i: int) -> Dict:
+    id = spotify_id("artist", i)
+    return {
+        "external_urls": {"spotify": f"https://open.spotify.com/artist/{id}"},
+        "href": f"https://api.spotify.com/v1/artists/{id}",
+        "id": id,
+        "name": f"Artist {i}",
+        "type": "artist",
+        "uri": f"spotify:artist:{id}",
+    }
+
+
+def artist(i: int) -> Dict:
+    return {
+        **simplified_artist(i),
+        "followers": {"href": None, "total": 1000 + i},
+        "genres": ["rock", "metal"],
+        "images": [image(640), image(320), image(160)],
+        "popularity": i % 100,
+    }
+
+
+def simplified_album(i: int) -> Dict:
+    id = spotify_id("album", i)
+    return {
+        "album_type": "album",
+        "artists": [simplified_artist(i % 97)],
+        "available_markets": list(MARKETS),
+        "external_urls": {"spotify": f"https://open.spotify.com/album/{id}"},
+        "href": f"https://api.spotify.com/v1/albums/{id}",
+        "id": id,
+        "images": [image(640), image(300), image(64)],
+        "name": f"Album {i}",
+        "release_date": "1986-03-03",
+        "release_date_precision": "day",
+        "total_tracks": 8,
+        "type": "album",
+        "uri": f"spotify:album:{id}",
+    }
+
+
+def simplified_track(i: int) -> Dict:
+    id = spotify_id("track", i)
+    return {
+        "artists": [simplified_artist(i % 97), simplified_artist(i % 89)],
+        "available_markets": list(MARKETS),
+        "disc_number": 1,
+        "duration_ms": 180000 + i,
+        "explicit": False,
+        "external_urls": {"spotify": f"https://open.spotify.com/track/{id}"},
+        "href": f"https://api.spotify.com/v1/tracks/{id}",
+        "id": id,
+        "is_local": False,
+        "name": f"Track {i}",
+        "preview_url": f"https://p.scdn.co/mp3-preview/{id}",
+        "track_number": i % 12 + 1,
+        "type": "track",
+        "uri": f"spotify:track:{id}",
+    }
+
+
+def track(i: int) -> Dict:
+    return {
+        **simplified_track(i),
+        "album": simplified_album(i // 10),
+        "external_ids": {"isrc": f"US{i:010d}"},
+        "popularity": i % 100,
+    }
+
+
+def album(i: int, total_tracks: int = 12) -> Dict:
+    return {
+        **simplified_album(i),
+        "copyrights": [
+            {"text": "(C) 1986", "type": "C"},
+            {"text": "(P) 1986", "type": "P"},
+        ],
+        "external_ids": {"upc": f"{i:012d}"},
+        "genres": [],
+        "label": "Label",
+        "popularity": i % 100,
+        "total_tracks": total_tracks,
+        "tracks": paging(
+            [simplified_track(i * 100 + n) for n in range(min(total_tracks, 50))],
+            href=f"https://api.spotify.com/v1/albums/{spotify_id('album', i)}/tracks",
+            total=total_tracks,
+        ),
+    }
+
+
+def paging(
+    items: List[Dict], href: str, total: int, offset: int = 0, limit: int = 50
+) -> Dict:
+    next = None
+    if offset + limit < total:
+        # Keep every other query parameter, so following next stays on the same host and query.
+        url = urlsplit(href)
+        query = dict(parse_qsl(url.query, keep_blank_values=True))
+        query.update(offset=offset + limit, limit=limit)
+        next = url._replace(query=urlencode(query)).geturl()
+    return {
+        "href": href,
+        "items": items,
+        "limit": limit,
+        "next": next,
+        "offset": offset,
+        "previous": None,
+        "total": total,
+    }
+
+
+def search_page(
+    search_type: str,
+    query: str,
+    offset: int = 0,
+    limit: int = 20,
+    total: int = 1000,
+    href: Optional[str] = None,
+) -> Dict:
+    """
+    Search response for one type ("track", "album" or "artist").
+    href is the URL of the request, which next links are built from.
+    """
+    build = {"track": track, "album": simplified_album, "artist": artist}[search_type]
+    items = [build(i) for i in range(offset, min(offset + limit, total))]
+    if href is None:
+        params = {"q": query, "type": search_type, "offset": offset, "limit": limit}
+        href = f"https://api.spotify.com/v1/search?{urlencode(params)}"
+    return {
+        f"{search_type}s": paging(
+            items, href=href, total=total, offset=offset, limit=limit
+        )
+    }
+
+
+def _time_intervals(count: int, length: float) -> List[Dict]:
+    return [
+        {"start": n * length, "duration": length, "confidence": (n % 10) / 10}
+        for n in range(count)
+    ]
+
+
+def audio_analysis(i: int, seconds: float = 210.0) -> Dict:
+    """
+    Audio analysis of a track lasting seconds, with interval counts typical of a 120 BPM song:
+    ~105 bars, ~420 beats, ~840 tatums, ~10 sections and ~900 segments.
+    """
+    beat = 0.5
+    segments = int(seconds * 4.3)
+    return {
+        "meta": {
+            "analyzer_version": "4.0.0",
+            "platform": "Linux",
+            "detailed_status": "OK",
+            "status_code": 0,
+            "timestamp": 1495193577,
+            "analysis_time": 6.93906,
+            "input_process": "libvorbisfile L+R 44100->22050",
+        },
+        "track": {
+            "num_samples": int(seconds * 22050),
+            "duration": seconds,
+            "sample_md5": "",
+            "offset_seconds": 0,
+            "window_seconds": 0,
+            "analysis_sample_rate": 22050,
+            "analysis_channels": 1,
+            "end_of_fade_in": 0.0,
+            "start_of_fade_out": seconds - 5,
+            "loudness": -5.883,
+            "tempo": 118.211,
+            "tempo_confidence": 0.73,
+            "time_signature": 4,
+            "time_signature_confidence": 0.994,
+            "key": i % 12,
+            "key_confidence": 0.408,
+            "mode": i % 2,
+            "mode_confidence": 0.485,
+            "codestring": "eJxVnAmS5DgOBL-" * 200,
+            "code_version": 3.15,
+            "echoprintstring": "eJzFnQ2SHLdyfC-" * 200,
+            "echoprint_version": 4.15,
+            "synchstring": "eJx1mIlx7DAMQ1u" * 20,
+            "synch_version": 1.0,
+            "rhythmstring": "eJxdnAuSJbkNRL-" * 200,
+            "rhythm_version": 1.0,
+        },
+        "bars": _time_intervals(int(seconds / beat / 4), beat * 4),
+        "beats": _time_intervals(int(seconds / beat), beat),
+        "tatums": _time_intervals(int(seconds / beat * 2), beat / 2),
+        "sections": [
+            {
+                **interval,
+                "loudness": -14.938,
+                "tempo": 113.178,
+                "tempo_confidence": 0.647,
+                "key": n % 12,
+                "key_confidence": 0.297,
+                "mode": n % 2,
+                "mode_confidence": 0.471,
+                "time_signature": 4,
+                "time_signature_confidence": 1,
+            }
+            for n, interval in enumerate(_time_intervals(10, seconds / 10))
+        ],
+        "segments": [
+            {
+                **interval,
+                "loudness_start": -60,
+                "loudness_max": -56.14,
+                "loudness_max_time": 0.24,
+                "loudness_end": 0,
+                "pitches": [((n + k) % 12) / 12 for k in range(12)],
+                "timbre": [((n * k) % 100) - 50.5 for k in range(12)],
+            }
+            for n, interval in enumerate(_time_intervals(segments, seconds / segments))
+        ],
+    }
@@ -0,0 +1,53 @@
+"""
+CPU time of parse_json for a page of 50 full tracks, eager vs. lazy hydration.
+
+Lazy models only build their nested Artist/Album/Image objects when those attributes
+are read. Each round parses the page and reads id, name and duration_ms of every track,
+which is all most consumers need.
+
+Usage:
+    python -m benchmarks.hydration [--rounds 2000]
+"""
+
+import argparse
+import json
+import time
+
+from spoti2py.client import MODELS
+from spoti2py.utils import parse_json
+
+from .fixtures import track
+
+
+def seconds_per_page(page: list, rounds: int, lazy: bool) -> float:
+    started = time.perf_counter()
+    for _ in range(rounds):
+        for item in parse_json(
+            item_type="tracks", json_response=page, models=MODELS, lazy=lazy
+        ):
+            item.id, item.name, item.duration_ms
+    return (time.perf_counter() - started) / rounds
+
+
+def run(rounds: int = 2000) -> dict:
+    page = [track(i) for i in range(50)]
+    eager = seconds_per_page(page, rounds, lazy=False)
+    lazy = seconds_per_page(page, rounds, lazy=True)
+    return {
+        "benchmark": "hydration",
+        "page_size": len(page),
+        "eager_us_per_page": round(eager * 1e6, 1),
+        "lazy_us_per_page": round(lazy * 1e6, 1),
+        "speedup": round(eager / lazy, 2),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--rounds", type=int, default=2000)
+    args = parser.parse_args()
+    print(json.dumps(run(args.rounds), indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+"""
+Memory retained per Track model: plain classes with a per-instance __dict__,
+slotted models, and slotted models deduplicated through an IdentityMap.
+
+Decodes representative full track payloads (two artists, a simplified album with
+three images, ~180 markets), builds tracks with parse_json, drops the payloads
+and measures what the models keep alive with tracemalloc.
+
+Usage:
+    python -m benchmarks.memory [--count 10000]
+"""
+
+import argparse
+import gc
+import json
+import tracemalloc
+
+from spoti2py.client import MODELS
+from spoti2py.identity import IdentityMap
+from spoti2py.utils import parse_json
+
+from .fixtures import track
+
+
+def plain_class(cls: type) -> type:
+    """Returns a copy of a model class without __slots__, as the models were before."""
+    namespace = {
+        name: value
+        for name, value in vars(cls).items()
+        if name not in ("__slots__", "__dict__", "__weakref__")
+        and name not in cls.__slots__
+    }
+    return type(cls.__name__, (), namespace)
+
+
+def plain_models(models: dict) -> dict:
+    return {
+        item_type: {
+            "main": plain_class(classes["main"]),
+            "extra": {name: plain_class(cls) for name, cls in classes["extra"].items()},
+        }
+        for item_type, classes in models.items()
+    }
+
+
+def bytes_per_track(body: bytes, models: dict, identity_map=None) -> float:
+    gc.collect()
+    tracemalloc.start()
+    payloads = json.loads(body)
+    tracks = parse_json(
+        item_type="tracks",
+        json_response=payloads,
+        models=models,
+        identity_map=identity_map,
+    )
+    count = len(payloads)
+    del payloads
+    gc.collect()
+    retained = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del tracks
+    return retained / count
+
+
+def run(count: int = 10000) -> dict:
+    body = json.dumps([track(i) for i in range(count)]).encode()
+    plain = bytes_per_track(body, plain_models(MODELS))
+    slotted = bytes_per_track(body, MODELS)
+    interned = bytes_per_track(body, MODELS, IdentityMap())
+    return {
+        "benchmark": "memory",
+        "count": count,
+        "bytes_per_track_plain": round(plain),
+        "bytes_per_track_slotted": round(slotted),
+        "bytes_per_track_interned": round(interned),
+        "reduction_slotted": round(1 - slotted / plain, 3),
+        "reduction_interned": round(1 - interned / plain, 3),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--count", type=int, default=10000)
+    args = parser.parse_args()
+    print(json.dumps(run(args.count), indent=2))
+
+
+if __name__ == "__main__":
+    main()
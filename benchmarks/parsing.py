@@ -0,0 +1,99 @@
+"""
+Micro-benchmarks of JSON decoding, parse_json and model construction, without any I/O.
+
+Every case runs --rounds times per repeat and the fastest of --repeat repeats is reported,
+in microseconds per operation:
+
+* decode: the default JSON decoder and json.loads on a page of 50 full tracks.
+* parse_json: 50 tracks, 20 albums and 50 artists, eager, lazy, with MarketSets
+  and through an IdentityMap.
+* AudioAnalysis: building the model from a decoded audio analysis, which converts
+  its intervals and segments to columnar arrays when NumPy is installed.
+
+Usage:
+    python -m benchmarks.parsing [--rounds 200] [--repeat 5]
+"""
+
+import argparse
+import json
+import time
+from typing import Callable, Dict
+
+from spoti2py.client import MODELS
+from spoti2py.identity import IdentityMap
+from spoti2py.models import AudioAnalysis
+from spoti2py.utils import default_json_loads, parse_json
+
+from .fixtures import album, artist, audio_analysis, track
+
+
+def best_of(function: Callable[[], object], rounds: int, repeat: int) -> float:
+    """Fastest time of one call to function, in microseconds."""
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        for _ in range(rounds):
+            function()
+        best = min(best, (time.perf_counter() - started) / rounds)
+    return round(best * 1e6, 2)
+
+
+def cases() -> Dict[str, Callable[[], object]]:
+    tracks = [track(i) for i in range(50)]
+    albums = [album(i) for i in range(20)]
+    artists = [artist(i) for i in range(50)]
+    body = json.dumps(tracks).encode()
+    loads = default_json_loads()
+    analysis = audio_analysis(0)
+
+    def parse(item_type, payload, **options):
+        return lambda: parse_json(
+            item_type=item_type, json_response=payload, models=MODELS, **options
+        )
+
+    def build_analysis():
+        return AudioAnalysis(
+            **analysis["track"],
+            bars=analysis["bars"],
+            beats=analysis["beats"],
+            tatums=analysis["tatums"],
+            sections=analysis["sections"],
+            segments=analysis["segments"],
+        )
+
+    return {
+        f"decode_{loads.__module__}": lambda: loads(body),
+        "decode_json": lambda: json.loads(body),
+        "parse_tracks": parse("tracks", tracks),
+        "parse_tracks_lazy": parse("tracks", tracks, lazy=True),
+        "parse_tracks_market_sets": parse("tracks", tracks, market_sets=True),
+        "parse_tracks_identity_map": parse(
+            "tracks", tracks, identity_map=IdentityMap()
+        ),
+        "parse_albums": parse("albums", albums),
+        "parse_artists": parse("artists", artists),
+        "audio_analysis": build_analysis,
+    }
+
+
+def run(rounds: int = 200, repeat: int = 5) -> Dict:
+    return {
+        "benchmark": "parsing",
+        "rounds": rounds,
+        "us_per_op": {
+            name: best_of(function, rounds, repeat)
+            for name, function in cases().items()
+        },
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--rounds", type=int, default=200)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    print(json.dumps(run(args.rounds, args.repeat), indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,291 @@
+"""
+Local stub of the Spotify Web API serving the payloads of fixtures.py.
+
+Serves the token endpoint, tracks, albums, album tracks, artists, search and audio analysis.
+IDs made with fixtures.spotify_id() map back to the fixture they were made from; any other
+ID maps to a fixture derived from its hash. Bodies are encoded once and cached, so the
+server spends as little CPU as possible per request.
+
+Latency, 429 Too Many Requests and 5xx errors can be injected to exercise the
+client's rate limiting and retries.
+
+Usage:
+    python -m benchmarks.server [--port 8000] [--latency 0.02] [--throttle-rate 0.01] [--error-rate 0.01]
+"""
+
+import argparse
+import asyncio
+import functools
+import json
+import multiprocessing
+import random
+import zlib
+from typing import Callable, Dict, Optional, Tuple
+
+from aiohttp import web
+
+from . import fixtures
+
+
+def _number(id: str) -> int:
+    """The integer a fixtures.spotify_id() was made from, or a hash of any other ID."""
+    digits = id[2:]
+    if digits.isdigit():
+        return int(digits)
+    return zlib.crc32(id.encode())
+
+
+@functools.lru_cache(maxsize=8192)
+def _encode(build: Callable[..., Dict], *args) -> bytes:
+    return json.dumps(build(*args)).encode()
+
+
+def _several(kind: str, build: Callable[[int], Dict], ids: str) -> Dict:
+    return {kind: [build(_number(id)) for id in ids.split(",")]}
+
+
+class StubServer:
+    """
+    aiohttp application imitating the Spotify Web API.
+
+    :ivar latency: Seconds every response is delayed by. Default is 0.
+    :ivar jitter: Up to this many seconds are added at random to latency. Default is 0.
+    :ivar throttle_rate: Share of API requests answered with 429 Too Many Requests. Default is 0.
+    :ivar error_rate: Share of API requests answered with 503 Service Unavailable. Default is 0.
+    :ivar retry_after: Retry-After of 429 responses, in seconds. Default is 0.1.
+    :ivar seed: Seed of the random faults and jitter. Default is 0.
+    :ivar stats: Number of requests, throttled requests and errors served so far.
+    """
+
+    def __init__(
+        self,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        throttle_rate: float = 0.0,
+        error_rate: float = 0.0,
+        retry_after: float = 0.1,
+        seed: int = 0,
+    ) -> None:
+        self.latency = latency
+        self.jitter = jitter
+        self.throttle_rate = throttle_rate
+        self.error_rate = error_rate
+        self.retry_after = retry_after
+        self.stats = {"requests": 0, "throttled": 0, "errors": 0, "tokens": 0}
+        self._random = random.Random(seed)
+        self._runner: Optional[web.AppRunner] = None
+        self.port: Optional[int] = None
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self.port}/"
+
+    def configure(self, client) -> None:
+        """Points a Client at this server."""
+        client.API_URL = self.url
+        client.token_url = f"{self.url}api/token"
+
+    def app(self) -> web.Application:
+        app = web.Application()
+        app.router.add_post("/api/token", self.token)
+        routes = {
+            "/v1/tracks": self.tracks,
+            "/v1/tracks/{id}": self.track,
+            "/v1/albums": self.albums,
+            "/v1/albums/{id}": self.album,
+            "/v1/albums/{id}/tracks": self.album_tracks,
+            "/v1/artists": self.artists,
+            "/v1/artists/{id}": self.artist,
+            "/v1/search": self.search,
+            "/v1/audio-analysis/{id}": self.audio_analysis,
+        }
+        for path, handler in routes.items():
+            app.router.add_get(path, self._api(handler))
+        return app
+
+    async def start(self, port: int = 0) -> int:
+        """Starts serving on 127.0.0.1 and returns the port. 0 picks a free port."""
+        self._runner = web.AppRunner(self.app(), access_log=None)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, "127.0.0.1", port)
+        await site.start()
+        self.port = self._runner.addresses[0][1]
+        return self.port
+
+    async def stop(self) -> None:
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+    async def __aenter__(self) -> "StubServer":
+        await self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        await self.stop()
+
+    async def _delay(self) -> None:
+        delay = self.latency
+        if self.jitter:
+            delay += self._random.uniform(0, self.jitter)
+        if delay:
+            await asyncio.sleep(delay)
+
+    def _api(self, handler: Callable[[web.Request], bytes]):
+        async def respond(request: web.Request) -> web.Response:
+            self.stats["requests"] += 1
+            await self._delay()
+            roll = self._random.random()
+            if roll < self.throttle_rate:
+                self.stats["throttled"] += 1
+                return _error(429, "API rate limit exceeded", self.retry_after)
+            if roll < self.throttle_rate + self.error_rate:
+                self.stats["errors"] += 1
+                return _error(503, "Service unavailable")
+            return web.Response(body=handler(request), content_type="application/json")
+
+        return respond
+
+    async def token(self, request: web.Request) -> web.Response:
+        self.stats["tokens"] += 1
+        await self._delay()
+        return web.json_response(
+            {"access_token": "stub", "token_type": "Bearer", "expires_in": 3600}
+        )
+
+    def tracks(self, request: web.Request) -> bytes:
+        return _encode(_several, "tracks", fixtures.track, request.query["ids"])
+
+    def track(self, request: web.Request) -> bytes:
+        return _encode(fixtures.track, _number(request.match_info["id"]))
+
+    def albums(self, request: web.Request) -> bytes:
+        return _encode(_several, "albums", fixtures.album, request.query["ids"])
+
+    def album(self, request: web.Request) -> bytes:
+        return _encode(fixtures.album, _number(request.match_info["id"]))
+
+    def album_tracks(self, request: web.Request) -> bytes:
+        id = request.match_info["id"]
+        offset, limit = _page(request)
+        return _encode(_album_tracks, id, offset, limit, str(request.url))
+
+    def artists(self, request: web.Request) -> bytes:
+        return _encode(_several, "artists", fixtures.artist, request.query["ids"])
+
+    def artist(self, request: web.Request) -> bytes:
+        return _encode(fixtures.artist, _number(request.match_info["id"]))
+
+    def search(self, request: web.Request) -> bytes:
+        offset, limit = _page(request)
+        search_type = request.query.get("type", "track").split(",")[0]
+        return _encode(
+            fixtures.search_page,
+            search_type,
+            request.query.get("q", ""),
+            offset,
+            limit,
+            1000,
+            str(request.url),
+        )
+
+    def audio_analysis(self, request: web.Request) -> bytes:
+        return _encode(fixtures.audio_analysis, _number(request.match_info["id"]))
+
+
+def _page(request: web.Request) -> Tuple[int, int]:
+    return int(request.query.get("offset", 0)), int(request.query.get("limit", 20))
+
+
+def _album_tracks(id: str, offset: int, limit: int, href: str, total: int = 12) -> Dict:
+    base = _number(id) * 100
+    return fixtures.paging(
+        [
+            fixtures.simplified_track(base + n)
+            for n in range(offset, min(offset + limit, total))
+        ],
+        href=href,
+        total=total,
+        offset=offset,
+        limit=limit,
+    )
+
+
+def _error(status: int, message: str, retry_after: Optional[float] = None):
+    headers = {"Retry-After": str(retry_after)} if retry_after is not None else None
+    return web.json_response(
+        {"error": {"status": status, "message": message}},
+        status=status,
+        headers=headers,
+    )
+
+
+def _serve(options: Dict, port: int, ports: multiprocessing.Queue) -> None:
+    async def serve() -> None:
+        server = StubServer(**options)
+        ports.put(await server.start(port))
+        await asyncio.Event().wait()
+
+    try:
+        asyncio.run(serve())
+    except KeyboardInterrupt:
+        pass
+
+
+def start_in_subprocess(
+    port: int = 0, **options
+) -> Tuple[multiprocessing.Process, int]:
+    """
+    Runs a StubServer in a separate process, so serving requests doesn't compete
+    with the benchmarked client for the event loop and the GIL.
+    Returns the process, to terminate() when done, and the port it serves on.
+
+    :param options: StubServer arguments.
+    """
+    context = multiprocessing.get_context("spawn")
+    ports = context.Queue()
+    process = context.Process(target=_serve, args=(options, port, ports), daemon=True)
+    process.start()
+    return process, ports.get(timeout=30)
+
+
+def add_fault_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("--latency", type=float, default=0.0, help="seconds")
+    parser.add_argument("--jitter", type=float, default=0.0, help="seconds")
+    parser.add_argument("--throttle-rate", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--retry-after", type=float, default=0.1, help="seconds")
+    parser.add_argument("--seed", type=int, default=0)
+
+
+def fault_options(args: argparse.Namespace) -> Dict:
+    return {
+        "latency": args.latency,
+        "jitter": args.jitter,
+        "throttle_rate": args.throttle_rate,
+        "error_rate": args.error_rate,
+        "retry_after": args.retry_after,
+        "seed": args.seed,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--port", type=int, default=8000)
+    add_fault_arguments(parser)
+    args = parser.parse_args()
+
+    async def serve() -> None:
+        server = StubServer(**fault_options(args))
+        await server.start(args.port)
+        print(f"Serving on {server.url}")
+        await asyncio.Event().wait()
+
+    try:
+        asyncio.run(serve())
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
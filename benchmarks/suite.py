@@ -0,0 +1,131 @@
+"""
+Runs every benchmark and writes the results, with the version and environment
+they were measured in, as one JSON document.
+
+With --baseline, the results of an earlier run are compared metric by metric,
+so a regression between two versions shows up as a relative change.
+
+Usage:
+    python -m benchmarks.suite [--output results.json] [--baseline previous.json] [--quick]
+        [--latency 0.005] [--throttle-rate 0.01] [--error-rate 0.01]
+"""
+
+import argparse
+import datetime
+import json
+import platform
+import subprocess
+import sys
+from typing import Dict, Optional
+
+from spoti2py.utils import default_json_loads
+
+from . import hydration, memory, parsing, throughput
+from .server import add_fault_arguments, fault_options
+
+
+def environment() -> Dict:
+    try:
+        from importlib.metadata import version
+
+        spoti2py_version: Optional[str] = version("spoti2py")
+    except Exception:
+        spoti2py_version = None
+    try:
+        commit: Optional[str] = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {
+        "spoti2py": spoti2py_version,
+        "commit": commit,
+        "python": sys.version.split()[0],
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "json_loads": default_json_loads().__module__,
+        "timestamp": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+    }
+
+
+def flatten(benchmarks: Dict) -> Dict[str, float]:
+    """Every numeric result, keyed by a dotted name stable between runs."""
+    metrics = {}
+    for name, result in benchmarks.items():
+        if name == "throughput":
+            for run in result["results"]:
+                prefix = f"throughput.{run['scenario']}.c{run['concurrency']}"
+                for key in ("calls_per_second", "p50_ms", "p99_ms", "failures"):
+                    metrics[f"{prefix}.{key}"] = run[key]
+        elif name == "parsing":
+            for case, value in result["us_per_op"].items():
+                metrics[f"parsing.{case}_us"] = value
+        else:
+            for key, value in result.items():
+                if isinstance(value, (int, float)) and not isinstance(value, bool):
+                    metrics[f"{name}.{key}"] = value
+    return metrics
+
+
+def compare(current: Dict, baseline: Dict) -> Dict[str, Dict]:
+    """Relative change of every metric present in both runs."""
+    new = flatten(current["benchmarks"])
+    old = flatten(baseline["benchmarks"])
+    return {
+        name: {
+            "baseline": old[name],
+            "current": new[name],
+            "change": round(new[name] / old[name] - 1, 4) if old[name] else None,
+        }
+        for name in new
+        if name in old
+    }
+
+
+def run(quick: bool = False, **faults) -> Dict:
+    return {
+        "environment": environment(),
+        "benchmarks": {
+            "parsing": parsing.run(rounds=20 if quick else 200),
+            "hydration": hydration.run(rounds=200 if quick else 2000),
+            "memory": memory.run(count=1000 if quick else 10000),
+            "throughput": throughput.run(
+                concurrency=[1, 32] if quick else [1, 8, 32, 128],
+                requests=50 if quick else 500,
+                **faults,
+            ),
+        },
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--output", help="file to write the results to")
+    parser.add_argument("--baseline", help="results of an earlier run to compare to")
+    parser.add_argument(
+        "--quick", action="store_true", help="fewer rounds, for a smoke test"
+    )
+    add_fault_arguments(parser)
+    args = parser.parse_args()
+
+    results = run(quick=args.quick, **fault_options(args))
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as file:
+            baseline = json.load(file)
+        results["comparison"] = {
+            "baseline": baseline["environment"],
+            "metrics": compare(results, baseline),
+        }
+    document = json.dumps(results, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as file:
+            file.write(document + "\n")
+    else:
+        print(document)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,177 @@
+"""
+End-to-end Client throughput and latency against the local stub server.
+
+For every scenario and concurrency level, a fresh Client makes --requests calls
+from that many concurrent workers. Every call asks for different IDs, so requests
+are neither coalesced nor served from a cache. Reports calls per second, p50/p99/max
+latency per call, failed calls, and the retries and 429s the client went through.
+
+The stub server runs in a separate process unless --in-process is given.
+
+Usage:
+    python -m benchmarks.throughput [--concurrency 1,8,32,128] [--requests 500]
+        [--scenarios track,tracks,album,search,audio-analysis]
+        [--latency 0.005] [--throttle-rate 0.01] [--error-rate 0.01]
+"""
+
+import argparse
+import asyncio
+import json
+import time
+from typing import Awaitable, Callable, Dict, List
+
+from spoti2py.client import Client
+from spoti2py.metrics import MetricsAggregator
+from spoti2py.retry import RetryPolicy
+
+from .fixtures import spotify_id
+from .server import StubServer, add_fault_arguments, fault_options, start_in_subprocess
+
+SCENARIOS: Dict[str, Callable[[Client, int], Awaitable]] = {
+    "track": lambda client, n: client.get_track(spotify_id("track", n)),
+    "tracks": lambda client, n: client.get_tracks(
+        [spotify_id("track", n * 50 + i) for i in range(50)]
+    ),
+    "album": lambda client, n: client.get_album(spotify_id("album", n)),
+    "search": lambda client, n: client.search(f"query {n}", limit=20),
+    "audio-analysis": lambda client, n: client.get_audio_analysis(
+        spotify_id("track", n)
+    ),
+}
+
+
+def percentile(sorted_values: List[float], q: float) -> float:
+    """Nearest-rank percentile of an ascending list."""
+    if not sorted_values:
+        return float("nan")
+    rank = max(int(round(q * len(sorted_values) + 0.5)) - 1, 0)
+    return sorted_values[min(rank, len(sorted_values) - 1)]
+
+
+async def measure(url: str, scenario: str, concurrency: int, requests: int) -> Dict:
+    """Makes requests calls of scenario with concurrency workers and summarizes them."""
+    call = SCENARIOS[scenario]
+    metrics = MetricsAggregator()
+    client = Client(
+        "benchmark",
+        "benchmark",
+        max_concurrency=concurrency,
+        retry_policy=RetryPolicy(max_attempts=5, backoff_base=0.01),
+        metrics=metrics,
+        profile=False,
+    )
+    client.API_URL = url
+    client.token_url = f"{url}api/token"
+    latencies: List[float] = []
+    failures = 0
+    numbers = iter(range(requests))
+
+    async def worker() -> None:
+        nonlocal failures
+        for n in numbers:
+            started = time.perf_counter()
+            try:
+                await call(client, n)
+            except Exception:
+                failures += 1
+            else:
+                latencies.append(time.perf_counter() - started)
+
+    try:
+        await client.authenticate()
+        started = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        elapsed = time.perf_counter() - started
+    finally:
+        await client.close()
+
+    latencies.sort()
+    endpoints = metrics.snapshot()["endpoints"].values()
+    return {
+        "scenario": scenario,
+        "concurrency": concurrency,
+        "calls": requests,
+        "failures": failures,
+        "seconds": round(elapsed, 4),
+        "calls_per_second": round(len(latencies) / elapsed, 1),
+        "p50_ms": round(percentile(latencies, 0.5) * 1000, 3),
+        "p99_ms": round(percentile(latencies, 0.99) * 1000, 3),
+        "max_ms": round(latencies[-1] * 1000, 3) if latencies else None,
+        "http_requests": sum(stats["requests"] for stats in endpoints),
+        "retries": sum(stats["retries"] for stats in endpoints),
+        "throttled": sum(stats["throttled"] for stats in endpoints),
+    }
+
+
+async def run_async(
+    url: str, scenarios: List[str], concurrency: List[int], requests: int
+) -> List[Dict]:
+    # Every run asks for the same IDs, so the server only encodes their bodies once.
+    return [
+        await measure(url, scenario, level, requests)
+        for scenario in scenarios
+        for level in concurrency
+    ]
+
+
+def run(
+    scenarios: List[str] = list(SCENARIOS),
+    concurrency: List[int] = [1, 8, 32, 128],
+    requests: int = 500,
+    in_process: bool = False,
+    **faults,
+) -> Dict:
+    """
+    Runs the benchmark against a new stub server and returns the results.
+
+    :param faults: StubServer arguments, e.g. latency=0.005 or throttle_rate=0.01.
+    """
+
+    async def run_in_process() -> List[Dict]:
+        async with StubServer(**faults) as server:
+            return await run_async(server.url, scenarios, concurrency, requests)
+
+    if in_process:
+        results = asyncio.run(run_in_process())
+    else:
+        process, port = start_in_subprocess(**faults)
+        try:
+            results = asyncio.run(
+                run_async(f"http://127.0.0.1:{port}/", scenarios, concurrency, requests)
+            )
+        finally:
+            process.terminate()
+            process.join()
+    return {
+        "benchmark": "throughput",
+        "requests": requests,
+        "server": {**faults, "in_process": in_process},
+        "results": results,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--scenarios", default=",".join(SCENARIOS))
+    parser.add_argument("--concurrency", default="1,8,32,128")
+    parser.add_argument("--requests", type=int, default=500)
+    parser.add_argument("--in-process", action="store_true")
+    add_fault_arguments(parser)
+    args = parser.parse_args()
+
+    print(
+        json.dumps(
+            run(
+                scenarios=args.scenarios.split(","),
+                concurrency=[int(level) for level in args.concurrency.split(",")],
+                requests=args.requests,
+                in_process=args.in_process,
+                **fault_options(args),
+            ),
+            indent=2,
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()
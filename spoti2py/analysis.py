@@ -0,0 +1,214 @@
+from typing import Dict, Optional, Sequence, Union
+
+from .models import AudioAnalysis, AudioFeatures
+from .models._tonality import Tonality
+from .utils import import_numpy
+
+# Fields of the array returned by summarize().
+SUMMARY_FIELDS = (
+    ("key", "i1"),
+    ("mode", "i1"),
+    ("chord", "U8"),
+    ("key_confidence", "f4"),
+    ("mode_confidence", "f4"),
+    ("tonality_confidence", "f4"),
+    ("tempo", "f4"),
+    ("tempo_confidence", "f4"),
+    ("tempo_min", "f4"),
+    ("tempo_max", "f4"),
+    ("time_signature", "i1"),
+    ("loudness", "f4"),
+    ("loudness_mean", "f4"),
+    ("loudness_max", "f4"),
+    ("loudness_std", "f4"),
+    ("duration", "f8"),
+)
+
+# Fields of the array returned by audio_features_array().
+AUDIO_FEATURES_FIELDS = (
+    ("id", "U22"),
+    ("danceability", "f4"),
+    ("energy", "f4"),
+    ("key", "i1"),
+    ("loudness", "f4"),
+    ("mode", "i1"),
+    ("speechiness", "f4"),
+    ("acousticness", "f4"),
+    ("instrumentalness", "f4"),
+    ("liveness", "f4"),
+    ("valence", "f4"),
+    ("tempo", "f4"),
+    ("duration_ms", "i4"),
+    ("time_signature", "i1"),
+)
+
+
+def chord_table():
+    """
+    Returns a (2, 13) array of chord labels indexed by [mode, key + 1].
+    Column 0 (key -1, no key detected) holds empty strings.
+
+    Requires NumPy.
+
+    :rtype: numpy.ndarray
+    """
+    np = import_numpy()
+    table = np.full((2, len(Tonality.KEYS_MAP) + 1), "", dtype="U8")
+    for (key, mode), chord in Tonality.CHORDS.items():
+        table[mode, key + 1] = chord
+    return table
+
+
+def chords(keys, modes):
+    """
+    Vectorized :py:attr:`Tonality.chord <spoti2py.models._tonality.Tonality.chord>`.
+    Looks up the chord label of every (key, mode) pair in :py:func:`chord_table`.
+    Pairs without a detected key or mode get an empty string.
+
+    Requires NumPy.
+
+    :param keys: Array of pitch classes, -1 to 11.
+    :param modes: Array of modes, 1 for major and 0 for minor.
+    :rtype: numpy.ndarray
+    """
+    np = import_numpy()
+    keys = np.asarray(keys, dtype=np.int64)
+    modes = np.asarray(modes, dtype=np.int64)
+    valid = (
+        (keys >= -1) & (keys < len(Tonality.KEYS_MAP)) & ((modes == 0) | (modes == 1))
+    )
+    return chord_table()[np.where(valid, modes, 0), np.where(valid, keys + 1, 0)]
+
+
+def _grouped_stats(values, lengths):
+    """Min, max, mean and standard deviation of consecutive groups of values. NaN for empty groups."""
+    np = import_numpy()
+    count = len(lengths)
+    minimum, maximum, mean, std = (np.full(count, np.nan) for _ in range(4))
+    filled = lengths > 0
+    if not filled.any():
+        return minimum, maximum, mean, std
+    values = values.astype(np.float64)
+    starts = (np.cumsum(lengths) - lengths)[filled]
+    sizes = lengths[filled]
+    minimum[filled] = np.minimum.reduceat(values, starts)
+    maximum[filled] = np.maximum.reduceat(values, starts)
+    mean[filled] = np.add.reduceat(values, starts) / sizes
+    squares = np.add.reduceat(values * values, starts) / sizes
+    std[filled] = np.sqrt(np.maximum(squares - mean[filled] ** 2, 0))
+    return minimum, maximum, mean, std
+
+
+def _concatenate(analyses: Sequence[AudioAnalysis], intervals: str, column: str):
+    """Concatenates one column of the intervals of every analysis and returns it with the group lengths."""
+    np = import_numpy()
+    columns = []
+    for analysis in analyses:
+        value = getattr(analysis, intervals)
+        columns.append(getattr(value, column) if value is not None else ())
+    lengths = np.fromiter(map(len, columns), dtype=np.int64, count=len(columns))
+    values = np.concatenate([np.asarray(c, dtype=np.float32) for c in columns] or [[]])
+    return values, lengths
+
+
+def summarize(analyses: Sequence[AudioAnalysis], ids: Optional[Sequence[str]] = None):
+    """
+    Summarizes many audio analyses as a NumPy structured array, one row per analysis.
+
+    Key, mode, chord label, confidences, tempo and loudness are computed for all analyses
+    at once with array operations and table lookups, so the result can be sorted and
+    filtered without touching Python objects, e.g. rows[rows["chord"] == "Am"].
+
+    * tempo_min and tempo_max span the tempo of the sections.
+    * loudness_mean, loudness_max and loudness_std describe the peak loudness of the segments.
+
+    They are NaN for analyses without sections or segments.
+    Field names and types are listed in :py:data:`SUMMARY_FIELDS`.
+
+    Requires NumPy.
+
+    :param analyses: AudioAnalysis objects, e.g. results of client.get_audio_analysis.
+    :param ids: Optional Spotify IDs of the analysed tracks, stored in an extra "id" field.
+    :rtype: numpy.ndarray
+    """
+    np = import_numpy()
+    fields = list(SUMMARY_FIELDS)
+    if ids is not None:
+        if len(ids) != len(analyses):
+            raise ValueError("ids and analyses need to be of the same length.")
+        fields.insert(0, ("id", "U22"))
+    rows = np.zeros(len(analyses), dtype=fields)
+    if ids is not None:
+        rows["id"] = ids
+    for name in (
+        "key",
+        "mode",
+        "key_confidence",
+        "mode_confidence",
+        "tempo",
+        "tempo_confidence",
+        "time_signature",
+        "loudness",
+        "duration",
+    ):
+        rows[name] = np.fromiter(
+            (getattr(analysis, name) for analysis in analyses),
+            dtype=rows.dtype[name],
+            count=len(analyses),
+        )
+    rows["chord"] = chords(rows["key"], rows["mode"])
+    rows["tonality_confidence"] = (rows["key_confidence"] + rows["mode_confidence"]) / 2
+
+    tempos, lengths = _concatenate(analyses, "sections", "tempo")
+    rows["tempo_min"], rows["tempo_max"], _, _ = _grouped_stats(tempos, lengths)
+
+    loudness, lengths = _concatenate(analyses, "segments", "loudness_max")
+    _, rows["loudness_max"], rows["loudness_mean"], rows["loudness_std"] = (
+        _grouped_stats(loudness, lengths)
+    )
+    return rows
+
+
+def audio_features_array(
+    features: Sequence[Optional[Union[Dict, AudioFeatures]]],
+    ids: Optional[Sequence[str]] = None,
+):
+    """
+    Packs audio features into a NumPy structured array, one row per track.
+    Field names and types are listed in :py:data:`AUDIO_FEATURES_FIELDS`.
+
+    Tracks without features (None) keep their id, get NaN for float fields
+    and -1 for integer fields.
+
+    Requires NumPy.
+
+    :param features: Audio features JSON objects or AudioFeatures models, or None.
+    :param ids: Spotify IDs of the tracks. Taken from features when omitted.
+    :rtype: numpy.ndarray
+    """
+    np = import_numpy()
+    if ids is not None and len(ids) != len(features):
+        raise ValueError("ids and features need to be of the same length.")
+    rows = np.zeros(len(features), dtype=list(AUDIO_FEATURES_FIELDS))
+    for name, dtype in AUDIO_FEATURES_FIELDS:
+        if name == "id" and ids is not None:
+            rows["id"] = ids
+            continue
+        missing = "" if name == "id" else np.nan if dtype.startswith("f") else -1
+        rows[name] = np.fromiter(
+            (
+                (
+                    missing
+                    if feature is None
+                    else (
+                        feature.get(name, missing)
+                        if isinstance(feature, dict)
+                        else getattr(feature, name)
+                    )
+                )
+                for feature in features
+            ),
+            dtype=rows.dtype[name],
+            count=len(features),
+        )
+    return rows
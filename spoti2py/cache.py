@@ -0,0 +1,157 @@
+import time
+from collections import OrderedDict
+from typing import Dict, Mapping, Optional
+from urllib.parse import urlsplit
+
+from .utils import Payload, normalize_endpoint
+
+
+class CacheEntry:
+    """
+    A cached Spotify JSON response.
+
+    :ivar payload: :py:class:`~spoti2py.utils.Payload` with the response body.
+    :ivar etag: Value of the ETag response header or None.
+    :ivar expires: time.monotonic() timestamp after which the entry is stale.
+    """
+
+    __slots__ = ("payload", "etag", "expires")
+
+    def __init__(self, payload: Payload, etag: Optional[str], expires: float) -> None:
+        self.payload = payload
+        self.etag = etag
+        self.expires = expires
+
+    @property
+    def fresh(self) -> bool:
+        return time.monotonic() < self.expires
+
+
+class ResponseCache:
+    """
+    In-memory LRU cache for Spotify API responses, keyed on the normalized endpoint URL.
+
+    Fresh entries are served without touching the network.
+    Stale entries are kept until evicted and revalidated with If-None-Match,
+    so an unchanged resource costs a 304 with no body instead of a full response,
+    and the already decoded JSON is reused.
+
+    :ivar max_size: Maximum number of entries. The least recently used entry is evicted first.
+    :ivar default_ttl: Seconds a response stays fresh when no other TTL applies. Default is 300.
+    :ivar ttls: TTLs per resource type, e.g. {"artists": 3600, "search": 60}.
+                The resource type is the first path segment after the API version.
+    :ivar respect_cache_control: Use Cache-Control max-age from the response when present.
+                                 Default is True.
+    :ivar hits: Number of lookups answered by a fresh entry.
+    :ivar misses: Number of lookups that had to go to the network.
+    :ivar revalidations: Number of stale entries confirmed unchanged by a 304 response.
+    :ivar evictions: Number of entries evicted to stay within max_size.
+    """
+
+    def __init__(
+        self,
+        max_size: int = 1024,
+        default_ttl: float = 300,
+        ttls: Optional[Dict[str, float]] = None,
+        respect_cache_control: bool = True,
+    ) -> None:
+        if max_size < 1:
+            raise ValueError("max_size needs to be at least 1.")
+        self.max_size = max_size
+        self.default_ttl = default_ttl
+        self.ttls = ttls or {}
+        self.respect_cache_control = respect_cache_control
+        self._entries: "OrderedDict[str, CacheEntry]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.revalidations = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @staticmethod
+    def key(endpoint: str) -> str:
+        """Normalizes an endpoint URL so equivalent requests share an entry."""
+        return normalize_endpoint(endpoint)
+
+    @staticmethod
+    def resource_type(key: str) -> str:
+        """Returns the resource type of a key. E.g. 'artists' for /v1/artists/{id}/top-tracks."""
+        segments = [segment for segment in urlsplit(key).path.split("/") if segment]
+        return segments[1] if len(segments) > 1 else ""
+
+    def lookup(self, key: str) -> Optional[CacheEntry]:
+        """
+        Returns the entry stored under key, fresh or stale, or None.
+        Counts a hit for fresh entries and a miss otherwise.
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        if entry.fresh:
+            self.hits += 1
+        else:
+            self.misses += 1
+        return entry
+
+    def store(self, key: str, payload: Payload, headers: Mapping[str, str]) -> None:
+        """Caches a 200 response unless its Cache-Control forbids it."""
+        ttl = self._ttl(key, headers)
+        if ttl is None:
+            self._entries.pop(key, None)
+            return
+        self._entries[key] = CacheEntry(
+            payload, headers.get("ETag"), time.monotonic() + ttl
+        )
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def revalidate(self, key: str, headers: Mapping[str, str]) -> Optional[CacheEntry]:
+        """Marks a stale entry as fresh again after a 304 response and returns it."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        ttl = self._ttl(key, headers)
+        entry.expires = time.monotonic() + (ttl or 0)
+        entry.etag = headers.get("ETag", entry.etag)
+        self.revalidations += 1
+        return entry
+
+    def _ttl(self, key: str, headers: Mapping[str, str]) -> Optional[float]:
+        """Seconds the response stays fresh. None if it must not be stored."""
+        if self.respect_cache_control:
+            directives = {}
+            for directive in headers.get("Cache-Control", "").split(","):
+                name, _, value = directive.strip().partition("=")
+                directives[name.lower()] = value
+            if "no-store" in directives:
+                return None
+            if "no-cache" in directives:
+                return 0
+            try:
+                return max(float(directives["max-age"]), 0)
+            except (KeyError, ValueError):
+                pass
+        return self.ttls.get(self.resource_type(key), self.default_ttl)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def reset_stats(self) -> None:
+        self.hits = self.misses = self.revalidations = self.evictions = 0
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        """Counters useful for sizing the cache."""
+        return {
+            "size": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "revalidations": self.revalidations,
+            "evictions": self.evictions,
+        }
@@ -0,0 +1,387 @@
+import functools
+import hashlib
+import mmap
+import os
+import struct
+import time
+from typing import Any, Callable, Dict, Iterable, Iterator, Optional, Tuple
+
+from .utils import Payload
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+# Index file: header, then an open-addressing hash table of fixed-size slots.
+_MAGIC = b"S2PYIDX1"
+_HEADER = struct.Struct("<8sQQ8x")  # magic, capacity, count
+_SLOT = struct.Struct(
+    "<QQI4xd"
+)  # key hash (0 = empty), record offset, payload length, stored at
+_SLOT_FIELDS = struct.Struct("<QI4xd")  # the slot without its key hash
+# Data file: records of key length, payload length and stored at, then the key and the payload.
+_RECORD = struct.Struct("<HId")
+
+# Grow the index once this share of its slots is in use.
+MAX_LOAD = 0.7
+
+CATALOG_KINDS = ("tracks", "albums", "artists")
+
+
+def _key(kind: str, id: str) -> bytes:
+    return f"{kind}/{id}".encode()
+
+
+def _hash(key: bytes) -> int:
+    # Python's hash() is salted per process, and the index is shared between processes.
+    return int.from_bytes(hashlib.blake2b(key, digest_size=8).digest(), "little") or 1
+
+
+@functools.lru_cache(maxsize=None)
+def _buffer_decoders() -> Tuple[Callable[[bytes], Any], ...]:
+    """JSON decoders known to accept a memoryview as well as bytes."""
+    decoders = []
+    try:
+        import orjson
+
+        decoders.append(orjson.loads)
+    except ImportError:
+        pass
+    try:
+        import msgspec
+
+        decoders.append(msgspec.json.decode)
+    except ImportError:
+        pass
+    return tuple(decoders)
+
+
+class CatalogStore:
+    """
+    Persistent, append-only store of raw track, album and artist payloads, keyed by Spotify ID.
+
+    Payloads are appended to path + ".data". path + ".index" is a hash table from ID to
+    the payload's offset and length, so a lookup costs one or two slot reads, whatever the size
+    of the store. Both files are memory-mapped: payloads are returned as views of the mapping,
+    never copied, and any number of processes can read the same store and share its pages.
+
+    Give it to a :py:class:`~spoti2py.client.Client` to look tracks, albums and artists up
+    in the store before going to the network, and to store what the network returns.
+
+    .. code-block:: python
+
+       catalog = CatalogStore("catalog", max_age=7 * 86400, max_ages={"artists": 86400})
+       client = Client(client_id, client_secret, catalog=catalog)
+
+    Storing an ID again appends the new payload and points the index at it; the old one
+    stays in the data file. Writes from several processes are serialized with a file lock
+    where fcntl is available.
+
+    :ivar path: Path of the store, without the .data and .index suffixes.
+    :ivar max_age: Seconds a payload is served before it's fetched again. Default is None (forever).
+    :ivar max_ages: max_age per kind, e.g. {"artists": 86400}. Default is None.
+    :ivar kinds: Kinds of resources stored. Default is ("tracks", "albums", "artists").
+    :ivar capacity: Number of index slots. The index is rebuilt with twice as many
+                    once MAX_LOAD of them are in use. Default is 65536.
+    :ivar sync: fsync the data file after every write. Default is False.
+    :ivar readonly: Open the store for reading only. Default is False.
+    :ivar hits: Number of lookups answered with a fresh payload.
+    :ivar misses: Number of lookups that found no payload or a stale one.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        max_age: Optional[float] = None,
+        max_ages: Optional[Dict[str, Optional[float]]] = None,
+        kinds: Iterable[str] = CATALOG_KINDS,
+        capacity: int = 1 << 16,
+        sync: bool = False,
+        readonly: bool = False,
+    ) -> None:
+        self.path = path
+        self.max_age = max_age
+        self.max_ages = max_ages or {}
+        self.kinds = frozenset(kinds)
+        self.sync = sync
+        self.readonly = readonly
+        self.hits = 0
+        self.misses = 0
+        self._index_path = f"{path}.index"
+        self._data_path = f"{path}.data"
+        if not readonly:
+            self._data_file = open(self._data_path, "ab")
+            if not os.path.exists(self._index_path):
+                self._create_index(self._index_path, capacity, [])
+        self._index: Optional[mmap.mmap] = None
+        self._index_inode = None
+        self._data: Optional[mmap.mmap] = None
+        self._map_index()
+        self._map_data()
+
+    # Mapping
+
+    def _map_index(self) -> None:
+        with open(self._index_path, "rb" if self.readonly else "r+b") as file:
+            self._index_inode = os.fstat(file.fileno()).st_ino
+            self._index = mmap.mmap(
+                file.fileno(),
+                0,
+                access=mmap.ACCESS_READ if self.readonly else mmap.ACCESS_WRITE,
+            )
+        magic, _, _ = _HEADER.unpack_from(self._index)
+        if magic != _MAGIC:
+            raise ValueError(f"{self._index_path} is not a catalog index.")
+
+    def _map_data(self) -> None:
+        try:
+            size = os.path.getsize(self._data_path)
+        except FileNotFoundError:
+            size = 0
+        if size == 0:
+            self._data = None
+            return
+        with open(self._data_path, "rb") as file:
+            # The previous mapping is left to the garbage collector:
+            # payloads handed out earlier may still be views of it.
+            self._data = mmap.mmap(file.fileno(), size, access=mmap.ACCESS_READ)
+
+    def _refresh(self) -> None:
+        """
+        Picks up an index rebuilt by another process.
+        Data appended since the mapping was made is mapped when a record beyond it is read.
+        """
+        if os.stat(self._index_path).st_ino != self._index_inode:
+            self._map_index()
+
+    @staticmethod
+    def _create_index(
+        path: str, capacity: int, entries: Iterable[Tuple[int, int, int, float]]
+    ) -> None:
+        """Writes an index of capacity slots holding entries, atomically replacing path."""
+        temporary = f"{path}.tmp"
+        size = _HEADER.size + capacity * _SLOT.size
+        with open(temporary, "w+b") as file:
+            file.truncate(size)
+            with mmap.mmap(file.fileno(), size) as index:
+                count = 0
+                for entry in entries:
+                    slot = entry[0] % capacity
+                    while _SLOT.unpack_from(index, _slot_offset(slot))[0]:
+                        slot = (slot + 1) % capacity
+                    _SLOT.pack_into(index, _slot_offset(slot), *entry)
+                    count += 1
+                _HEADER.pack_into(index, 0, _MAGIC, capacity, count)
+                index.flush()
+            os.fsync(file.fileno())
+        os.replace(temporary, path)
+
+    # Lookups
+
+    @property
+    def capacity(self) -> int:
+        return _HEADER.unpack_from(self._index)[1]
+
+    def __len__(self) -> int:
+        """Number of IDs in the store."""
+        return _HEADER.unpack_from(self._index)[2]
+
+    def _find(self, key: bytes, key_hash: int) -> Tuple[int, Optional[int]]:
+        """Returns the slot of key, or of the empty slot ending its probe sequence, and the record offset."""
+        index = self._index
+        capacity = _HEADER.unpack_from(index)[1]
+        slot = key_hash % capacity
+        while True:
+            slot_hash, offset, _, _ = _SLOT.unpack_from(index, _slot_offset(slot))
+            if slot_hash == 0:
+                return slot, None
+            if slot_hash == key_hash and self._record_key(offset) == key:
+                return slot, offset
+            slot = (slot + 1) % capacity
+
+    def _record_key(self, offset: int) -> Optional[bytes]:
+        data = self._data
+        if data is None or offset + _RECORD.size > len(data):
+            self._map_data()
+            data = self._data
+            if data is None or offset + _RECORD.size > len(data):
+                return None
+        key_length, _, _ = _RECORD.unpack_from(data, offset)
+        start = offset + _RECORD.size
+        return data[start : start + key_length]
+
+    def _record(self, offset: int) -> Tuple[memoryview, float]:
+        """The payload of the record at offset and when it was stored."""
+        key_length, length, stored_at = _RECORD.unpack_from(self._data, offset)
+        start = offset + _RECORD.size + key_length
+        if start + length > len(self._data):
+            self._map_data()
+        return memoryview(self._data)[start : start + length], stored_at
+
+    def _lookup(self, kind: str, id: str) -> Optional[Tuple[memoryview, float]]:
+        key = _key(kind, id)
+        key_hash = _hash(key)
+        _, offset = self._find(key, key_hash)
+        if offset is None:
+            # The index may have been rebuilt by another process.
+            self._refresh()
+            _, offset = self._find(key, key_hash)
+            if offset is None:
+                return None
+        return self._record(offset)
+
+    def fresh(self, kind: str, stored_at: float) -> bool:
+        """Whether a payload of kind stored at stored_at (a Unix timestamp) may still be served."""
+        max_age = self.max_ages.get(kind, self.max_age)
+        return max_age is None or time.time() - stored_at < max_age
+
+    def get(self, kind: str, id: str) -> Optional[memoryview]:
+        """
+        Returns the stored payload of a resource, as a read-only view of the mapped data file,
+        or None if it isn't stored or is stale.
+
+        :param kind: "tracks", "albums" or "artists".
+        :param id: Spotify ID.
+        :rtype: memoryview
+        """
+        found = self._lookup(kind, id)
+        if found is None or not self.fresh(kind, found[1]):
+            self.misses += 1
+            return None
+        self.hits += 1
+        return found[0]
+
+    def payload(
+        self, kind: str, id: str, loads: Callable[[bytes], Any]
+    ) -> Optional[Payload]:
+        """
+        Returns the stored payload of a resource as a :py:class:`~spoti2py.utils.Payload`
+        decoded by loads, or None if it isn't stored or is stale.
+        orjson and msgspec read the mapped bytes directly; any other decoder gets a bytes copy.
+        """
+        body = self.get(kind, id)
+        if body is None:
+            return None
+        if loads not in _buffer_decoders():
+            body = body.tobytes()
+        return Payload(body, loads)
+
+    def __contains__(self, item: Tuple[str, str]) -> bool:
+        return self._lookup(*item) is not None
+
+    def keys(self) -> Iterator[Tuple[str, str]]:
+        """Yields (kind, id) of every stored resource."""
+        index = self._index
+        for slot in range(_HEADER.unpack_from(index)[1]):
+            key_hash, offset, _, _ = _SLOT.unpack_from(index, _slot_offset(slot))
+            if key_hash:
+                kind, _, id = bytes(self._record_key(offset)).decode().partition("/")
+                yield kind, id
+
+    # Writes
+
+    def put(self, kind: str, id: str, body: bytes) -> None:
+        """
+        Stores the raw JSON payload of a resource, replacing any earlier one.
+
+        :param kind: "tracks", "albums" or "artists".
+        :param id: Spotify ID.
+        :param body: The resource as JSON, as Spotify returned it.
+        """
+        self.put_many(kind, [(id, body)])
+
+    def put_many(self, kind: str, items: Iterable[Tuple[str, bytes]]) -> None:
+        """
+        Stores (id, body) pairs of one kind, see :py:meth:`put`.
+        They are appended with a single write and take the lock once.
+        """
+        if self.readonly:
+            raise PermissionError(f"{self.path} was opened read-only.")
+        stored_at = time.time()
+        records = []
+        entries = []
+        size = 0
+        for id, body in items:
+            key = _key(kind, id)
+            records += (_RECORD.pack(len(key), len(body), stored_at), key, body)
+            entries.append((key, _hash(key), size, len(body)))
+            size += _RECORD.size + len(key) + len(body)
+        if not entries:
+            return
+        file = self._data_file
+        if fcntl is not None:
+            fcntl.flock(file, fcntl.LOCK_EX)
+        try:
+            self._refresh()
+            file.seek(0, os.SEEK_END)
+            start = file.tell()
+            file.write(b"".join(records))
+            file.flush()
+            if self.sync:
+                os.fsync(file.fileno())
+            for key, key_hash, offset, length in entries:
+                self._publish(key, key_hash, start + offset, length, stored_at)
+        finally:
+            if fcntl is not None:
+                fcntl.flock(file, fcntl.LOCK_UN)
+
+    def _publish(
+        self, key: bytes, key_hash: int, offset: int, length: int, stored_at: float
+    ) -> None:
+        """Points the index entry of key at the record at offset."""
+        slot, previous = self._find(key, key_hash)
+        if previous is None:
+            _, capacity, count = _HEADER.unpack_from(self._index)
+            if count + 1 > capacity * MAX_LOAD:
+                self._grow(capacity * 2)
+                slot, _ = self._find(key, key_hash)
+        index = self._index
+        position = _slot_offset(slot)
+        # Fill the slot before publishing its hash, so readers never see half an entry.
+        _SLOT_FIELDS.pack_into(index, position + 8, offset, length, stored_at)
+        struct.pack_into("<Q", index, position, key_hash)
+        if previous is None:
+            _, capacity, count = _HEADER.unpack_from(index)
+            _HEADER.pack_into(index, 0, _MAGIC, capacity, count + 1)
+
+    def _grow(self, capacity: int) -> None:
+        index = self._index
+        entries = [
+            entry
+            for entry in (
+                _SLOT.unpack_from(index, _slot_offset(slot))
+                for slot in range(_HEADER.unpack_from(index)[1])
+            )
+            if entry[0]
+        ]
+        self._create_index(self._index_path, capacity, entries)
+        self._map_index()
+
+    def flush(self) -> None:
+        """Writes the index and the data file to disk."""
+        if not self.readonly:
+            self._data_file.flush()
+            os.fsync(self._data_file.fileno())
+            self._index.flush()
+
+    def close(self) -> None:
+        if self._index is None:
+            return
+        if not self.readonly:
+            self.flush()
+            self._data_file.close()
+        self._index.close()
+        self._index = None
+        # The data mapping is closed by the garbage collector once no payload refers to it.
+        self._data = None
+
+    def __enter__(self) -> "CatalogStore":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+
+def _slot_offset(slot: int) -> int:
+    return _HEADER.size + slot * _SLOT.size
@@ -1,17 +1,28 @@
 import asyncio
 import base64
+import contextlib
 import datetime
+import functools
+import itertools
 import logging
-from typing import Dict, List, Optional, Union
+import time
+from contextvars import Context, ContextVar
+from typing import Any, AsyncIterator, Callable, Dict, List, Mapping, Optional, Union
 from urllib.parse import parse_qsl, urlencode
 
 import aiohttp
 
+from .analysis import audio_features_array
+from .cache import CacheEntry, ResponseCache
+from .catalog import CatalogStore
 from .exceptions import InvalidCredentials, NoSearchQuery, SpotifyException
+from .identity import IdentityMap
+from .metrics import MetricsCollector, endpoint_template
 from .models import (
     Album,
     Artist,
     AudioAnalysis,
+    AudioFeatures,
     Copyright,
     Followers,
     Image,
@@ -19,7 +30,20 @@ from .models import (
     Search,
     Track,
 )
-from .utils import parse_json
+from .pagination import fetch_all_pages, paginate
+from .pool import ConnectionPool
+from .profiling import CallProfile, Profiler, resolve_profiler
+from .ratelimit import AdaptiveConcurrency, RateLimiter
+from .retry import LatencyTracker, RetryPolicy
+from .transport import AiohttpTransport, Transport
+from .utils import (
+    Payload,
+    chunked,
+    default_json_dumps,
+    default_json_loads,
+    normalize_endpoint,
+    parse_json,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -36,6 +60,162 @@ MODELS = {
     "artists": {"main": Artist, "extra": {"images": Image, "followers": Followers}},
 }
 
+# Maximum number of IDs Spotify accepts in a single multi-ID request.
+MAX_IDS_PER_REQUEST = {
+    "tracks": 50,
+    "albums": 20,
+    "artists": 50,
+    "audio-features": 100,
+}
+
+# Search results can't be paged through past this many items.
+MAX_SEARCH_RESULTS = 1000
+
+
+# time.monotonic() deadline and hedging flag of the public call being executed.
+_deadline: ContextVar[Optional[float]] = ContextVar("deadline", default=None)
+_hedge: ContextVar[bool] = ContextVar("hedge", default=False)
+# Per-call override of Client.lazy.
+_lazy: ContextVar[Optional[bool]] = ContextVar("lazy", default=None)
+# IdentityMap of the innermost Client.identity_scope block.
+_identity_map: ContextVar[Optional[IdentityMap]] = ContextVar(
+    "identity_map", default=None
+)
+# Number of public calls on the stack. Nested calls inherit the options of the outer one.
+_call_depth: ContextVar[int] = ContextVar("call_depth", default=0)
+# Phases of the outermost public call, when profiling.
+_profile: ContextVar[Optional[CallProfile]] = ContextVar("profile", default=None)
+
+
+class _SharedRequest:
+    """
+    A request coalesced between every caller asking for the same endpoint.
+
+    :ivar task: Task fetching the endpoint.
+    :ivar waiters: Number of callers waiting for the task.
+    :ivar deadline: Latest deadline of the waiters, or None if one of them has none.
+    :ivar profile: Network time of the task, if the client is profiled.
+    """
+
+    __slots__ = ("task", "waiters", "deadline", "profile")
+
+    def __init__(self) -> None:
+        self.task: Optional[asyncio.Task] = None
+        self.waiters = 0
+        self.deadline: Optional[float] = None
+        self.profile: Optional[CallProfile] = None
+
+    def join(self, deadline: Optional[float]) -> None:
+        """Adds a waiter with its own deadline."""
+        if not self.waiters:
+            self.deadline = deadline
+        elif self.deadline is not None:
+            self.deadline = None if deadline is None else max(self.deadline, deadline)
+        self.waiters += 1
+
+
+def api_call(method):
+    """
+    Adds the deadline, hedge and lazy keyword arguments to a public Client method.
+
+    The deadline covers everything the call does (waiting for the rate limiter,
+    retries, parsing) and TimeoutError is raised when it runs out.
+    Nested calls inherit hedge and lazy from the outer call and never extend its deadline.
+    """
+
+    @functools.wraps(method)
+    async def wrapper(
+        self,
+        *args,
+        deadline: Optional[float] = None,
+        hedge: Optional[bool] = None,
+        lazy: Optional[bool] = None,
+        **kwargs,
+    ):
+        if deadline is None:
+            deadline = self.default_deadline
+        outer = _call_depth.get() > 0
+        if hedge is None:
+            hedge = _hedge.get() if outer else self.hedge_requests
+        if lazy is None and outer:
+            lazy = _lazy.get()
+        hedge_token = _hedge.set(hedge)
+        lazy_token = _lazy.set(lazy)
+        depth_token = _call_depth.set(_call_depth.get() + 1)
+        profile_token = None
+        if not outer and self.profiler is not None:
+            profile_token = _profile.set(self.profiler.start())
+        try:
+            if deadline is None:
+                return await method(self, *args, **kwargs)
+            when = time.monotonic() + deadline
+            if _deadline.get() is not None:
+                when = min(when, _deadline.get())
+            deadline_token = _deadline.set(when)
+            try:
+                async with asyncio.timeout(when - time.monotonic()):
+                    return await method(self, *args, **kwargs)
+            finally:
+                _deadline.reset(deadline_token)
+        finally:
+            if profile_token is not None:
+                self.profiler.finish(method.__name__, _profile.get())
+                _profile.reset(profile_token)
+            _call_depth.reset(depth_token)
+            _lazy.reset(lazy_token)
+            _hedge.reset(hedge_token)
+
+    return wrapper
+
+
+def iterator_call(method):
+    """
+    Profiles a public Client method returning an async iterator, like api_call does for coroutines.
+
+    Iterating counts as one call. Time the consumer spends between items doesn't count,
+    but pages or batches downloaded ahead in the meantime do.
+    """
+
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        iterator = method(self, *args, **kwargs)
+        if self.profiler is None:
+            return iterator
+        return _profile_iteration(self, method.__name__, iterator)
+
+    return wrapper
+
+
+async def _profile_iteration(client, method: str, iterator: AsyncIterator):
+    if _call_depth.get() > 0:
+        # The outer call profiles the iteration.
+        async with contextlib.aclosing(iterator):
+            async for item in iterator:
+                yield item
+        return
+
+    call = client.profiler.start()
+    try:
+        async with contextlib.aclosing(iterator):
+            while True:
+                # Tasks created while fetching the next item inherit these.
+                hedge_token = _hedge.set(client.hedge_requests)
+                depth_token = _call_depth.set(1)
+                profile_token = _profile.set(call)
+                try:
+                    item = await iterator.__anext__()
+                except StopAsyncIteration:
+                    return
+                finally:
+                    _profile.reset(profile_token)
+                    _call_depth.reset(depth_token)
+                    _hedge.reset(hedge_token)
+                paused = time.perf_counter()
+                yield item
+                call.started += time.perf_counter() - paused
+    finally:
+        client.profiler.finish(method, call)
+
 
 class Client:
     """
@@ -43,31 +223,179 @@ class Client:
 
     :ivar client_id: Your Client ID.
     :ivar client_secret: Your Client Secret
+    :ivar max_concurrency: Maximum number of requests a single bulk call
+                           (e.g. get_tracks) keeps in flight. Default is 10.
+    :ivar token_refresh_margin: Seconds before the access token expires at which it is
+                                renewed in the background. Capped at half the token lifetime.
+                                None disables background renewal. Default is 60.
+    :ivar cache: Optional :py:class:`~spoti2py.cache.ResponseCache` consulted before every request.
+                 Default is None (no caching).
+    :ivar coalesce_requests: Share one request between concurrent callers asking for the same endpoint.
+                             Default is True.
+    :ivar rate_limiter: Optional :py:class:`~spoti2py.ratelimit.RateLimiter`, e.g. a
+                        :py:class:`~spoti2py.ratelimit.TokenBucket`, awaited before every request.
+    :ivar concurrency: Optional :py:class:`~spoti2py.ratelimit.AdaptiveConcurrency`
+                       limiting the number of requests in flight.
+    :ivar max_throttle_retries: How many times a request answered with HTTP 429 is resent.
+                                All requests are paused for the Retry-After duration first.
+                                Default is 5.
+    :ivar retry_policy: :py:class:`~spoti2py.retry.RetryPolicy` for 5xx responses, connection errors
+                        and timeouts. Default is RetryPolicy() (3 attempts).
+    :ivar default_deadline: Total number of seconds a public call may take, including queueing
+                            and retries, when it isn't given a deadline. Default is None (no limit).
+    :ivar hedge_requests: Hedge every public call that isn't told otherwise. Default is False.
+    :ivar pool: :py:class:`~spoti2py.pool.ConnectionPool` used to create the aiohttp session.
+                Pass one instance to several clients to share connections. Default is ConnectionPool().
+    :ivar session: Optional aiohttp session to use instead of the pool's. It is not closed by the client.
+    :ivar transport: :py:class:`~spoti2py.transport.Transport` sending the requests, e.g. a
+                     :py:class:`~spoti2py.transport.RecordingTransport` or a
+                     :py:class:`~spoti2py.transport.ReplayTransport`. It is closed with the client.
+                     Default is an :py:class:`~spoti2py.transport.AiohttpTransport` using pool or session.
+
+    :ivar json_loads: Callable decoding a response body (bytes) into JSON.
+                      Default is orjson.loads or msgspec.json.decode when installed, json.loads otherwise.
+    :ivar identity_map: Optional :py:class:`~spoti2py.identity.IdentityMap` shared by everything
+                        this client parses. See also identity_scope(). Default is None.
+    :ivar lazy: Return models that build their nested objects (artists, album, images, ...)
+                on first access instead of right away. Default is False.
+    :ivar metrics: Optional :py:class:`~spoti2py.metrics.MetricsCollector`, e.g. a
+                   :py:class:`~spoti2py.metrics.MetricsAggregator`, receiving per-endpoint events.
+                   Wire-level events need its trace_config() on the session, which is done for you
+                   unless you pass your own pool, session or transport. Default is None.
+    :ivar profiler: :py:class:`~spoti2py.profiling.Profiler` timing the network, JSON decoding
+                    and model construction of every public call, or None.
+                    Pass profile=True or a Profiler to enable it. By default it's enabled
+                    by the SPOTI2PY_PROFILE environment variable.
+    :ivar catalog: Optional :py:class:`~spoti2py.catalog.CatalogStore` holding tracks, albums and artists.
+                   It is consulted before the network when they are fetched by ID, and stores
+                   what the network returns. Default is None.
+    :ivar market_sets: Return available_markets as :py:class:`~spoti2py.markets.MarketSet`
+                       instead of a list of country codes. Default is False.
+
+    Every public method also accepts these keyword arguments:
+
+    * deadline - caps the total time of the call in seconds. TimeoutError is raised when it is exceeded.
+    * hedge - if the request hasn't answered within the p95 latency of recent requests,
+      send a second one and use whichever answers first.
+    * lazy - overrides the client's lazy setting for this call.
     """
 
     API_URL = "https://api.spotify.com/"
     CURRENT_API_VERSION = "v1"
 
-    access_token = None
-    access_token_expires = datetime.datetime.now()
-    access_token_expired = True
     client_id = None
     client_secret = None
     token_url = "https://accounts.spotify.com/api/token"
 
-    def __init__(self, client_id: str, client_secret: str, *args, **kwargs) -> None:
+    def __init__(
+        self,
+        client_id: str,
+        client_secret: str,
+        *args,
+        max_concurrency: int = 10,
+        token_refresh_margin: Optional[float] = 60,
+        cache: Optional[ResponseCache] = None,
+        coalesce_requests: bool = True,
+        rate_limiter: Optional[RateLimiter] = None,
+        concurrency: Optional[AdaptiveConcurrency] = None,
+        max_throttle_retries: int = 5,
+        retry_policy: Optional[RetryPolicy] = None,
+        default_deadline: Optional[float] = None,
+        hedge_requests: bool = False,
+        pool: Optional[ConnectionPool] = None,
+        session: Optional[aiohttp.ClientSession] = None,
+        transport: Optional[Transport] = None,
+        lazy: bool = False,
+        json_loads: Optional[Callable[[bytes], Any]] = None,
+        identity_map: Optional[IdentityMap] = None,
+        market_sets: bool = False,
+        catalog: Optional[CatalogStore] = None,
+        metrics: Optional[MetricsCollector] = None,
+        profile: Union[bool, Profiler, None] = None,
+        **kwargs,
+    ) -> None:
         super().__init__(*args, **kwargs)
         if not isinstance(client_id, str) and not isinstance(client_secret, str):
             raise InvalidCredentials(
                 "client_id and client_secret need to be of type 'str'."
             )
+        if token_refresh_margin is not None and token_refresh_margin < 0:
+            raise ValueError("token_refresh_margin can't be negative.")
         self.client_id = client_id
         self.client_secret = client_secret
-        self.loop = asyncio.new_event_loop()
-        self._session = aiohttp.ClientSession(loop=self.loop)
+        self.max_concurrency = max_concurrency
+        self.token_refresh_margin = token_refresh_margin
+        self.cache = cache
+        self.coalesce_requests = coalesce_requests
+        self._in_flight: Dict[str, _SharedRequest] = {}
+        self.rate_limiter = rate_limiter
+        self.concurrency = concurrency
+        self.max_throttle_retries = max_throttle_retries
+        self._paused_until = 0.0
+        self.retry_policy = retry_policy if retry_policy is not None else RetryPolicy()
+        self.default_deadline = default_deadline
+        self.hedge_requests = hedge_requests
+        self.latency = LatencyTracker()
+        self.access_token = None
+        self.access_token_expires = datetime.datetime.now()
+        self.access_token_expired = True
+        self._token_lifetime = None
+        self._token_lock = asyncio.Lock()
+        self._token_refresh_task = None
+        self.metrics = metrics
+        self.profiler = resolve_profiler(profile)
+        if transport is None:
+            transport = AiohttpTransport(
+                pool=pool,
+                session=session,
+                trace_configs=[metrics.trace_config()] if metrics is not None else None,
+            )
+        self.transport = transport
+        self.pool = getattr(transport, "pool", pool)
+        self.session = session
+        self.lazy = lazy
+        self.identity_map = identity_map
+        self.market_sets = market_sets
+        self.catalog = catalog
+        self.json_loads = json_loads if json_loads is not None else default_json_loads()
+        self._json_dumps = default_json_dumps()
+        self._loop = None
+        # Loop that _in_flight, _token_lock and _token_refresh_task belong to.
+        self._bound_loop = None
+
+    @property
+    def loop(self) -> asyncio.AbstractEventLoop:
+        """
+        Event loop for running the client with client.loop.run_until_complete(...).
+        Created on first access. The client works on any running loop, e.g. with asyncio.run(),
+        and can move to another loop between calls.
+        """
+        if self._loop is None:
+            self._loop = asyncio.new_event_loop()
+        return self._loop
+
+    def _bind_to_running_loop(self) -> None:
+        """Starts over with state of its own when the client is used from a new event loop."""
+        loop = asyncio.get_running_loop()
+        if self._bound_loop is loop:
+            return
+        task = self._token_refresh_task
+        if task is not None and not task.get_loop().is_closed():
+            task.cancel()
+        self._bound_loop = loop
+        self._in_flight = {}
+        self._token_lock = asyncio.Lock()
+        self._token_refresh_task = None
 
     async def close(self) -> None:
-        await self._session.close()
+        for shared in list(self._in_flight.values()):
+            shared.task.cancel()
+        if self._token_refresh_task is not None:
+            self._token_refresh_task.cancel()
+            self._token_refresh_task = None
+        await self.transport.close()
+        if self.profiler is not None and self.profiler.methods:
+            logger.info(f"Profile:\n{self.profiler.report()}")
 
     async def __aenter__(self) -> "Client":
         return self
@@ -98,11 +426,18 @@ class Client:
         token_data = self.get_token_data()
         token_headers = self.get_token_headers()
 
-        async with self._session.post(
-            token_url, data=token_data, headers=token_headers
-        ) as response:
-            response.raise_for_status()
-            data = await response.json()
+        started = time.monotonic()
+        response = await self.transport.request(
+            "POST",
+            token_url,
+            token_headers,
+            data=token_data,
+            trace_request_ctx="token",
+        )
+        response.raise_for_status()
+        data = self.json_loads(response.body)
+        if self.metrics is not None:
+            self.metrics.on_token_refresh(time.monotonic() - started)
 
         now = datetime.datetime.now()
         access_token = data["access_token"]
@@ -111,58 +446,339 @@ class Client:
         self.access_token = access_token
         self.access_token_expires = expires
         self.access_token_expired = expires < now
+        self._token_lifetime = expires_in
 
         return True
 
+    def _token_expires_within(self, seconds: float) -> bool:
+        if self.access_token is None:
+            return True
+        expires_in = self.access_token_expires - datetime.datetime.now()
+        return expires_in.total_seconds() <= seconds
+
+    async def refresh_access_token(self, margin: float = 0) -> str:
+        """
+        Authenticates if the token is missing or expires within margin seconds.
+
+        Only one authenticate request runs at a time. Concurrent callers wait
+        for it and reuse its token instead of sending their own.
+
+        :param margin: Seconds before expiry at which the token counts as stale.
+        :return: Access token.
+        :rtype: str
+        """
+        self._bind_to_running_loop()
+        async with self._token_lock:
+            if self._token_expires_within(margin):
+                await self.authenticate()
+        self._schedule_token_refresh()
+        return self.access_token
+
+    def _schedule_token_refresh(self) -> None:
+        if self.token_refresh_margin is None:
+            return
+        if self._token_refresh_task is None or self._token_refresh_task.done():
+            self._token_refresh_task = asyncio.get_running_loop().create_task(
+                self._refresh_token_periodically()
+            )
+
+    def _token_refresh_margin(self) -> float:
+        # A margin as long as the token lifetime would renew the token right after every renewal.
+        if self._token_lifetime is None:
+            return self.token_refresh_margin
+        return min(self.token_refresh_margin, self._token_lifetime / 2)
+
+    async def _refresh_token_periodically(self) -> None:
+        """
+        Renews the token token_refresh_margin seconds before it expires.
+        Failures are logged and retried with the backoff of retry_policy.
+        """
+        failures = 0
+        while True:
+            margin = self._token_refresh_margin()
+            expires_in = self.access_token_expires - datetime.datetime.now()
+            if failures:
+                delay = self.retry_policy.backoff(failures - 1)
+            else:
+                delay = max(expires_in.total_seconds() - margin, 1)
+            await asyncio.sleep(delay)
+            try:
+                async with self._token_lock:
+                    if self._token_expires_within(self._token_refresh_margin()):
+                        await self.authenticate()
+            except Exception as e:
+                failures += 1
+                logger.warning(f"Background token refresh failed. Reason: {e!r}")
+            else:
+                failures = 0
+
     async def get_access_token(self) -> str:
-        token = self.access_token
-        expires = self.access_token_expires
-        now = datetime.datetime.now()
-        if expires < now:
-            await self.authenticate()
-            return await self.get_access_token()
-        elif token == None:
-            await self.authenticate()
-            return await self.get_access_token()
-        return token
+        if self._token_expires_within(0):
+            return await self.refresh_access_token()
+        return self.access_token
 
     async def get_resource_headers(self) -> dict:
         access_token = await self.get_access_token()
         headers = {"Authorization": f"Bearer {access_token}"}
         return headers
 
-    async def _get(self, endpoint: str):
-        headers = await self.get_resource_headers()
-        async with self._session.get(endpoint, headers=headers) as response:
+    async def _get(self, endpoint: str, raw: bool = False):
+        """
+        Sends a GET request to endpoint and returns the decoded JSON response,
+        or the response body untouched if raw is True.
+
+        With coalesce_requests enabled, a caller asking for an endpoint that is already
+        in flight awaits that request instead of sending an identical one.
+        """
+        payload = await self._get_payload(endpoint)
+        if raw:
+            return payload.body
+        return self._decode(payload)
+
+    def _decode(self, payload: Payload) -> Any:
+        profile = _profile.get()
+        if profile is None:
+            return payload.data
+        started = time.perf_counter()
+        data = payload.data
+        profile.decode += time.perf_counter() - started
+        return data
+
+    async def _get_payload(
+        self,
+        endpoint: str,
+        on_fetched: Optional[Callable[[Payload], None]] = None,
+    ) -> Payload:
+        """
+        Returns the payload of endpoint, sharing one request between concurrent callers.
+        on_fetched is called with the payload once per request, not once per caller.
+        """
+        if not self.coalesce_requests:
+            return await self._fetch(endpoint, on_fetched=on_fetched)
+
+        self._bind_to_running_loop()
+        key = normalize_endpoint(endpoint)
+        shared = self._in_flight.get(key)
+        if shared is None:
+            shared = self._in_flight[key] = _SharedRequest()
+            # The request is shared, so it mustn't run with the profile of whichever call
+            # started it. It stops retrying at the latest deadline of its callers.
+            context = Context()
+            context.run(_hedge.set, _hedge.get())
+            if self.profiler is not None:
+                shared.profile = self.profiler.start()
+                context.run(_profile.set, shared.profile)
+            shared.task = asyncio.get_running_loop().create_task(
+                self._fetch(endpoint, shared, on_fetched), context=context
+            )
+            shared.task.add_done_callback(lambda task: self._request_done(key, shared))
+        shared.join(_deadline.get())
+        profile = _profile.get()
+        started = time.perf_counter()
+        try:
+            # Shielded so one caller being cancelled doesn't cancel the request for the others.
+            return await asyncio.shield(shared.task)
+        finally:
+            shared.waiters -= 1
+            if not shared.waiters and not shared.task.done():
+                # Every caller gave up, so nobody needs the response any more.
+                shared.task.cancel()
+                self._forget_request(key, shared)
+            if profile is not None and shared.profile is not None:
+                # Only the time the shared request spent on the network, not its
+                # rate limit and retry waits, which count as other.
+                waited = time.perf_counter() - started
+                profile.network += min(waited, shared.profile.network)
+
+    def _forget_request(self, key: str, shared: _SharedRequest) -> None:
+        if self._in_flight.get(key) is shared:
+            del self._in_flight[key]
+
+    def _request_done(self, key: str, shared: _SharedRequest) -> None:
+        self._forget_request(key, shared)
+        if not shared.task.cancelled():
+            # Mark the exception as retrieved in case every caller was cancelled.
+            shared.task.exception()
+
+    async def _fetch(
+        self,
+        endpoint: str,
+        shared: Optional[_SharedRequest] = None,
+        on_fetched: Optional[Callable[[Payload], None]] = None,
+    ) -> Payload:
+        payload = await self._fetch_payload(endpoint, shared)
+        if on_fetched is not None:
+            on_fetched(payload)
+        return payload
+
+    async def _fetch_payload(
+        self, endpoint: str, shared: Optional[_SharedRequest]
+    ) -> Payload:
+        cache = self.cache
+        entry = None
+        if cache is not None:
+            cache_key = cache.key(endpoint)
+            entry = cache.lookup(cache_key)
+            if entry is not None and entry.fresh:
+                return entry.payload
+
+        policy = self.retry_policy
+        attempt = 0
+        while True:
+            try:
+                status, headers, payload = await self._attempt(endpoint, entry)
+                break
+            except Exception as e:
+                if attempt + 1 >= policy.max_attempts or not policy.is_retryable(e):
+                    raise
+                delay = policy.backoff(attempt)
+                deadline = shared.deadline if shared is not None else _deadline.get()
+                if deadline is not None and time.monotonic() + delay >= deadline:
+                    raise TimeoutError(
+                        f"The deadline passes before {endpoint} can be retried."
+                    ) from e
+                attempt += 1
+                if self.metrics is not None:
+                    self.metrics.on_retry(endpoint_template(endpoint), attempt, e)
+                logger.warning(
+                    f"Retrying {endpoint} in {delay:.2f}s (attempt {attempt + 1} of {policy.max_attempts}). Reason: {e!r}"
+                )
+                await asyncio.sleep(delay)
+
+        if status == 304:
+            cache.revalidate(cache_key, headers)
+            return entry.payload
+        if cache is not None:
+            cache.store(cache_key, payload, headers)
+        return payload
+
+    async def _attempt(self, endpoint: str, entry: Optional[CacheEntry]):
+        """
+        Sends the request. When hedging is on and the request hasn't answered
+        within the p95 latency, sends a second one and uses whichever answers first.
+        """
+        hedge_after = self.latency.quantile(0.95) if _hedge.get() else None
+        if hedge_after is None:
+            return await self._send(endpoint, entry)
+
+        first = asyncio.ensure_future(self._send(endpoint, entry))
+        pending = {first}
+        try:
+            done, _ = await asyncio.wait(pending, timeout=hedge_after)
+            if done:
+                return first.result()
+            second = asyncio.ensure_future(self._send(endpoint, entry))
+            pending = {first, second}
+            while True:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                task = done.pop()
+                if task.exception() is None or not pending:
+                    return task.result()
+        finally:
+            for task in pending:
+                task.cancel()
+
+    async def _send(self, endpoint: str, entry: Optional[CacheEntry]):
+        """
+        Sends a single GET request and returns (status, headers, payload).
+        payload is None for a 304 response.
+        429 responses pause all requests for Retry-After and are resent.
+        """
+        metrics = self.metrics
+        template = endpoint_template(endpoint) if metrics is not None else None
+        throttled = 0
+        while True:
+            queued = time.monotonic()
+            await self._wait_for_rate_limit()
+            headers = await self.get_resource_headers()
+            if entry is not None and entry.etag:
+                headers["If-None-Match"] = entry.etag
+            async with self._concurrency_slot():
+                started = time.monotonic()
+                if metrics is not None:
+                    metrics.on_queued(template, started - queued)
+                profile = _profile.get()
+                sent = time.perf_counter()
+                response = await self.transport.request(
+                    "GET", endpoint, headers, trace_request_ctx=template
+                )
+                if profile is not None:
+                    profile.network += time.perf_counter() - sent
+            if response.status == 429 and throttled < self.max_throttle_retries:
+                throttled += 1
+                self._throttled(endpoint, response.headers)
+                continue
+            if response.status == 304 and entry is not None:
+                self._request_succeeded(time.monotonic() - started)
+                return response.status, response.headers, None
             if response.status not in range(200, 299):
                 try:
-                    json_response = await response.json()
+                    json_response = self.json_loads(response.body)
                     error = json_response.get("error", {})
                     msg = error.get("message")
-                except ValueError:
-                    msg = response.text or None
+                except (ValueError, AttributeError):
+                    msg = response.body.decode(errors="replace") or None
 
                 logger.error(
                     f"HTTP {response.status} Error returned for {endpoint}. Reason: {msg}"
                 )
 
                 raise SpotifyException(response.status, endpoint, msg)
-            data = await response.json()
-        return data
+            self._request_succeeded(time.monotonic() - started)
+            return (
+                response.status,
+                response.headers,
+                Payload(response.body, self.json_loads),
+            )
 
+    async def _wait_for_rate_limit(self) -> None:
+        """Waits out a Retry-After pause, then for the rate limiter."""
+        while (delay := self._paused_until - time.monotonic()) > 0:
+            await asyncio.sleep(delay)
+        if self.rate_limiter is not None:
+            await self.rate_limiter.acquire()
+
+    def _concurrency_slot(self):
+        if self.concurrency is None:
+            return contextlib.nullcontext()
+        return self.concurrency
+
+    def _throttled(self, endpoint: str, headers: Mapping[str, str]) -> None:
+        """Pauses all outgoing requests for the Retry-After duration of a 429 response."""
+        try:
+            retry_after = float(headers.get("Retry-After", 1))
+        except ValueError:
+            retry_after = 1
+        logger.warning(f"HTTP 429 returned for {endpoint}. Pausing for {retry_after}s.")
+        if self.metrics is not None:
+            self.metrics.on_throttle(endpoint_template(endpoint), retry_after)
+        self._paused_until = max(self._paused_until, time.monotonic() + retry_after)
+        if self.concurrency is not None:
+            self.concurrency.on_throttle()
+
+    def _request_succeeded(self, latency: float) -> None:
+        self.latency.record(latency)
+        if self.concurrency is not None:
+            self.concurrency.on_success()
+
+    @api_call
     async def get_resource(
         self,
         lookup_id: str,
         resource_type: str = "tracks",
         version: str = None,
         query_params: Optional[str] = None,
-    ) -> dict:
+        raw: bool = False,
+    ) -> Union[dict, bytes]:
         """
         Sends a GET request to Spotify API
 
         :param lookup_id: Spotify ID for the desired resource.
         :param resource_type: Which resource you're trying to get. Default is: tracks.
         :param version: Spotify API version. Defaults to CURRENT_API_VERSION.
+        :param raw: Return the response body as bytes, without decoding it. Default is False.
         :return: Spotify JSON response
         :rtype: JSON
         :raises: exceptions.SpotifyException
@@ -173,33 +789,258 @@ class Client:
 
         if query_params:
             endpoint = f"{endpoint}/{query_params}"
+        elif self._in_catalog(resource_type) and version == self.CURRENT_API_VERSION:
+            payload = self.catalog.payload(resource_type, lookup_id, self.json_loads)
+            if payload is None:
+                payload = await self._get_payload(
+                    endpoint,
+                    on_fetched=lambda fetched: self.catalog.put(
+                        resource_type, lookup_id, fetched.body
+                    ),
+                )
+            return bytes(payload.body) if raw else self._decode(payload)
 
-        response = await self._get(endpoint=endpoint)
+        response = await self._get(endpoint=endpoint, raw=raw)
         return response
 
+    def _in_catalog(self, resource_type: str) -> bool:
+        return self.catalog is not None and resource_type in self.catalog.kinds
+
+    @api_call
+    async def get_several_resources(
+        self, ids: List[str], resource_type: str = "tracks", raw: bool = False
+    ) -> Union[List[Optional[Dict]], List[bytes]]:
+        """
+        Fetches any number of resources of the same type using Spotify's multi-ID endpoints.
+
+        IDs are split into chunks of MAX_IDS_PER_REQUEST[resource_type],
+        duplicates are requested only once, and chunks are fetched concurrently
+        with at most max_concurrency requests in flight.
+
+        :param ids: Spotify IDs for the desired resources.
+        :param resource_type: Which resource you're trying to get. Default is: tracks.
+        :param raw: Return the body of every chunk's response as bytes, in chunk order,
+                    without decoding them. The catalog isn't consulted. Default is False.
+        :return: JSON objects in the same order as ids. None for IDs Spotify could not find.
+        :rtype: list
+        :raises: exceptions.SpotifyException
+        """
+        if not isinstance(ids, list):
+            raise TypeError("ids should be a list of strings.")
+        unique_ids = list(dict.fromkeys(ids))
+        found = {}
+        catalog = self.catalog if not raw and self._in_catalog(resource_type) else None
+        if catalog is not None:
+            for id in unique_ids:
+                payload = catalog.payload(resource_type, id, self.json_loads)
+                if payload is not None:
+                    found[id] = self._decode(payload)
+            unique_ids = [id for id in unique_ids if id not in found]
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        endpoint = f"{self.API_URL}{self.CURRENT_API_VERSION}/{resource_type}"
+
+        async def get_chunk(chunk: List[str]) -> Union[List[Optional[Dict]], bytes]:
+            async with semaphore:
+                response = await self._get(f"{endpoint}?ids={','.join(chunk)}", raw=raw)
+            return response if raw else response[resource_type.replace("-", "_")]
+
+        chunks = chunked(unique_ids, MAX_IDS_PER_REQUEST[resource_type])
+        responses = await asyncio.gather(*[get_chunk(chunk) for chunk in chunks])
+        if raw:
+            return responses
+        fetched = dict(zip(unique_ids, itertools.chain.from_iterable(responses)))
+        if catalog is not None:
+            catalog.put_many(
+                resource_type,
+                [
+                    (id, self._json_dumps(item))
+                    for id, item in fetched.items()
+                    if item is not None
+                ],
+            )
+        found.update(fetched)
+        return [found.get(id) for id in ids]
+
+    @contextlib.contextmanager
+    def identity_scope(self, identity_map: Optional[IdentityMap] = None):
+        """
+        Deduplicates every model parsed inside the with block through one identity map.
+
+        Nested artists and albums with the same Spotify ID become the same object
+        and identical market lists are shared, which cuts memory for large batch jobs.
+        Tasks started inside the block use the same identity map.
+
+        .. code-block:: python
+
+           with client.identity_scope():
+               tracks = await client.get_tracks(ids)
+
+        :param identity_map: Identity map to use. A new one is created if omitted.
+        :return: The identity map in use.
+        :rtype: :py:class:`~spoti2py.identity.IdentityMap`
+        """
+        if identity_map is None:
+            identity_map = IdentityMap()
+        token = _identity_map.set(identity_map)
+        try:
+            yield identity_map
+        finally:
+            _identity_map.reset(token)
+
+    def _parse(self, item_type: str, json_response: Union[Dict, List[Dict]]):
+        """Maps a JSON response to models, see :py:func:`~spoti2py.utils.parse_json`."""
+        lazy = _lazy.get()
+        identity_map = _identity_map.get()
+        with self._building_models():
+            return parse_json(
+                item_type=item_type,
+                json_response=json_response,
+                models=MODELS,
+                lazy=self.lazy if lazy is None else lazy,
+                identity_map=(
+                    self.identity_map if identity_map is None else identity_map
+                ),
+                market_sets=self.market_sets,
+            )
+
+    def _building_models(self):
+        """Context manager timing model construction for the profiler."""
+        profile = _profile.get()
+        if profile is None:
+            return contextlib.nullcontext()
+        return self.profiler.building_models(profile)
+
+    async def _iter_items(
+        self,
+        endpoint: str,
+        item_type: str,
+        max_buffered_pages: int,
+        paging_key: Optional[str] = None,
+    ) -> AsyncIterator:
+        """
+        Yields parsed items from every page of a paginated endpoint.
+
+        :param paging_key: Key of the paging object in the response, e.g. "tracks" for search.
+                           None if the response is the paging object itself.
+        """
+
+        async def get_page(endpoint: str) -> Dict:
+            response = await self._get(endpoint)
+            return response[paging_key] if paging_key else response
+
+        async with contextlib.aclosing(
+            paginate(get_page, endpoint, max_buffered_pages)
+        ) as pages:
+            async for page in pages:
+                for item in self._parse(
+                    item_type=item_type, json_response=page["items"]
+                ):
+                    yield item
+
+    @iterator_call
+    def iter_several_resources(
+        self,
+        ids: List[str],
+        resource_type: str = "tracks",
+        batch_size: Optional[int] = None,
+        parse: bool = True,
+    ) -> AsyncIterator[Union[Track, Album, Artist, Dict, None]]:
+        """
+        Iterate over any number of resources of the same type, batch by batch.
+        Only one batch is held in memory while the next one is downloaded,
+        so arbitrarily long ID lists can be streamed, e.g. to :py:mod:`spoti2py.export`.
+
+        :param ids: Spotify IDs for the desired resources.
+        :param resource_type: "tracks", "albums", "artists" or "audio-features". Default is "tracks".
+        :param batch_size: Number of IDs fetched (through get_several_resources) at once.
+                           Default is MAX_IDS_PER_REQUEST[resource_type] * max_concurrency.
+        :param parse: Yield models instead of JSON objects. Audio features are always JSON.
+                      Default is True.
+        :return: Async iterator over models or JSON objects, in the same order as ids.
+                 None for IDs Spotify could not find.
+        """
+        if batch_size is None:
+            batch_size = MAX_IDS_PER_REQUEST[resource_type] * self.max_concurrency
+        return self._iter_batches(ids, resource_type, batch_size, parse)
+
+    async def _iter_batches(
+        self, ids: List[str], resource_type: str, batch_size: int, parse: bool
+    ) -> AsyncIterator:
+        parse = parse and resource_type in MODELS
+        pending = task = None
+        try:
+            for batch in itertools.chain(chunked(ids, batch_size), [None]):
+                task = None
+                if batch is not None:
+                    task = asyncio.ensure_future(
+                        self.get_several_resources(list(batch), resource_type)
+                    )
+                if pending is not None:
+                    for response in await pending:
+                        if parse and response is not None:
+                            response = self._parse(resource_type, response)
+                        yield response
+                pending = task
+        finally:
+            for future in (pending, task):
+                if future is not None:
+                    future.cancel()
+
+    async def _get_all_pages(
+        self,
+        endpoint: str,
+        paging_key: Optional[str] = None,
+        max_total: Optional[int] = None,
+    ) -> Dict:
+        """
+        Returns the first paging object of a paginated endpoint with the items of every page, in order.
+        Pages after the first are fetched concurrently, see :py:func:`~spoti2py.pagination.fetch_all_pages`.
+        """
+
+        async def get_page(endpoint: str) -> Dict:
+            response = await self._get(endpoint)
+            return response[paging_key] if paging_key else response
+
+        pages = await fetch_all_pages(
+            get_page,
+            endpoint,
+            max_concurrency=self.max_concurrency,
+            max_total=max_total,
+        )
+        items = [item for page in pages for item in page["items"]]
+        return {**pages[0], "items": items, "next": None}
+
     @staticmethod
     def _get_json_lookup_key(query_params: str):
         """Returns the key that will be used to parse json"""
         return f"{parse_qsl(query_params)[1][1]}s"
 
-    async def base_search(self, query_params) -> Dict:
+    async def base_search(self, query_params, fetch_all: bool = False) -> Dict:
         endpoint = f"{self.API_URL}{self.CURRENT_API_VERSION}/search"
         lookup_url = f"{endpoint}?{query_params}"
 
-        response = await self._get(endpoint=lookup_url)
-
         search_type = self._get_json_lookup_key(query_params)
-        search_result = Search(**response[search_type])
-        search_result.items = parse_json(
-            item_type=search_type, json_response=search_result.items, models=MODELS
+        if fetch_all:
+            page = await self._get_all_pages(
+                lookup_url, paging_key=search_type, max_total=MAX_SEARCH_RESULTS
+            )
+        else:
+            response = await self._get(endpoint=lookup_url)
+            page = response[search_type]
+
+        search_result = Search(**page)
+        search_result.items = self._parse(
+            item_type=search_type, json_response=search_result.items
         )
         return search_result
 
+    @api_call
     async def search(
         self,
         query: str,
         search_type: Union[str, list] = None,
         limit: int = 1,
+        fetch_all: bool = False,
     ) -> Search:
         """
         Get Spotify catalog information about albums, artists and tracks
@@ -208,6 +1049,9 @@ class Client:
         :param query: required - Your search query.
         :param search_type: Optional item type to search accross. Defaults to "track".
         :param limit: Maximum number of results to return. >= 0 <= 50. Default is 1.
+                      With fetch_all, the page size used to fetch all results.
+        :param fetch_all: Return all results (up to 1000), not just the first page.
+                          Pages after the first one are fetched concurrently. Default is False.
         :raise exceptions.NoSearchQuery: If no query is provided.
         :return: :py:class:`~spoti2py.models.search.Search`
         :rtype: object
@@ -222,10 +1066,43 @@ class Client:
         if isinstance(search_type, str):
             search_type = search_type.lower()
         query_params = urlencode({"q": query, "type": search_type, "limit": limit})
-        search_results = await self.base_search(query_params)
+        search_results = await self.base_search(query_params, fetch_all=fetch_all)
 
         return search_results
 
+    @iterator_call
+    def iter_search(
+        self,
+        query: str,
+        search_type: str = "track",
+        limit: int = 50,
+        max_buffered_pages: int = 1,
+    ) -> AsyncIterator[Union[Track, Album, Artist]]:
+        """
+        Iterate over every search result, page by page.
+        The next page is downloaded while the current one is being consumed.
+
+        :param query: required - Your search query.
+        :param search_type: Item type to search accross: "track", "album" or "artist". Default is "track".
+        :param limit: Page size. >= 1 <= 50. Default is 50.
+        :param max_buffered_pages: Maximum number of pages downloaded ahead. Default is 1.
+        :raise exceptions.NoSearchQuery: If no query is provided.
+        :return: Async iterator over :py:class:`~spoti2py.models.track.Track`,
+                 :py:class:`~spoti2py.models.album.Album` or :py:class:`~spoti2py.models.artist.Artist`
+        """
+        if query == None:
+            raise NoSearchQuery("A query is required")
+        search_type = search_type.lower()
+        query_params = urlencode({"q": query, "type": search_type, "limit": limit})
+        endpoint = f"{self.API_URL}{self.CURRENT_API_VERSION}/search?{query_params}"
+        return self._iter_items(
+            endpoint,
+            item_type=f"{search_type}s",
+            max_buffered_pages=max_buffered_pages,
+            paging_key=f"{search_type}s",
+        )
+
+    @api_call
     async def get_album(self, id: str) -> Album:
         """
         Get Spotify catalog information for a single album.
@@ -234,16 +1111,39 @@ class Client:
         :return: :py:class:`~spoti2py.models.album.Album`
         :rtype: object
         """
-        album = parse_json(
+        album = self._parse(
             item_type="albums",
             json_response=await self.get_resource(id, resource_type="albums"),
-            models=MODELS,
         )
-        album.tracks = [Track(**song) for song in album.tracks["items"]]
+        with self._building_models():
+            album.tracks = [Track(**song) for song in album.tracks["items"]]
         return album
 
+    @api_call
+    async def get_albums(self, ids: List[str]) -> List[Optional[Album]]:
+        """
+        Get Spotify catalog information for multiple albums.
+        IDs are fetched 20 at a time, concurrently.
+
+        :param ids: A list of the Spotify IDs of the albums. Required.
+        :return: list[:py:class:`~spoti2py.models.album.Album`] in the same order as ids.
+                 None for albums that could not be found.
+        :rtype: list
+        """
+        albums = []
+        for response in await self.get_several_resources(ids, resource_type="albums"):
+            if response is None:
+                albums.append(None)
+                continue
+            album = self._parse(item_type="albums", json_response=response)
+            with self._building_models():
+                album.tracks = [Track(**song) for song in album.tracks["items"]]
+            albums.append(album)
+        return albums
+
+    @api_call
     async def get_album_tracks(
-        self, id: str, market: str = None, limit: int = 20
+        self, id: str, market: str = None, limit: int = 20, fetch_all: bool = False
     ) -> List[Track]:
         """
         Get Spotify catalog information about an album's tracks.
@@ -256,22 +1156,55 @@ class Client:
                        the country associated with the user account will take priority over this parameter.
                        Default: us.
         :param limit: The maximum number of items to return. Default: 20. Min: 1. Max: 50.
+                      With fetch_all, the page size used to fetch all tracks.
+        :param fetch_all: Return all of the album's tracks, not just the first page.
+                          Pages after the first one are fetched concurrently. Default is False.
         :return: list[:py:class:`~spoti2py.models.track.Track`]
         :rtype: list
         """
-        query_params = {"id": id, "limit": limit}
-        if not market:
-            query_params["market"] = "us"
-        query_params["market"] = market
+        query_params = {"limit": limit}
+        if market:
+            query_params["market"] = market
 
-        endpoint = f"tracks"
-        album_tracks = await self.get_resource(
-            lookup_id=id, resource_type="albums", query_params=endpoint
-        )
-        return parse_json(
-            item_type="tracks", json_response=album_tracks["items"], models=MODELS
+        endpoint = f"tracks?{urlencode(query_params)}"
+        if fetch_all:
+            album_tracks = await self._get_all_pages(
+                f"{self.API_URL}{self.CURRENT_API_VERSION}/albums/{id}/{endpoint}"
+            )
+        else:
+            album_tracks = await self.get_resource(
+                lookup_id=id, resource_type="albums", query_params=endpoint
+            )
+        return self._parse(item_type="tracks", json_response=album_tracks["items"])
+
+    @iterator_call
+    def iter_album_tracks(
+        self,
+        id: str,
+        market: str = None,
+        limit: int = 50,
+        max_buffered_pages: int = 1,
+    ) -> AsyncIterator[Track]:
+        """
+        Iterate over all of an album's tracks, page by page.
+        The next page is downloaded while the current one is being consumed.
+
+        :param id: The Spotify ID of the album. Required.
+        :param market: An ISO 3166-1 alpha-2 country code.
+                       If a country code is specified, only content that is available in that market will be returned.
+        :param limit: Page size. Default: 50. Min: 1. Max: 50.
+        :param max_buffered_pages: Maximum number of pages downloaded ahead. Default is 1.
+        :return: Async iterator over :py:class:`~spoti2py.models.track.Track`
+        """
+        query_params = {"limit": limit}
+        if market:
+            query_params["market"] = market
+        endpoint = f"{self.API_URL}{self.CURRENT_API_VERSION}/albums/{id}/tracks?{urlencode(query_params)}"
+        return self._iter_items(
+            endpoint, item_type="tracks", max_buffered_pages=max_buffered_pages
         )
 
+    @api_call
     async def get_new_releases(self, country: str = None, limit: int = 20):
         """
         Get a list of new album releases featured in Spotify
@@ -291,8 +1224,9 @@ class Client:
         response = await self._get(endpoint=endpoint)
 
         new_releases = response["albums"]["items"]
-        return parse_json(item_type="albums", json_response=new_releases, models=MODELS)
+        return self._parse(item_type="albums", json_response=new_releases)
 
+    @api_call
     async def get_artist(self, id: str) -> Artist:
         """
         Get Spotify catalog information for a single artist identified by their unique Spotify ID.
@@ -302,12 +1236,38 @@ class Client:
         :rtype: object
         """
         response = await self.get_resource(id, resource_type="artists")
-        artist = parse_json(item_type="artists", json_response=response, models=MODELS)
+        artist = self._parse(item_type="artists", json_response=response)
 
         return artist
 
+    @api_call
+    async def get_artists(self, ids: List[str]) -> List[Optional[Artist]]:
+        """
+        Get Spotify catalog information for multiple artists.
+        IDs are fetched 50 at a time, concurrently.
+
+        :param ids: A list of the Spotify IDs of the artists. Required.
+        :return: list[:py:class:`~spoti2py.models.artist.Artist`] in the same order as ids.
+                 None for artists that could not be found.
+        :rtype: list
+        """
+        responses = await self.get_several_resources(ids, resource_type="artists")
+        return [
+            (
+                None
+                if response is None
+                else self._parse(item_type="artists", json_response=response)
+            )
+            for response in responses
+        ]
+
+    @api_call
     async def get_artists_albums(
-        self, id: str, include_groups: Optional[List[str]] = None, limit: int = 20
+        self,
+        id: str,
+        include_groups: Optional[List[str]] = None,
+        limit: int = 20,
+        fetch_all: bool = False,
     ) -> List[Album]:
         """
         Get Spotify catalog information about an artist's albums.
@@ -317,6 +1277,9 @@ class Client:
                                If not supplied, all album types will be returned.
                                Valid values: album, single, appears_on, compilation.
         :param limit: The maximum number of items to return. Default: 20. Min: 1. Max. 50.
+                      With fetch_all, the page size used to fetch all albums.
+        :param fetch_all: Return all of the artist's albums, not just the first page.
+                          Pages after the first one are fetched concurrently. Default is False.
         :return: List[:py:class:`~spoti2py.models.album.Album`]
         :rtype: List[object]
         """
@@ -327,15 +1290,51 @@ class Client:
             query_params["include_groups"] = ",".join(include_groups)
         endpoint = f"albums?{urlencode(query_params)}"
 
-        response = await self.get_resource(
-            lookup_id=id, resource_type="artists", query_params=endpoint
-        )
-        artists_albums = parse_json(
-            item_type="albums", json_response=response["items"], models=MODELS
+        if fetch_all:
+            response = await self._get_all_pages(
+                f"{self.API_URL}{self.CURRENT_API_VERSION}/artists/{id}/{endpoint}"
+            )
+        else:
+            response = await self.get_resource(
+                lookup_id=id, resource_type="artists", query_params=endpoint
+            )
+        artists_albums = self._parse(
+            item_type="albums", json_response=response["items"]
         )
 
         return artists_albums
 
+    @iterator_call
+    def iter_artists_albums(
+        self,
+        id: str,
+        include_groups: Optional[List[str]] = None,
+        limit: int = 50,
+        max_buffered_pages: int = 1,
+    ) -> AsyncIterator[Album]:
+        """
+        Iterate over all of an artist's albums, page by page.
+        The next page is downloaded while the current one is being consumed.
+
+        :param id: The Spotify ID of the artist.
+        :param include_groups: A list of keywords that will be used to filter the response.
+                               If not supplied, all album types will be returned.
+                               Valid values: album, single, appears_on, compilation.
+        :param limit: Page size. Default: 50. Min: 1. Max. 50.
+        :param max_buffered_pages: Maximum number of pages downloaded ahead. Default is 1.
+        :return: Async iterator over :py:class:`~spoti2py.models.album.Album`
+        """
+        query_params = {"limit": limit}
+        if include_groups:
+            if not isinstance(include_groups, list):
+                raise TypeError("include_groups should be a list of strings.")
+            query_params["include_groups"] = ",".join(include_groups)
+        endpoint = f"{self.API_URL}{self.CURRENT_API_VERSION}/artists/{id}/albums?{urlencode(query_params)}"
+        return self._iter_items(
+            endpoint, item_type="albums", max_buffered_pages=max_buffered_pages
+        )
+
+    @api_call
     async def get_artists_top_tracks(self, id: str, market: str = None) -> List[Track]:
         """
         Get Spotify catalog information about an artist's top tracks by country.
@@ -355,12 +1354,11 @@ class Client:
         response = await self.get_resource(
             lookup_id=id, resource_type="artists", query_params=endpoint
         )
-        top_tracks = parse_json(
-            item_type="tracks", json_response=response["tracks"], models=MODELS
-        )
+        top_tracks = self._parse(item_type="tracks", json_response=response["tracks"])
 
         return top_tracks
 
+    @api_call
     async def get_related_artists(self, id: str) -> List[Artist]:
         """
         Get Spotify catalog information about artists similar to a given artist.
@@ -373,11 +1371,12 @@ class Client:
         response = await self.get_resource(
             lookup_id=id, resource_type="artists", query_params=endpoint
         )
-        related_artists = parse_json(
-            item_type="artists", json_response=response["artists"], models=MODELS
+        related_artists = self._parse(
+            item_type="artists", json_response=response["artists"]
         )
         return related_artists
 
+    @api_call
     async def get_track(self, id: str) -> Track:
         """
         Get Spotify catalog information for a single track identified by its unique Spotify ID.
@@ -387,10 +1386,32 @@ class Client:
         :rtype: object
         """
         response = await self.get_resource(id, resource_type="tracks")
-        track = parse_json(item_type="tracks", json_response=response, models=MODELS)
+        track = self._parse(item_type="tracks", json_response=response)
 
         return track
 
+    @api_call
+    async def get_tracks(self, ids: List[str]) -> List[Optional[Track]]:
+        """
+        Get Spotify catalog information for multiple tracks.
+        IDs are fetched 50 at a time, concurrently.
+
+        :param ids: A list of the Spotify IDs of the tracks. Required.
+        :return: list[:py:class:`~spoti2py.models.track.Track`] in the same order as ids.
+                 None for tracks that could not be found.
+        :rtype: list
+        """
+        responses = await self.get_several_resources(ids, resource_type="tracks")
+        return [
+            (
+                None
+                if response is None
+                else self._parse(item_type="tracks", json_response=response)
+            )
+            for response in responses
+        ]
+
+    @api_call
     async def get_audio_analysis(self, id: str) -> AudioAnalysis:
         """
         Get low-level audio analysis for a track in the Spotify catalog.
@@ -401,9 +1422,44 @@ class Client:
         :rtype: object
         """
         response = await self.get_resource(id, resource_type="audio-analysis")
-        audio_analysis = response["track"]
-        return AudioAnalysis(**audio_analysis)
+        with self._building_models():
+            return AudioAnalysis(
+                **response["track"],
+                bars=response.get("bars"),
+                beats=response.get("beats"),
+                tatums=response.get("tatums"),
+                sections=response.get("sections"),
+                segments=response.get("segments"),
+            )
 
+    @api_call
+    async def get_audio_features(
+        self, ids: List[str], as_array: bool = False
+    ) -> List[Optional[AudioFeatures]]:
+        """
+        Get audio features for multiple tracks.
+        IDs are fetched 100 at a time, concurrently.
+
+        :param ids: A list of the Spotify IDs of the tracks. Required.
+        :param as_array: Return a NumPy structured array with one row per ID instead of models,
+                         see :py:func:`~spoti2py.analysis.audio_features_array`. Requires NumPy.
+                         Default is False.
+        :return: list[:py:class:`~spoti2py.models.audio_features.AudioFeatures`] in the same order as ids.
+                 None for tracks without audio features.
+        :rtype: list
+        """
+        responses = await self.get_several_resources(
+            ids, resource_type="audio-features"
+        )
+        with self._building_models():
+            if as_array:
+                return audio_features_array(responses, ids)
+            return [
+                None if response is None else AudioFeatures(**response)
+                for response in responses
+            ]
+
+    @api_call
     async def get_recommendations(
         self,
         limit: int = 20,
@@ -451,8 +1507,8 @@ class Client:
         response = await self._get(endpoint)
 
         recommendations = Recommendations(**response)
-        recommendations.tracks = parse_json(
-            item_type="tracks", json_response=recommendations.tracks, models=MODELS
+        recommendations.tracks = self._parse(
+            item_type="tracks", json_response=recommendations.tracks
         )
         return recommendations
 
@@ -0,0 +1,255 @@
+import array
+import asyncio
+import json
+import logging
+import os
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from .client import Client
+from .exceptions import SpotifyException
+from .utils import import_numpy
+
+logger = logging.getLogger(__name__)
+
+
+class ArtistCrawler:
+    """
+    Breadth-first crawler of the related-artists graph.
+
+    Starting from seed artists, every artist is fetched once, at most max_concurrency at a time,
+    and its related artists are added to the graph. Artists are numbered in the order they are
+    discovered and the graph is kept as two integer arrays (edge sources and targets),
+    not as Python objects, so it stays compact at millions of edges.
+
+    With a checkpoint path, progress is saved every checkpoint_every expanded artists
+    and when the crawl ends. Discovered artists and edges are appended to
+    checkpoint + ".nodes" and checkpoint + ".edges", and the file at checkpoint records
+    how much of them is valid and which artists are still to be expanded.
+    A new crawler with the same checkpoint path resumes where the last one stopped.
+
+    .. code-block:: python
+
+       crawler = ArtistCrawler(client, ["1vCWHaC5f2uS3yhpwWbIA6"], max_depth=3, checkpoint="graph")
+       await crawler.run()
+       indptr, indices = crawler.to_csr()
+
+    :ivar client: :py:class:`~spoti2py.client.Client` used to fetch related artists.
+    :ivar max_depth: Artists further than max_depth steps from a seed are not discovered. Default is 2.
+    :ivar max_nodes: Stop discovering new artists once the graph has this many. Default is None (no limit).
+    :ivar max_concurrency: Maximum number of artists fetched at once. Default is 10.
+    :ivar checkpoint: Path of the checkpoint file or None. Default is None.
+    :ivar checkpoint_every: Number of expanded artists between two checkpoints. Default is 1000.
+    :ivar ids: Spotify ID of every discovered artist, indexed by node number.
+    :ivar depths: Distance from the nearest seed of every discovered artist.
+    :ivar sources: Source node of every edge. array('i').
+    :ivar targets: Target node of every edge. array('i').
+    """
+
+    def __init__(
+        self,
+        client: Client,
+        seeds: Iterable[str],
+        max_depth: int = 2,
+        max_nodes: Optional[int] = None,
+        max_concurrency: int = 10,
+        checkpoint: Optional[str] = None,
+        checkpoint_every: int = 1000,
+    ) -> None:
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency needs to be at least 1.")
+        self.client = client
+        self.max_depth = max_depth
+        self.max_nodes = max_nodes
+        self.max_concurrency = max_concurrency
+        self.checkpoint = checkpoint
+        self.checkpoint_every = checkpoint_every
+        self.ids: List[str] = []
+        self.depths = array.array("b")
+        self.sources = array.array("i")
+        self.targets = array.array("i")
+        self._index: Dict[str, int] = {}
+        # Nodes waiting to be expanded or being expanded, in BFS order.
+        self._pending: Dict[int, None] = {}
+        self._expanded = 0
+        self._saved_nodes = 0
+        self._saved_node_bytes = 0
+        self._saved_edges = 0
+        if checkpoint is not None and os.path.exists(checkpoint):
+            self._load()
+        else:
+            for seed in seeds:
+                self._discover(seed, 0)
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    @property
+    def done(self) -> bool:
+        """True when no artist is left to expand."""
+        return not self._pending
+
+    def _discover(self, id: str, depth: int) -> Optional[int]:
+        """Returns the node number of id, adding it to the graph if it's new and there is room."""
+        node = self._index.get(id)
+        if node is not None:
+            return node
+        if self.max_nodes is not None and len(self.ids) >= self.max_nodes:
+            return None
+        node = self._index[id] = len(self.ids)
+        self.ids.append(id)
+        self.depths.append(depth)
+        if depth < self.max_depth:
+            self._pending[node] = None
+        return node
+
+    async def _related(self, id: str) -> List[str]:
+        try:
+            response = await self.client.get_resource(
+                lookup_id=id, resource_type="artists", query_params="related-artists"
+            )
+        except SpotifyException as e:
+            if e.status_code != 404:
+                raise
+            logger.warning(f"Artist {id} not found, skipping it.")
+            return []
+        return [artist["id"] for artist in response["artists"]]
+
+    async def run(self) -> "ArtistCrawler":
+        """
+        Crawls until no artist is left to expand.
+        On error the crawl stops after saving a checkpoint, so running it again resumes it.
+
+        :return: The crawler itself.
+        """
+        queue: asyncio.Queue = asyncio.Queue()
+        for node in self._pending:
+            queue.put_nowait(node)
+
+        async def work() -> None:
+            while True:
+                node = await queue.get()
+                try:
+                    related = await self._related(self.ids[node])
+                    depth = self.depths[node] + 1
+                    for id in related:
+                        new = id not in self._index
+                        target = self._discover(id, depth)
+                        if target is None:
+                            continue
+                        self.sources.append(node)
+                        self.targets.append(target)
+                        if new and target in self._pending:
+                            queue.put_nowait(target)
+                    del self._pending[node]
+                    self._expanded += 1
+                    if self.checkpoint and self._expanded % self.checkpoint_every == 0:
+                        self.save()
+                finally:
+                    queue.task_done()
+
+        workers = [
+            asyncio.ensure_future(work())
+            for _ in range(min(self.max_concurrency, max(len(self._pending), 1)))
+        ]
+        # Workers run until cancelled, so the first one to finish has failed.
+        joined = asyncio.ensure_future(queue.join())
+        try:
+            done, _ = await asyncio.wait(
+                [joined, *workers], return_when=asyncio.FIRST_COMPLETED
+            )
+            for task in done:
+                task.result()
+        finally:
+            joined.cancel()
+            for worker in workers:
+                worker.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+            if self.checkpoint:
+                self.save()
+        return self
+
+    def save(self) -> None:
+        """Appends new artists and edges to the checkpoint files and records the progress."""
+        with open(self.checkpoint + ".nodes", "a", encoding="utf-8") as nodes:
+            nodes.truncate(self._saved_node_bytes)
+            lines = "".join(
+                f"{self.ids[node]} {self.depths[node]}\n"
+                for node in range(self._saved_nodes, len(self.ids))
+            )
+            nodes.write(lines)
+            nodes.flush()
+            os.fsync(nodes.fileno())
+        with open(self.checkpoint + ".edges", "ab") as edges:
+            edges.truncate(self._saved_edges * 2 * self.sources.itemsize)
+            count = len(self.sources) - self._saved_edges
+            pairs = array.array("i", bytes(2 * count * self.sources.itemsize))
+            pairs[0::2] = self.sources[self._saved_edges :]
+            pairs[1::2] = self.targets[self._saved_edges :]
+            pairs.tofile(edges)
+            edges.flush()
+            os.fsync(edges.fileno())
+        self._saved_nodes = len(self.ids)
+        self._saved_node_bytes += len(lines.encode())
+        self._saved_edges = len(self.sources)
+        state = {
+            "nodes": self._saved_nodes,
+            "node_bytes": self._saved_node_bytes,
+            "edges": self._saved_edges,
+            "expanded": self._expanded,
+            "pending": list(self._pending),
+        }
+        temporary = f"{self.checkpoint}.tmp"
+        with open(temporary, "w", encoding="utf-8") as file:
+            json.dump(state, file)
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(temporary, self.checkpoint)
+
+    def _load(self) -> None:
+        with open(self.checkpoint, encoding="utf-8") as file:
+            state = json.load(file)
+        with open(self.checkpoint + ".nodes", encoding="utf-8") as nodes:
+            for line, _ in zip(nodes, range(state["nodes"])):
+                id, depth = line.split()
+                self._index[id] = len(self.ids)
+                self.ids.append(id)
+                self.depths.append(int(depth))
+        with open(self.checkpoint + ".edges", "rb") as edges:
+            pairs = array.array("i")
+            pairs.fromfile(edges, 2 * state["edges"])
+        self.sources = pairs[0::2]
+        self.targets = pairs[1::2]
+        self._pending = dict.fromkeys(state["pending"])
+        self._expanded = state["expanded"]
+        self._saved_nodes = state["nodes"]
+        self._saved_node_bytes = state["node_bytes"]
+        self._saved_edges = state["edges"]
+
+    def to_edge_list(self):
+        """
+        Returns the edges as an (E, 2) int32 array of (source, target) node numbers.
+        Requires NumPy.
+
+        :rtype: numpy.ndarray
+        """
+        np = import_numpy()
+        edges = np.empty((len(self.sources), 2), dtype=np.int32)
+        edges[:, 0] = np.frombuffer(self.sources, dtype=np.int32)
+        edges[:, 1] = np.frombuffer(self.targets, dtype=np.int32)
+        return edges
+
+    def to_csr(self) -> Tuple:
+        """
+        Returns the graph as CSR adjacency arrays (indptr, indices).
+        The related artists of node i are indices[indptr[i]:indptr[i + 1]], in Spotify's order.
+        Requires NumPy.
+
+        :rtype: tuple
+        """
+        np = import_numpy()
+        sources = np.frombuffer(self.sources, dtype=np.int32)
+        targets = np.frombuffer(self.targets, dtype=np.int32)
+        order = np.argsort(sources, kind="stable")
+        indptr = np.zeros(len(self.ids) + 1, dtype=np.int64)
+        np.cumsum(np.bincount(sources, minlength=len(self.ids)), out=indptr[1:])
+        return indptr, targets[order]
@@ -2,7 +2,14 @@ from .exceptions import (
     InvalidCredentials,
     InvalidItemType,
     NoSearchQuery,
+    NotRecorded,
     SpotifyException,
 )
 
-__all__ = ["InvalidCredentials", "InvalidItemType", "NoSearchQuery", "SpotifyException"]
+__all__ = [
+    "InvalidCredentials",
+    "InvalidItemType",
+    "NoSearchQuery",
+    "NotRecorded",
+    "SpotifyException",
+]
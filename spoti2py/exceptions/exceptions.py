@@ -19,6 +19,12 @@ class InvalidItemType(Exception):
     pass
 
 
+class NotRecorded(Exception):
+    """Raised if a request is replayed that was never recorded"""
+
+    pass
+
+
 class SpotifyException(Exception):
     def __init__(self, status_code: int, endpoint: str, msg: Optional[str] = None):
         self.status_code = status_code
@@ -0,0 +1,304 @@
+import json
+import os
+import types
+from typing import (
+    Any,
+    AsyncIterable,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
+
+from .markets import MarketSet
+from .utils import import_numpy
+
+# Columns written by NPZWriter: (column name, NumPy dtype, attribute path).
+# A path is a dotted list of attribute names, keys and list indexes.
+TRACK_COLUMNS = (
+    ("id", "U22", "id"),
+    ("name", "U128", "name"),
+    ("album_id", "U22", "album.id"),
+    ("artist_id", "U22", "artists.0.id"),
+    ("duration_ms", "i4", "duration_ms"),
+    ("explicit", "?", "explicit"),
+    ("popularity", "i1", "popularity"),
+    ("disc_number", "i2", "disc_number"),
+    ("track_number", "i2", "track_number"),
+)
+ALBUM_COLUMNS = (
+    ("id", "U22", "id"),
+    ("name", "U128", "name"),
+    ("album_type", "U16", "album_type"),
+    ("artist_id", "U22", "artists.0.id"),
+    ("release_date", "U10", "release_date"),
+    ("total_tracks", "i2", "total_tracks"),
+    ("popularity", "i1", "popularity"),
+    ("label", "U128", "label"),
+)
+ARTIST_COLUMNS = (
+    ("id", "U22", "id"),
+    ("name", "U128", "name"),
+    ("followers", "i8", "followers.total"),
+    ("popularity", "i1", "popularity"),
+)
+
+
+def to_json(value: Any) -> Any:
+    """
+    Converts a model, with everything nested in it, to JSON-serializable dicts and lists.
+    Keys are the model's attribute names, which match Spotify's field names.
+    Nested objects a lazy model hasn't built yet are written as they arrived.
+    MarketSets become lists of country codes.
+    """
+    if value is None or isinstance(value, (str, int, float, bool)):
+        return value
+    if isinstance(value, dict):
+        return {key: to_json(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [to_json(item) for item in value]
+    if isinstance(value, MarketSet):
+        return list(value)
+    slots = _slots(type(value))
+    if slots:
+        return {name: to_json(slot.__get__(value)) for name, slot in slots}
+    return {
+        name: to_json(item)
+        for name, item in vars(value).items()
+        if not name.startswith("_")
+    }
+
+
+_slot_cache: Dict[type, List[Tuple[str, types.MemberDescriptorType]]] = {}
+
+
+def _slots(cls: type) -> List[Tuple[str, types.MemberDescriptorType]]:
+    """Public slot descriptors of cls and its bases, read around lazy properties."""
+    if cls not in _slot_cache:
+        slots = {}
+        for base in reversed(cls.__mro__):
+            for name in base.__dict__.get("__slots__", ()):
+                if not name.startswith("_"):
+                    slots[name] = base.__dict__[name]
+        _slot_cache[cls] = list(slots.items())
+    return _slot_cache[cls]
+
+
+def _resolve(item: Any, path: Sequence[str]) -> Any:
+    for part in path:
+        if item is None:
+            return None
+        if isinstance(item, dict):
+            item = item.get(part)
+        elif isinstance(item, (list, tuple)):
+            item = item[int(part)] if int(part) < len(item) else None
+        else:
+            item = getattr(item, part, None)
+    return item
+
+
+class NDJSONWriter:
+    """
+    Streams items to a newline-delimited JSON file, one item per line.
+
+    Lines are buffered and written in chunks of chunk_size items.
+    Every chunk is flushed and fsync'd, so a crash loses at most the items of the current chunk.
+
+    :ivar path: Path of the output file. It is appended to if it exists.
+    :ivar chunk_size: Number of items per chunk. Default is 1000.
+    :ivar dumps: Callable serializing a JSON object to str or bytes. Default is json.dumps.
+    :ivar count: Number of items written so far, including buffered ones.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        chunk_size: int = 1000,
+        dumps: Optional[Callable[[Any], Union[str, bytes]]] = None,
+    ) -> None:
+        self.path = path
+        self.chunk_size = chunk_size
+        self.dumps = dumps if dumps is not None else _dumps
+        self.count = 0
+        self._buffer: List[bytes] = []
+        self._file = open(path, "ab")
+
+    def write(self, item: Any) -> None:
+        """Adds a model or JSON object to the output."""
+        line = self.dumps(to_json(item))
+        self._buffer.append(line.encode() if isinstance(line, str) else line)
+        self.count += 1
+        if len(self._buffer) >= self.chunk_size:
+            self.flush()
+
+    def flush(self) -> None:
+        """Writes and fsyncs the buffered items."""
+        if self._buffer:
+            self._file.write(b"\n".join(self._buffer) + b"\n")
+            self._buffer.clear()
+        self._file.flush()
+        os.fsync(self._file.fileno())
+
+    def close(self) -> None:
+        if not self._file.closed:
+            self.flush()
+            self._file.close()
+
+    def __enter__(self) -> "NDJSONWriter":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+
+def _dumps(value: Any) -> str:
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":"))
+
+
+class NPZWriter:
+    """
+    Streams items to a directory of NumPy .npz shards, one array per column.
+
+    Column values are buffered for chunk_size items, then written as shard-00000.npz,
+    shard-00001.npz and so on. Shards are written to a temporary file, fsync'd
+    and renamed, so every shard on disk is complete.
+    Missing values are NaN for floats, -1 for integers, "" for strings and False for booleans.
+    Strings longer than their column's width are truncated.
+
+    Requires NumPy.
+
+    :ivar directory: Output directory. Created if it doesn't exist.
+    :ivar columns: (name, dtype, path) of every column, e.g. :py:data:`TRACK_COLUMNS`.
+    :ivar chunk_size: Number of items per shard. Default is 100000.
+    :ivar compress: Write compressed shards. Default is False.
+    :ivar count: Number of items written so far, including buffered ones.
+    :ivar shards: Number of shards in directory.
+    """
+
+    def __init__(
+        self,
+        directory: str,
+        columns: Sequence[Tuple[str, str, str]] = TRACK_COLUMNS,
+        chunk_size: int = 100000,
+        compress: bool = False,
+    ) -> None:
+        self._np = import_numpy()
+        self.directory = directory
+        self.columns = [
+            (name, self._np.dtype(dtype), path.split("."))
+            for name, dtype, path in columns
+        ]
+        self.chunk_size = chunk_size
+        self.compress = compress
+        self.count = 0
+        self.shards = 0
+        self._buffer: List[List[Any]] = [[] for _ in self.columns]
+        os.makedirs(directory, exist_ok=True)
+        while os.path.exists(self._shard_path(self.shards)):
+            self.shards += 1
+
+    def _shard_path(self, number: int) -> str:
+        return os.path.join(self.directory, f"shard-{number:05d}.npz")
+
+    def write(self, item: Any) -> None:
+        """Adds a model or JSON object to the output."""
+        for values, (_, _, path) in zip(self._buffer, self.columns):
+            values.append(_resolve(item, path))
+        self.count += 1
+        if len(self._buffer[0]) >= self.chunk_size:
+            self.flush()
+
+    def flush(self) -> None:
+        """Writes the buffered items as a new shard."""
+        if not self._buffer[0]:
+            return
+        np = self._np
+        arrays = {}
+        for values, (name, dtype, _) in zip(self._buffer, self.columns):
+            missing = _missing(dtype)
+            arrays[name] = np.array(
+                [missing if value is None else value for value in values], dtype=dtype
+            )
+            values.clear()
+        path = self._shard_path(self.shards)
+        temporary = f"{path}.tmp"
+        save = np.savez_compressed if self.compress else np.savez
+        with open(temporary, "wb") as file:
+            save(file, **arrays)
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(temporary, path)
+        _fsync_directory(self.directory)
+        self.shards += 1
+
+    def close(self) -> None:
+        self.flush()
+
+    def __enter__(self) -> "NPZWriter":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+
+def _missing(dtype) -> Any:
+    if dtype.kind == "f":
+        return float("nan")
+    if dtype.kind in "iu":
+        return -1
+    if dtype.kind == "b":
+        return False
+    return ""
+
+
+def _fsync_directory(directory: str) -> None:
+    try:
+        descriptor = os.open(directory, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(descriptor)
+    except OSError:
+        pass
+    finally:
+        os.close(descriptor)
+
+
+async def export(items: Union[AsyncIterable[Any], Iterable[Any]], *writers: Any) -> int:
+    """
+    Writes every item of an iterator to one or more writers as the items arrive,
+    then closes the writers. None items (IDs Spotify could not find) are skipped.
+
+    .. code-block:: python
+
+       with NPZWriter("tracks") as shards:
+           await export(client.iter_several_resources(ids), NDJSONWriter("tracks.ndjson"), shards)
+
+    :param items: Async iterator, like client.iter_several_resources() or client.iter_search(),
+                  or a plain iterable.
+    :param writers: :py:class:`NDJSONWriter`, :py:class:`NPZWriter` or any object with write() and close().
+    :return: Number of items written.
+    :rtype: int
+    """
+    count = 0
+    try:
+        if hasattr(items, "__aiter__"):
+            async for item in items:
+                if item is not None:
+                    for writer in writers:
+                        writer.write(item)
+                    count += 1
+        else:
+            for item in items:
+                if item is not None:
+                    for writer in writers:
+                        writer.write(item)
+                    count += 1
+    finally:
+        for writer in writers:
+            writer.close()
+    return count
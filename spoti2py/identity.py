@@ -0,0 +1,72 @@
+from typing import Dict, Hashable, Iterable, Optional, Tuple
+
+from .markets import as_market_set
+
+
+class IdentityMap:
+    """
+    Shares model instances and market lists between everything parsed through it.
+
+    Nested objects with a Spotify ID, like the simplified artists and album of a track,
+    are built once per class and ID and reused afterwards. Identical available_markets
+    lists are replaced with a single shared tuple, so ~180 country codes aren't copied
+    into every track and album.
+
+    Keep one instance for the duration of a batch job to deduplicate across responses,
+    see :py:meth:`~spoti2py.client.Client.identity_scope`.
+    Shared objects are the same instance everywhere, so treat them as read-only.
+
+    :ivar hits: Number of objects reused instead of built.
+    """
+
+    def __init__(self) -> None:
+        self._objects: Dict[Tuple[type, str], object] = {}
+        self._markets: Dict[Hashable, Hashable] = {}
+        self.hits = 0
+
+    def __len__(self) -> int:
+        return len(self._objects)
+
+    def build(self, cls: type, json: Dict, market_sets: bool = False) -> object:
+        """
+        Returns the cls instance for json["id"], initializing it from json the first time.
+        With market_sets, available_markets is stored as a MarketSet.
+        """
+        if not isinstance(json, dict) or json.get("id") is None:
+            obj = cls(**json)
+            return self.intern_attributes(obj, market_sets) if market_sets else obj
+        key = (cls, json["id"])
+        obj = self._objects.get(key)
+        if obj is not None:
+            self.hits += 1
+            return obj
+        markets = json.get("available_markets")
+        if markets is not None:
+            if market_sets:
+                markets = as_market_set(markets)
+            json = {**json, "available_markets": self.intern_markets(markets)}
+        obj = self._objects[key] = cls(**json)
+        return obj
+
+    def intern_markets(self, markets: Optional[Iterable[str]]):
+        """Returns the shared, immutable copy of a market list or MarketSet."""
+        if markets is None:
+            return None
+        markets = tuple(markets) if isinstance(markets, list) else markets
+        return self._markets.setdefault(markets, markets)
+
+    def intern_attributes(self, item: object, market_sets: bool = False) -> object:
+        """
+        Replaces item.available_markets, if it has one, with the shared copy.
+        With market_sets, a list of codes is converted to a MarketSet first.
+        """
+        markets = getattr(item, "available_markets", None)
+        if markets is not None:
+            if market_sets:
+                markets = as_market_set(markets)
+            item.available_markets = self.intern_markets(markets)
+        return item
+
+    def clear(self) -> None:
+        self._objects.clear()
+        self._markets.clear()
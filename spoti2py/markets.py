@@ -0,0 +1,238 @@
+import functools
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+# Every market has a fixed bit: its position in this tuple.
+# Only ever append to it, so MarketSets serialized with to_bytes() stay readable.
+MARKETS: Tuple[str, ...] = (
+    # ISO 3166-1 alpha-2
+    "AD", "AE", "AF", "AG", "AI", "AL", "AM", "AO", "AQ", "AR", "AS", "AT", "AU", "AW",
+    "AX", "AZ", "BA", "BB", "BD", "BE", "BF", "BG", "BH", "BI", "BJ", "BL", "BM", "BN",
+    "BO", "BQ", "BR", "BS", "BT", "BV", "BW", "BY", "BZ", "CA", "CC", "CD", "CF", "CG",
+    "CH", "CI", "CK", "CL", "CM", "CN", "CO", "CR", "CU", "CV", "CW", "CX", "CY", "CZ",
+    "DE", "DJ", "DK", "DM", "DO", "DZ", "EC", "EE", "EG", "EH", "ER", "ES", "ET", "FI",
+    "FJ", "FK", "FM", "FO", "FR", "GA", "GB", "GD", "GE", "GF", "GG", "GH", "GI", "GL",
+    "GM", "GN", "GP", "GQ", "GR", "GS", "GT", "GU", "GW", "GY", "HK", "HM", "HN", "HR",
+    "HT", "HU", "ID", "IE", "IL", "IM", "IN", "IO", "IQ", "IR", "IS", "IT", "JE", "JM",
+    "JO", "JP", "KE", "KG", "KH", "KI", "KM", "KN", "KP", "KR", "KW", "KY", "KZ", "LA",
+    "LB", "LC", "LI", "LK", "LR", "LS", "LT", "LU", "LV", "LY", "MA", "MC", "MD", "ME",
+    "MF", "MG", "MH", "MK", "ML", "MM", "MN", "MO", "MP", "MQ", "MR", "MS", "MT", "MU",
+    "MV", "MW", "MX", "MY", "MZ", "NA", "NC", "NE", "NF", "NG", "NI", "NL", "NO", "NP",
+    "NR", "NU", "NZ", "OM", "PA", "PE", "PF", "PG", "PH", "PK", "PL", "PM", "PN", "PR",
+    "PS", "PT", "PW", "PY", "QA", "RE", "RO", "RS", "RU", "RW", "SA", "SB", "SC", "SD",
+    "SE", "SG", "SH", "SI", "SJ", "SK", "SL", "SM", "SN", "SO", "SR", "SS", "ST", "SV",
+    "SX", "SY", "SZ", "TC", "TD", "TF", "TG", "TH", "TJ", "TK", "TL", "TM", "TN", "TO",
+    "TR", "TT", "TV", "TW", "TZ", "UA", "UG", "UM", "US", "UY", "UZ", "VA", "VC", "VE",
+    "VG", "VI", "VN", "VU", "WF", "WS", "YE", "YT", "ZA", "ZM", "ZW",
+    # User-assigned codes Spotify uses as markets.
+    "XK",
+)  # fmt: skip
+
+MARKET_INDEX: Dict[str, int] = {market: bit for bit, market in enumerate(MARKETS)}
+
+# Length of MarketSet.to_bytes().
+MARKET_BYTES = (len(MARKETS) + 7) // 8
+
+
+class MarketSet:
+    """
+    Immutable set of markets stored as the bits of a single integer.
+
+    Every market in :py:data:`MARKETS` has a fixed bit, so membership is a shift and a mask,
+    and intersection, union and difference are one integer operation each instead of list scans.
+    It supports the usual set operators (&, |, -, ^, <=, >=) and iterates over
+    market codes in :py:data:`MARKETS` order.
+
+    Returned as available_markets by models parsed with market_sets=True.
+
+    :ivar bits: Bit i is set when MARKETS[i] is in the set.
+    """
+
+    __slots__ = ("bits",)
+
+    def __init__(self, bits: int = 0) -> None:
+        self.bits = bits
+
+    @classmethod
+    def from_codes(cls, markets: Iterable[str]) -> "MarketSet":
+        """
+        Builds a MarketSet from ISO 3166-1 alpha-2 country codes.
+
+        :raises ValueError: If a code isn't in :py:data:`MARKETS`.
+        """
+        return _from_codes(tuple(markets))
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "MarketSet":
+        """Inverse of :py:meth:`to_bytes`."""
+        return cls(int.from_bytes(data, "little"))
+
+    def to_bytes(self) -> bytes:
+        """Returns the set as MARKET_BYTES little-endian bytes. Bit i of the result is MARKETS[i]."""
+        return self.bits.to_bytes(MARKET_BYTES, "little")
+
+    def __contains__(self, market: str) -> bool:
+        bit = MARKET_INDEX.get(market)
+        return bit is not None and bool(self.bits >> bit & 1)
+
+    def __iter__(self) -> Iterator[str]:
+        bits = self.bits
+        while bits:
+            low = bits & -bits
+            yield MARKETS[low.bit_length() - 1]
+            bits ^= low
+
+    def __len__(self) -> int:
+        return self.bits.bit_count()
+
+    def __bool__(self) -> bool:
+        return self.bits != 0
+
+    def __and__(self, other: "MarketSet") -> "MarketSet":
+        return MarketSet(self.bits & _bits(other))
+
+    def __or__(self, other: "MarketSet") -> "MarketSet":
+        return MarketSet(self.bits | _bits(other))
+
+    def __sub__(self, other: "MarketSet") -> "MarketSet":
+        return MarketSet(self.bits & ~_bits(other))
+
+    def __xor__(self, other: "MarketSet") -> "MarketSet":
+        return MarketSet(self.bits ^ _bits(other))
+
+    def __le__(self, other: "MarketSet") -> bool:
+        return self.bits & ~_bits(other) == 0
+
+    def __ge__(self, other: "MarketSet") -> bool:
+        return _bits(other) & ~self.bits == 0
+
+    def issubset(self, other: "MarketSet") -> bool:
+        return self <= other
+
+    def issuperset(self, other: "MarketSet") -> bool:
+        return self >= other
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, MarketSet):
+            return self.bits == other.bits
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        return hash(self.bits)
+
+    def __repr__(self) -> str:
+        return f"MarketSet({list(self)!r})"
+
+
+@functools.lru_cache(maxsize=4096)
+def _from_codes(markets: Tuple[str, ...]) -> MarketSet:
+    bits = 0
+    for market in markets:
+        try:
+            bits |= 1 << MARKET_INDEX[market]
+        except KeyError:
+            raise ValueError(f"Unknown market {market!r}.") from None
+    return MarketSet(bits)
+
+
+def _bits(markets) -> int:
+    if isinstance(markets, MarketSet):
+        return markets.bits
+    return MarketSet.from_codes(markets).bits
+
+
+def _known_bits(markets: Iterable[str]) -> int:
+    """Like _bits, but skips codes missing from MARKETS instead of raising."""
+    if isinstance(markets, MarketSet):
+        return markets.bits
+    bits = 0
+    for market in markets:
+        bit = MARKET_INDEX.get(market)
+        if bit is not None:
+            bits |= 1 << bit
+    return bits
+
+
+def as_market_set(markets: Optional[Iterable[str]]):
+    """
+    Converts a list of market codes to a :py:class:`MarketSet`.
+    None, MarketSets and lists with a code missing from :py:data:`MARKETS` are returned unchanged.
+    """
+    if markets is None or isinstance(markets, MarketSet):
+        return markets
+    try:
+        return MarketSet.from_codes(markets)
+    except ValueError:
+        return markets
+
+
+def filter_by_market(items: Iterable[object], *markets: str) -> List[object]:
+    """
+    Returns the items (tracks or albums) available in every one of markets.
+
+    Works with available_markets parsed as MarketSet, where each check is one integer
+    operation, and as plain lists.
+
+    :param items: Objects with an available_markets attribute.
+    :param markets: ISO 3166-1 alpha-2 country codes.
+    :rtype: list
+    """
+    wanted = MarketSet.from_codes(markets)
+    result = []
+    for item in items:
+        available = item.available_markets
+        if available is None:
+            continue
+        if isinstance(available, MarketSet):
+            if wanted <= available:
+                result.append(item)
+        elif all(market in available for market in markets):
+            result.append(item)
+    return result
+
+
+def market_matrix(items: Sequence[object]):
+    """
+    Packs the available markets of many items into a (len(items), MARKET_BYTES) uint8 array.
+    Row i holds items[i].available_markets as returned by :py:meth:`MarketSet.to_bytes`.
+    Items without available_markets get an empty row. Codes missing from :py:data:`MARKETS`,
+    which :py:func:`as_market_set` leaves in plain lists, have no bit and are skipped.
+
+    Requires NumPy.
+
+    :param items: Objects with an available_markets attribute, or MarketSets.
+    :rtype: numpy.ndarray
+    """
+    from .utils import import_numpy
+
+    np = import_numpy()
+    rows = []
+    for item in items:
+        markets = item if isinstance(item, MarketSet) else item.available_markets
+        bits = _known_bits(markets) if markets is not None else 0
+        rows.append(MarketSet(bits).to_bytes())
+    return np.frombuffer(b"".join(rows), dtype=np.uint8).reshape(
+        len(rows), MARKET_BYTES
+    )
+
+
+def market_mask(items, *markets: str):
+    """
+    Vectorized :py:func:`filter_by_market`.
+    Returns a boolean array that is True where the item is available in every one of markets.
+
+    Pass the result of :py:func:`market_matrix` instead of the items
+    to filter the same collection by several markets without packing it again.
+
+    Requires NumPy.
+
+    :param items: Objects with an available_markets attribute, MarketSets,
+                  or a matrix returned by market_matrix().
+    :param markets: ISO 3166-1 alpha-2 country codes.
+    :rtype: numpy.ndarray
+    """
+    from .utils import import_numpy
+
+    np = import_numpy()
+    matrix = items if isinstance(items, np.ndarray) else market_matrix(items)
+    wanted = np.frombuffer(MarketSet.from_codes(markets).to_bytes(), dtype=np.uint8)
+    return ((matrix & wanted) == wanted).all(axis=1)
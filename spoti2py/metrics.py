@@ -0,0 +1,275 @@
+import bisect
+import time
+from collections import Counter
+from types import SimpleNamespace
+from typing import Dict, Optional
+from urllib.parse import urlsplit
+
+import aiohttp
+
+# Resources whose second path segment isn't an ID, e.g. /v1/browse/new-releases.
+_STATIC_RESOURCES = frozenset({"browse", "recommendations", "search", "me"})
+
+# Upper bounds, in seconds, of the latency histogram buckets. The last bucket is unbounded.
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+
+
+def endpoint_template(url: str) -> str:
+    """
+    Returns the endpoint template of a Spotify API URL, with IDs replaced by {id}.
+    E.g. 'artists/{id}/top-tracks' for https://api.spotify.com/v1/artists/0TnOYISbd1XYRBk9myaseg/top-tracks?market=US.
+    """
+    segments = [segment for segment in urlsplit(url).path.split("/") if segment][1:]
+    if len(segments) > 1 and segments[0] not in _STATIC_RESOURCES:
+        segments[1] = "{id}"
+    return "/".join(segments)
+
+
+class MetricsCollector:
+    """
+    Receives instrumentation events from a :py:class:`~spoti2py.client.Client`.
+
+    Every method is a no-op. Subclass it and override the events you need,
+    e.g. to forward them to StatsD or Prometheus. Events are called on the event loop,
+    synchronously, so keep them cheap and don't block.
+    :py:class:`MetricsAggregator` is a ready-made collector keeping counters in memory.
+
+    template is the endpoint template of the request, see :py:func:`endpoint_template`,
+    or "token" for the token request.
+    """
+
+    def on_request_start(self, template: str) -> None:
+        """A request was handed to aiohttp."""
+
+    def on_request_end(self, template: str, status: int, seconds: float) -> None:
+        """Response headers arrived, seconds after the request was handed to aiohttp."""
+
+    def on_request_error(
+        self, template: str, exception: BaseException, seconds: float
+    ) -> None:
+        """The request failed without a response."""
+
+    def on_bytes_received(self, template: str, size: int) -> None:
+        """A chunk of a response body was read."""
+
+    def on_queued(self, template: str, seconds: float) -> None:
+        """
+        The request waited seconds before being sent: for a Retry-After pause,
+        the rate limiter, the concurrency limit and a free connection.
+        """
+
+    def on_retry(self, template: str, attempt: int, reason: BaseException) -> None:
+        """A failed request is retried. attempt counts from 1."""
+
+    def on_throttle(self, template: str, retry_after: float) -> None:
+        """Spotify answered 429 Too Many Requests."""
+
+    def on_token_refresh(self, seconds: float) -> None:
+        """A new access token was obtained in seconds."""
+
+    def trace_config(self) -> aiohttp.TraceConfig:
+        """
+        Returns an aiohttp TraceConfig reporting wire-level events to this collector.
+        The client adds it to the sessions of the connection pool it creates.
+        Add it yourself to the trace_configs of a pool or session you pass to the client.
+        """
+        trace_config = aiohttp.TraceConfig(trace_config_ctx_factory=_TraceContext)
+        trace_config.on_request_start.append(self._trace_request_start)
+        trace_config.on_request_end.append(self._trace_request_end)
+        trace_config.on_request_exception.append(self._trace_request_exception)
+        trace_config.on_response_chunk_received.append(self._trace_chunk)
+        trace_config.on_connection_queued_start.append(self._trace_queued_start)
+        trace_config.on_connection_queued_end.append(self._trace_queued_end)
+        return trace_config
+
+    async def _trace_request_start(self, session, context, params) -> None:
+        if context.template is None:
+            context.template = endpoint_template(str(params.url))
+        context.started = time.monotonic()
+        self.on_request_start(context.template)
+
+    async def _trace_request_end(self, session, context, params) -> None:
+        self.on_request_end(
+            context.template,
+            params.response.status,
+            time.monotonic() - context.started,
+        )
+
+    async def _trace_request_exception(self, session, context, params) -> None:
+        self.on_request_error(
+            context.template, params.exception, time.monotonic() - context.started
+        )
+
+    async def _trace_chunk(self, session, context, params) -> None:
+        self.on_bytes_received(context.template, len(params.chunk))
+
+    async def _trace_queued_start(self, session, context, params) -> None:
+        context.queued = time.monotonic()
+
+    async def _trace_queued_end(self, session, context, params) -> None:
+        self.on_queued(context.template, time.monotonic() - context.queued)
+
+
+class _TraceContext(SimpleNamespace):
+    def __init__(self, trace_request_ctx: Optional[str] = None) -> None:
+        super().__init__(template=trace_request_ctx, started=0.0, queued=0.0)
+
+
+class EndpointStats:
+    """
+    Counters of one endpoint template.
+
+    :ivar requests: Requests sent.
+    :ivar errors: Requests that failed without a response.
+    :ivar statuses: Number of responses per HTTP status.
+    :ivar latency_buckets: Number of responses per :py:data:`LATENCY_BUCKETS` bucket, plus one unbounded bucket.
+    :ivar latency_sum: Total seconds on the wire, from sending a request to its response headers.
+    :ivar bytes_received: Response body bytes read.
+    :ivar queued: Total seconds requests waited before being sent.
+    :ivar retries: Retried requests.
+    :ivar throttled: 429 responses.
+    """
+
+    __slots__ = (
+        "requests",
+        "errors",
+        "statuses",
+        "latency_buckets",
+        "latency_sum",
+        "bytes_received",
+        "queued",
+        "retries",
+        "throttled",
+    )
+
+    def __init__(self) -> None:
+        self.requests = 0
+        self.errors = 0
+        self.statuses: Counter = Counter()
+        self.latency_buckets = [0] * (len(LATENCY_BUCKETS) + 1)
+        self.latency_sum = 0.0
+        self.bytes_received = 0
+        self.queued = 0.0
+        self.retries = 0
+        self.throttled = 0
+
+    def latency_quantile(self, q: float) -> Optional[float]:
+        """Upper bound of the bucket holding the q-quantile latency. None without responses."""
+        count = sum(self.latency_buckets)
+        if not count:
+            return None
+        rank = q * count
+        seen = 0
+        for bound, bucket in zip(
+            LATENCY_BUCKETS + (float("inf"),), self.latency_buckets
+        ):
+            seen += bucket
+            if seen >= rank:
+                return bound
+        return float("inf")
+
+    def as_dict(self) -> Dict:
+        responses = sum(self.latency_buckets)
+        return {
+            "requests": self.requests,
+            "errors": self.errors,
+            "statuses": dict(self.statuses),
+            "latency": {
+                "buckets": dict(
+                    zip(
+                        [str(bound) for bound in LATENCY_BUCKETS] + ["inf"],
+                        self.latency_buckets,
+                    )
+                ),
+                "mean": self.latency_sum / responses if responses else None,
+                "p50": self.latency_quantile(0.5),
+                "p99": self.latency_quantile(0.99),
+            },
+            "bytes_received": self.bytes_received,
+            "queued_seconds": self.queued,
+            "wire_seconds": self.latency_sum,
+            "retries": self.retries,
+            "throttled": self.throttled,
+        }
+
+
+class MetricsAggregator(MetricsCollector):
+    """
+    Keeps per-endpoint-template counters in memory.
+
+    .. code-block:: python
+
+       metrics = MetricsAggregator()
+       client = Client(client_id, client_secret, metrics=metrics)
+       ...
+       print(metrics.snapshot()["endpoints"]["artists/{id}/top-tracks"])
+
+    :ivar endpoints: :py:class:`EndpointStats` per endpoint template.
+    :ivar token_refreshes: Number of access tokens obtained.
+    :ivar token_refresh_seconds: Total seconds spent obtaining them.
+    """
+
+    def __init__(self) -> None:
+        self.reset()
+
+    def reset(self) -> None:
+        """Sets every counter back to zero."""
+        self.endpoints: Dict[str, EndpointStats] = {}
+        self.token_refreshes = 0
+        self.token_refresh_seconds = 0.0
+        self._started = time.monotonic()
+
+    def _stats(self, template: str) -> EndpointStats:
+        stats = self.endpoints.get(template)
+        if stats is None:
+            stats = self.endpoints[template] = EndpointStats()
+        return stats
+
+    def on_request_start(self, template: str) -> None:
+        self._stats(template).requests += 1
+
+    def on_request_end(self, template: str, status: int, seconds: float) -> None:
+        stats = self._stats(template)
+        stats.statuses[status] += 1
+        stats.latency_buckets[bisect.bisect_left(LATENCY_BUCKETS, seconds)] += 1
+        stats.latency_sum += seconds
+
+    def on_request_error(
+        self, template: str, exception: BaseException, seconds: float
+    ) -> None:
+        self._stats(template).errors += 1
+
+    def on_bytes_received(self, template: str, size: int) -> None:
+        self._stats(template).bytes_received += size
+
+    def on_queued(self, template: str, seconds: float) -> None:
+        self._stats(template).queued += seconds
+
+    def on_retry(self, template: str, attempt: int, reason: BaseException) -> None:
+        self._stats(template).retries += 1
+
+    def on_throttle(self, template: str, retry_after: float) -> None:
+        self._stats(template).throttled += 1
+
+    def on_token_refresh(self, seconds: float) -> None:
+        self.token_refreshes += 1
+        self.token_refresh_seconds += seconds
+
+    def snapshot(self, reset: bool = False) -> Dict:
+        """
+        Returns the counters as plain dicts, ready for json.dumps.
+
+        :param reset: Set the counters back to zero afterwards. Default is False.
+        :rtype: dict
+        """
+        snapshot = {
+            "seconds": time.monotonic() - self._started,
+            "endpoints": {
+                template: stats.as_dict() for template, stats in self.endpoints.items()
+            },
+            "token_refreshes": self.token_refreshes,
+            "token_refresh_seconds": self.token_refresh_seconds,
+        }
+        if reset:
+            self.reset()
+        return snapshot
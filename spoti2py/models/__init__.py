@@ -1,6 +1,7 @@
 from .album import Album, Copyright
 from .artist import Artist, Followers
-from .audio_analysis import AudioAnalysis
+from .audio_features import AudioFeatures
+from .audio_analysis import AudioAnalysis, Sections, Segments, TimeIntervals
 from .image import Image
 from .recommendations import Recommendations
 from .search import Search
@@ -12,6 +13,10 @@ __all__ = [
     "Artist",
     "Followers",
     "AudioAnalysis",
+    "AudioFeatures",
+    "TimeIntervals",
+    "Sections",
+    "Segments",
     "Image",
     "Recommendations",
     "Search",
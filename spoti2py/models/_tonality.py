@@ -39,6 +39,9 @@ class Tonality:
         (11, "B"),
     )
 
+    # Chord of every (key, mode) pair, filled in below the class.
+    CHORDS = {}
+
     def __init__(
         self, key: int, key_confidence: float, mode: int, mode_confidence: float
     ) -> None:
@@ -69,9 +72,11 @@ class Tonality:
         Returns the tonic of the song
         E.G. Am
         """
-        for option in self.KEYS_MAP:
-            if self.key == option[0]:
-                return self.assign_mode_to_the_key(option[1], self.mode)
+        chord = self.CHORDS.get((self.key, self.mode))
+        if chord is None and self.key in range(len(self.KEYS_MAP)):
+            # Invalid mode, let assign_mode_to_the_key raise.
+            return self.assign_mode_to_the_key(self.KEYS_MAP[self.key][1], self.mode)
+        return chord
 
     @property
     def confidence(self) -> float:
@@ -83,3 +88,10 @@ class Tonality:
 
     def __repr__(self):
         return f"{self.__class__.__name__}({self.chord})"
+
+
+Tonality.CHORDS = {
+    (key, mode): Tonality.assign_mode_to_the_key(name, mode)
+    for key, name in Tonality.KEYS_MAP
+    for mode in (0, 1)
+}
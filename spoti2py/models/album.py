@@ -16,6 +16,7 @@ class Album:
     :ivar artists: The artists of the album (simplified).
                     Each artist object includes a link in href to more detailed information about the artist.
     :ivar available_markets: The markets in which the album is available.
+                             A MarketSet when parsed with market_sets=True.
     :ivar external_urls: Known external URLs for this album.
     :ivar href: A link to the Web API endpoint providing full details of the album.
     :ivar id: Spotify id of the Album.
@@ -35,6 +36,30 @@ class Album:
     :ivar is_playable: True, False or None.
     """
 
+    __slots__ = (
+        "album_group",
+        "album_type",
+        "artists",
+        "available_markets",
+        "external_urls",
+        "href",
+        "id",
+        "images",
+        "name",
+        "release_date",
+        "release_date_precision",
+        "total_tracks",
+        "type",
+        "uri",
+        "external_ids",
+        "copyrights",
+        "genres",
+        "label",
+        "popularity",
+        "tracks",
+        "is_playable",
+    )
+
     def __init__(
         self,
         album_type: str,
@@ -77,9 +102,26 @@ class Album:
         self.copyrights = copyrights
         self.genres = genres
         self.label = label
-        self.populariy = popularity
+        self.popularity = popularity
         self.tracks = tracks
-        self.is_playble = is_playable
+        self.is_playable = is_playable
+
+    # Misspelled names the attributes used to have, kept for compatibility.
+    @property
+    def populariy(self) -> Optional[int]:
+        return self.popularity
+
+    @populariy.setter
+    def populariy(self, value: Optional[int]) -> None:
+        self.popularity = value
+
+    @property
+    def is_playble(self) -> Optional[bool]:
+        return self.is_playable
+
+    @is_playble.setter
+    def is_playble(self, value: Optional[bool]) -> None:
+        self.is_playable = value
 
     def __str__(self):
         return f"{self.name}"
@@ -96,6 +138,8 @@ class Copyright:
     :param type: The type of copyright: C = the copyright, P = performance copyright.
     """
 
+    __slots__ = ("text", "type")
+
     def __init__(self, text: str, type: str) -> None:
         self.text = text
         self.type = type
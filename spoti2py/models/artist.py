@@ -4,6 +4,8 @@ from .image import Image
 
 
 class Followers:
+    __slots__ = ("href", "total")
+
     def __init__(self, href, total) -> None:
         self.href = href
         self.total = total
@@ -31,6 +33,19 @@ class Artist:
     :ivar popularity: The popularity of the artist. Values is between 0 and 100.
     """
 
+    __slots__ = (
+        "external_urls",
+        "href",
+        "id",
+        "name",
+        "type",
+        "uri",
+        "followers",
+        "genres",
+        "images",
+        "popularity",
+    )
+
     def __init__(
         self,
         external_urls: Dict,
@@ -1,6 +1,167 @@
+import functools
+from typing import Dict, List, Optional
+
+from ..utils import import_numpy
 from ._tonality import Tonality
 
 
+def _fill_columns(obj: object, items: List[Dict], fields: tuple) -> None:
+    np = import_numpy()
+    for name, dtype, default in fields:
+        setattr(
+            obj,
+            name,
+            np.fromiter(
+                (item.get(name, default) for item in items),
+                dtype=dtype,
+                count=len(items),
+            ),
+        )
+
+
+class TimeIntervals:
+    """
+    Columnar time intervals of an audio analysis (bars, beats or tatums).
+    Every attribute is a NumPy array with one element per interval.
+
+    :ivar start: The starting point (in seconds) of the time interval. float64.
+    :ivar duration: The duration (in seconds) of the time interval. float64.
+    :ivar confidence: The confidence, from 0.0 to 1.0, of the reliability of the interval. float32.
+    """
+
+    FIELDS = (
+        ("start", "float64", 0.0),
+        ("duration", "float64", 0.0),
+        ("confidence", "float32", 0.0),
+    )
+
+    __slots__ = ("start", "duration", "confidence")
+
+    def __init__(self, items: List[Dict]) -> None:
+        _fill_columns(self, items, self.FIELDS)
+
+    def __len__(self) -> int:
+        return len(self.start)
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({len(self)})"
+
+
+class Sections(TimeIntervals):
+    """
+    Columnar sections of an audio analysis, parts of the track with a distinct character.
+    Every attribute is a NumPy array with one element per section.
+
+    :ivar start: The starting point (in seconds) of the section. float64.
+    :ivar duration: The duration (in seconds) of the section. float64.
+    :ivar confidence: The confidence, from 0.0 to 1.0, of the reliability of the section's "designation". float32.
+    :ivar loudness: The overall loudness of the section in decibels (dB). float32.
+    :ivar tempo: The overall estimated tempo of the section in beats per minute (BPM). float32.
+    :ivar tempo_confidence: The confidence, from 0.0 to 1.0, of the reliability of the tempo. float32.
+    :ivar key: The estimated overall key of the section, -1 if no key was detected. int8.
+    :ivar key_confidence: The confidence, from 0.0 to 1.0, of the reliability of the key. float32.
+    :ivar mode: Major is represented by 1 and minor is 0, -1 if no mode was detected. int8.
+    :ivar mode_confidence: The confidence, from 0.0 to 1.0, of the reliability of the mode. float32.
+    :ivar time_signature: An estimated time signature. int8.
+    :ivar time_signature_confidence: The confidence, from 0.0 to 1.0, of the reliability of the time_signature. float32.
+    """
+
+    FIELDS = TimeIntervals.FIELDS + (
+        ("loudness", "float32", 0.0),
+        ("tempo", "float32", 0.0),
+        ("tempo_confidence", "float32", 0.0),
+        ("key", "int8", -1),
+        ("key_confidence", "float32", 0.0),
+        ("mode", "int8", -1),
+        ("mode_confidence", "float32", 0.0),
+        ("time_signature", "int8", 0),
+        ("time_signature_confidence", "float32", 0.0),
+    )
+
+    __slots__ = (
+        "loudness",
+        "tempo",
+        "tempo_confidence",
+        "key",
+        "key_confidence",
+        "mode",
+        "mode_confidence",
+        "time_signature",
+        "time_signature_confidence",
+    )
+
+
+class Segments(TimeIntervals):
+    """
+    Columnar segments of an audio analysis, short sounds that are roughly consistent throughout their duration.
+    Every attribute is a NumPy array with one element, or one row, per segment.
+
+    :ivar start: The starting point (in seconds) of the segment. float64.
+    :ivar duration: The duration (in seconds) of the segment. float64.
+    :ivar confidence: The confidence, from 0.0 to 1.0, of the reliability of the segmentation. float32.
+    :ivar loudness_start: The onset loudness of the segment in decibels (dB). float32.
+    :ivar loudness_max: The peak loudness of the segment in decibels (dB). float32.
+    :ivar loudness_max_time: The segment-relative offset of the segment peak loudness in seconds. float32.
+    :ivar loudness_end: The offset loudness of the segment in decibels (dB). float32.
+    :ivar pitches: (N, 12) float32 matrix of the relative dominance of every pitch in the chromatic scale.
+    :ivar timbre: (N, 12) float32 matrix of timbre coefficients.
+    """
+
+    FIELDS = TimeIntervals.FIELDS + (
+        ("loudness_start", "float32", 0.0),
+        ("loudness_max", "float32", 0.0),
+        ("loudness_max_time", "float32", 0.0),
+        ("loudness_end", "float32", 0.0),
+    )
+
+    __slots__ = (
+        "loudness_start",
+        "loudness_max",
+        "loudness_max_time",
+        "loudness_end",
+        "pitches",
+        "timbre",
+    )
+
+    def __init__(self, items: List[Dict]) -> None:
+        super().__init__(items)
+        np = import_numpy()
+        for name in ("pitches", "timbre"):
+            matrix = np.array([item[name] for item in items], dtype=np.float32)
+            setattr(self, name, matrix.reshape(len(items), 12))
+
+
+@functools.lru_cache(maxsize=None)
+def _has_numpy() -> bool:
+    try:
+        import_numpy()
+    except ImportError:
+        return False
+    return True
+
+
+def _columnar(name: str, cls: type) -> property:
+    def get(self):
+        value = self._intervals[name]
+        if isinstance(value, list):
+            value = self._intervals[name] = cls(value)
+        return value
+
+    get.__doc__ = (
+        f":py:class:`{cls.__name__}` of the track. None if the response had none."
+    )
+    return property(get)
+
+
+_INTERVALS = (
+    ("bars", TimeIntervals),
+    ("beats", TimeIntervals),
+    ("tatums", TimeIntervals),
+    ("sections", Sections),
+    ("segments", Segments),
+)
+
+
 class AudioAnalysis:
     """
     Audio Analysis model.
@@ -38,6 +199,11 @@ class AudioAnalysis:
     :ivar synch_version: A version number for the Synchstring used in the synchstring field.
     :ivar rhythmstring: A Rhythmstring for this track. The format of this string is similar to the Synchstring.
     :ivar rhythm_version: A version number for the Rhythmstring used in the rhythmstring field.
+
+    bars, beats, tatums, sections and segments are stored as NumPy arrays, one per attribute,
+    instead of an object per interval, and the JSON objects they were built from are dropped.
+    Without NumPy the JSON objects are kept and converted on first access,
+    which raises ImportError.
     """
 
     def __init__(
@@ -68,6 +234,11 @@ class AudioAnalysis:
         synch_version: float,
         rhythmstring: str,
         rhythm_version: float,
+        bars: Optional[List[Dict]] = None,
+        beats: Optional[List[Dict]] = None,
+        tatums: Optional[List[Dict]] = None,
+        sections: Optional[List[Dict]] = None,
+        segments: Optional[List[Dict]] = None,
     ) -> None:
         self.duration = duration
         self.num_samples = num_samples
@@ -95,8 +266,25 @@ class AudioAnalysis:
         self.synch_version = synch_version
         self.rhythmstring = rhythmstring
         self.rhythm_version = rhythm_version
+        self._intervals = {
+            "bars": bars,
+            "beats": beats,
+            "tatums": tatums,
+            "sections": sections,
+            "segments": segments,
+        }
+        if _has_numpy():
+            for name, cls in _INTERVALS:
+                if self._intervals[name] is not None:
+                    self._intervals[name] = cls(self._intervals[name])
+
+    bars = _columnar(*_INTERVALS[0])
+    beats = _columnar(*_INTERVALS[1])
+    tatums = _columnar(*_INTERVALS[2])
+    sections = _columnar(*_INTERVALS[3])
+    segments = _columnar(*_INTERVALS[4])
 
-    @property
+    @functools.cached_property
     def tonality(self):
         """Retruns the tonic of the song"""
         return Tonality(
@@ -0,0 +1,96 @@
+from ._tonality import Tonality
+
+
+class AudioFeatures:
+    """
+    Audio Features model.
+    Return value of the client.get_audio_features method.
+
+    :ivar acousticness: A confidence measure from 0.0 to 1.0 of whether the track is acoustic.
+    :ivar analysis_url: A URL to access the full audio analysis of this track.
+    :ivar danceability: How suitable a track is for dancing, from 0.0 (least danceable) to 1.0 (most danceable).
+    :ivar duration_ms: The duration of the track in milliseconds.
+    :ivar energy: A perceptual measure of intensity and activity, from 0.0 to 1.0.
+    :ivar id: The Spotify ID for the track.
+    :ivar instrumentalness: Predicts whether a track contains no vocals, from 0.0 to 1.0.
+    :ivar key: The key the track is in. -1 if no key was detected.
+    :ivar liveness: Detects the presence of an audience in the recording, from 0.0 to 1.0.
+    :ivar loudness: The overall loudness of a track in decibels (dB).
+    :ivar mode: Mode indicates the modality (major or minor) of a track. Major is represented by 1 and minor is 0.
+    :ivar speechiness: Detects the presence of spoken words in a track, from 0.0 to 1.0.
+    :ivar tempo: The overall estimated tempo of a track in beats per minute (BPM).
+    :ivar time_signature: An estimated time signature.
+    :ivar track_href: A link to the Web API endpoint providing full details of the track.
+    :ivar type: The object type. "audio_features".
+    :ivar uri: The Spotify URI for the track.
+    :ivar valence: The musical positiveness conveyed by a track, from 0.0 to 1.0.
+    """
+
+    __slots__ = (
+        "acousticness",
+        "analysis_url",
+        "danceability",
+        "duration_ms",
+        "energy",
+        "id",
+        "instrumentalness",
+        "key",
+        "liveness",
+        "loudness",
+        "mode",
+        "speechiness",
+        "tempo",
+        "time_signature",
+        "track_href",
+        "type",
+        "uri",
+        "valence",
+    )
+
+    def __init__(
+        self,
+        acousticness: float,
+        analysis_url: str,
+        danceability: float,
+        duration_ms: int,
+        energy: float,
+        id: str,
+        instrumentalness: float,
+        key: int,
+        liveness: float,
+        loudness: float,
+        mode: int,
+        speechiness: float,
+        tempo: float,
+        time_signature: int,
+        track_href: str,
+        type: str,
+        uri: str,
+        valence: float,
+    ) -> None:
+        self.acousticness = acousticness
+        self.analysis_url = analysis_url
+        self.danceability = danceability
+        self.duration_ms = duration_ms
+        self.energy = energy
+        self.id = id
+        self.instrumentalness = instrumentalness
+        self.key = key
+        self.liveness = liveness
+        self.loudness = loudness
+        self.mode = mode
+        self.speechiness = speechiness
+        self.tempo = tempo
+        self.time_signature = time_signature
+        self.track_href = track_href
+        self.type = type
+        self.uri = uri
+        self.valence = valence
+
+    @property
+    def chord(self) -> str:
+        """Returns the tonic of the track. E.G. Am"""
+        return Tonality.CHORDS.get((self.key, self.mode))
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({self.id})"
@@ -1,6 +1,8 @@
 class Image:
     """Image model"""
 
+    __slots__ = ("height", "url", "width")
+
     def __init__(self, height, url, width):
         self.height = height
         self.url = url
@@ -14,6 +14,8 @@ class Search:
     :ivar total: The total number of items available to return.
     """
 
+    __slots__ = ("href", "items", "limit", "next", "offset", "previous", "total")
+
     def __init__(
         self,
         href: str,
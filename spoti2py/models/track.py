@@ -15,6 +15,7 @@ class Track:
     :ivar artists: The artists who performed the track.
                     Each artist object includes a link in href to more detailed information about the artist.
     :ivar available_markets: A list of the countries in which the track can be played.
+                             A MarketSet when parsed with market_sets=True.
     :ivar disc_number: The disc number (usually 1 unless the album consists of more than one disc).
     :ivar duration_ms: The track length in milliseconds.
     :ivar explicit: Whether or not the track has explicit lyrics.
@@ -32,6 +33,27 @@ class Track:
     :ivar popularity: Popularity of the track. Value between 0 and 100.
     """
 
+    __slots__ = (
+        "album",
+        "artists",
+        "available_markets",
+        "disc_number",
+        "duration_ms",
+        "explicit",
+        "external_ids",
+        "external_urls",
+        "href",
+        "id",
+        "is_local",
+        "name",
+        "popularity",
+        "preview_url",
+        "track_number",
+        "type",
+        "uri",
+        "is_playable",
+    )
+
     def __init__(
         self,
         artists: List[Artist],
@@ -0,0 +1,102 @@
+import asyncio
+from typing import AsyncIterator, Awaitable, Callable, Dict, List, Optional
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+_END = object()
+
+
+async def paginate(
+    get_page: Callable[[str], Awaitable[Dict]],
+    endpoint: str,
+    max_buffered_pages: int = 1,
+) -> AsyncIterator[Dict]:
+    """
+    Yields Spotify paging objects, following their next links.
+
+    A background task downloads the following pages while the caller works on the
+    current one. At most max_buffered_pages pages are downloaded ahead of the caller,
+    so memory stays flat no matter how large the collection is.
+
+    :param get_page: Coroutine function returning the paging object found at an endpoint.
+    :param endpoint: URL of the first page.
+    :param max_buffered_pages: Maximum number of pages downloaded ahead. Default is 1.
+    :return: Async iterator over paging objects.
+    """
+    if max_buffered_pages < 1:
+        raise ValueError("max_buffered_pages needs to be at least 1.")
+    slots = asyncio.Semaphore(max_buffered_pages)
+    pages = asyncio.Queue()
+
+    async def download() -> None:
+        next_endpoint = endpoint
+        try:
+            while next_endpoint:
+                await slots.acquire()
+                page = await get_page(next_endpoint)
+                pages.put_nowait(page)
+                next_endpoint = page.get("next")
+        except Exception as e:
+            pages.put_nowait(e)
+        pages.put_nowait(_END)
+
+    downloader = asyncio.ensure_future(download())
+    try:
+        while True:
+            page = await pages.get()
+            if page is _END:
+                return
+            if isinstance(page, Exception):
+                raise page
+            slots.release()
+            yield page
+    finally:
+        downloader.cancel()
+
+
+def with_offset(endpoint: str, offset: int, limit: int) -> str:
+    """Returns endpoint with its offset and limit query parameters replaced."""
+    parts = urlsplit(endpoint)
+    query = dict(parse_qsl(parts.query, keep_blank_values=True))
+    query.update(offset=offset, limit=limit)
+    return urlunsplit(parts._replace(query=urlencode(query)))
+
+
+async def fetch_all_pages(
+    get_page: Callable[[str], Awaitable[Dict]],
+    endpoint: str,
+    max_concurrency: int = 10,
+    max_total: Optional[int] = None,
+) -> List[Dict]:
+    """
+    Fetches every page of a collection whose size is reported by the first page.
+
+    Once the first page reports total, all remaining offsets are known, so they are
+    requested at once (at most max_concurrency at a time) instead of following
+    next links one after another.
+
+    :param get_page: Coroutine function returning the paging object found at an endpoint.
+    :param endpoint: URL of the first page.
+    :param max_concurrency: Maximum number of pages downloaded at once. Default is 10.
+    :param max_total: Upper bound on the number of items the API lets you page through.
+                      E.g. search results stop at 1000. Default is None (no bound).
+    :return: Paging objects, in order.
+    :rtype: list
+    """
+    first = await get_page(endpoint)
+    limit = first["limit"] or len(first["items"])
+    total = first["total"]
+    if max_total is not None:
+        total = min(total, max_total)
+    if not limit:
+        return [first]
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def get_offset(offset: int) -> Dict:
+        async with semaphore:
+            return await get_page(
+                with_offset(endpoint, offset, min(limit, total - offset))
+            )
+
+    offsets = range(first["offset"] + limit, total, limit)
+    rest = await asyncio.gather(*[get_offset(offset) for offset in offsets])
+    return [first, *rest]
@@ -0,0 +1,117 @@
+import asyncio
+from typing import List, Optional
+
+import aiohttp
+
+
+class ConnectionPool:
+    """
+    Connection pool to the Spotify Web API.
+
+    The aiohttp session is created lazily, on the event loop that first needs it.
+    Connections can't move between loops, so when the pool is later used from a different
+    loop it starts over with a new session. The previous one is closed on its own loop
+    if that loop is still open; connections of a loop that has been closed are dropped
+    without being closed cleanly, so close() the pool before its loop ends.
+    Pass the same instance to several clients so they share one warm pool.
+
+    :ivar limit: Total number of simultaneous connections. Default is 100.
+    :ivar limit_per_host: Number of simultaneous connections to a single host.
+                          Default is 0 (no limit other than limit).
+    :ivar keepalive_timeout: Seconds an idle connection is kept open for reuse. Default is 30.
+    :ivar ttl_dns_cache: Seconds DNS lookups are cached. None caches forever. Default is 300.
+    :ivar connect_timeout: Seconds to wait for a free connection and to connect. Default is None.
+    :ivar sock_connect_timeout: Seconds to wait for a new connection to open. Default is None.
+    :ivar sock_read_timeout: Seconds to wait for data between two reads. Default is None.
+    :ivar total_timeout: Seconds a whole request (including the response body) may take. Default is 300.
+    :ivar connector: Optional aiohttp connector to use instead of creating one.
+                     It is not closed by the pool, so it can be shared between pools.
+    :ivar trace_configs: aiohttp TraceConfigs added to the session,
+                         e.g. :py:meth:`~spoti2py.metrics.MetricsCollector.trace_config`. Default is None.
+    """
+
+    def __init__(
+        self,
+        limit: int = 100,
+        limit_per_host: int = 0,
+        keepalive_timeout: float = 30,
+        ttl_dns_cache: Optional[int] = 300,
+        connect_timeout: Optional[float] = None,
+        sock_connect_timeout: Optional[float] = None,
+        sock_read_timeout: Optional[float] = None,
+        total_timeout: Optional[float] = 300,
+        connector: Optional[aiohttp.BaseConnector] = None,
+        trace_configs: Optional[List[aiohttp.TraceConfig]] = None,
+    ) -> None:
+        self.limit = limit
+        self.limit_per_host = limit_per_host
+        self.keepalive_timeout = keepalive_timeout
+        self.ttl_dns_cache = ttl_dns_cache
+        self.connect_timeout = connect_timeout
+        self.sock_connect_timeout = sock_connect_timeout
+        self.sock_read_timeout = sock_read_timeout
+        self.total_timeout = total_timeout
+        self.connector = connector
+        self.trace_configs = trace_configs
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def _create_session(self) -> aiohttp.ClientSession:
+        if self.connector is not None:
+            connector = self.connector
+        else:
+            connector = aiohttp.TCPConnector(
+                limit=self.limit,
+                limit_per_host=self.limit_per_host,
+                keepalive_timeout=self.keepalive_timeout,
+                ttl_dns_cache=self.ttl_dns_cache,
+                use_dns_cache=True,
+            )
+        timeout = aiohttp.ClientTimeout(
+            total=self.total_timeout,
+            connect=self.connect_timeout,
+            sock_connect=self.sock_connect_timeout,
+            sock_read=self.sock_read_timeout,
+        )
+        return aiohttp.ClientSession(
+            connector=connector,
+            connector_owner=self.connector is None,
+            timeout=timeout,
+            trace_configs=self.trace_configs,
+        )
+
+    async def get_session(self) -> aiohttp.ClientSession:
+        """Returns the session bound to the running event loop, creating it if needed."""
+        loop = asyncio.get_running_loop()
+        if self._session is not None and self._loop is not loop:
+            self._release_session()
+        if self._session is None or self._session.closed:
+            self._session = self._create_session()
+            self._loop = loop
+        return self._session
+
+    def _release_session(self) -> None:
+        """Lets go of the session of another event loop, closing it there if possible."""
+        session, loop = self._session, self._loop
+        self._session = None
+        self._loop = None
+        if session.closed:
+            return
+        if loop.is_closed():
+            # Its connections died with the loop. Detached, the session is forgotten quietly.
+            session.detach()
+        elif loop.is_running():
+            asyncio.run_coroutine_threadsafe(session.close(), loop)
+        else:
+            loop.create_task(session.close())
+
+    async def close(self) -> None:
+        if self._session is None:
+            return
+        if self._loop is not asyncio.get_running_loop():
+            self._release_session()
+            return
+        session = self._session
+        self._session = None
+        self._loop = None
+        await session.close()
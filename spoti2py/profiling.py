@@ -0,0 +1,202 @@
+import contextlib
+import os
+import time
+import tracemalloc
+from typing import Dict, Iterator, Optional, Union
+
+# Set to 1 to profile every Client, or to "alloc" to also sample allocations.
+PROFILE_ENV_VAR = "SPOTI2PY_PROFILE"
+
+PHASES = ("network", "decode", "models")
+
+
+class CallProfile:
+    """
+    Time spent in each phase of one public Client call.
+
+    :ivar network: Seconds from sending requests to having read their response bodies,
+                   including the network time of an identical request another call already sent.
+    :ivar decode: Seconds spent decoding JSON.
+    :ivar models: Seconds spent building models.
+    :ivar allocated: Bytes still allocated after building models. Only with trace_allocations.
+    :ivar started: time.perf_counter() at the start of the call.
+    """
+
+    __slots__ = ("network", "decode", "models", "allocated", "started")
+
+    def __init__(self) -> None:
+        self.network = 0.0
+        self.decode = 0.0
+        self.models = 0.0
+        self.allocated = 0
+        self.started = time.perf_counter()
+
+
+class MethodProfile:
+    """
+    Aggregated phases of every call to one Client method.
+
+    :ivar calls: Number of calls.
+    :ivar total: Total wall time of the calls, in seconds.
+    :ivar network: Total seconds waiting for the network.
+    :ivar decode: Total seconds decoding JSON.
+    :ivar models: Total seconds building models.
+    :ivar allocated: Total bytes still allocated after building models.
+    """
+
+    __slots__ = ("calls", "total", "network", "decode", "models", "allocated")
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self.total = 0.0
+        self.network = 0.0
+        self.decode = 0.0
+        self.models = 0.0
+        self.allocated = 0
+
+    @property
+    def other(self) -> float:
+        """
+        Seconds not spent in a measured phase, e.g. waiting for rate limits or retries.
+        Can be negative when concurrent requests of one call overlap.
+        """
+        return self.total - self.network - self.decode - self.models
+
+    def as_dict(self) -> Dict:
+        return {
+            "calls": self.calls,
+            "total": self.total,
+            "network": self.network,
+            "decode": self.decode,
+            "models": self.models,
+            "other": self.other,
+            "allocated": self.allocated,
+        }
+
+
+class Profiler:
+    """
+    Breaks the time of every public :py:class:`~spoti2py.client.Client` call down into
+    network, JSON decoding and model construction, and aggregates it per method.
+
+    Enable it with Client(profile=True) or by setting the SPOTI2PY_PROFILE environment variable
+    to 1 (or to "alloc" to also trace allocations). The client logs the report when it's closed.
+
+    Iterating over an iter_* method counts as one call. Nested calls count towards the outer call. Requests a call sends concurrently are added up,
+    so network can exceed the wall time of the call; see :py:meth:`report`.
+
+    :ivar trace_allocations: Measure, with tracemalloc, the memory retained by the models
+                             built during each call. tracemalloc is started if it isn't running
+                             and left running. Slows model construction down considerably.
+                             Default is False.
+    :ivar methods: :py:class:`MethodProfile` per method name.
+    """
+
+    def __init__(self, trace_allocations: bool = False) -> None:
+        self.trace_allocations = trace_allocations
+        self.methods: Dict[str, MethodProfile] = {}
+
+    @classmethod
+    def from_env(cls) -> Optional["Profiler"]:
+        """Returns a Profiler configured by the SPOTI2PY_PROFILE environment variable, or None."""
+        value = os.environ.get(PROFILE_ENV_VAR, "").strip().lower()
+        if value in ("", "0", "false", "no", "off"):
+            return None
+        return cls(trace_allocations=value == "alloc")
+
+    def start(self) -> CallProfile:
+        return CallProfile()
+
+    def finish(self, method: str, call: CallProfile) -> None:
+        profile = self.methods.get(method)
+        if profile is None:
+            profile = self.methods[method] = MethodProfile()
+        profile.calls += 1
+        profile.total += time.perf_counter() - call.started
+        profile.network += call.network
+        profile.decode += call.decode
+        profile.models += call.models
+        profile.allocated += call.allocated
+
+    @contextlib.contextmanager
+    def building_models(self, call: CallProfile) -> Iterator[None]:
+        """Times model construction, and traces its allocations if enabled."""
+        tracing = self.trace_allocations
+        if tracing:
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+            before, _ = tracemalloc.get_traced_memory()
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            call.models += time.perf_counter() - started
+            if tracing:
+                after, _ = tracemalloc.get_traced_memory()
+                call.allocated += max(after - before, 0)
+
+    def reset(self) -> None:
+        self.methods.clear()
+
+    def snapshot(self) -> Dict[str, Dict]:
+        """Returns the aggregated phases per method as plain dicts."""
+        return {method: profile.as_dict() for method, profile in self.methods.items()}
+
+    def report(self) -> str:
+        """
+        Returns a table of the mean time per call and the share of each phase, slowest methods first.
+
+        "mean ms" is the wall time of a call and "phases ms" the time of its phases added up,
+        which is larger when the call ran requests concurrently. Shares are of whichever
+        of the two is larger, so they always add up to 100%.
+
+        :rtype: str
+        """
+        columns = ("calls", "mean ms", "phases ms", *PHASES, "other")
+        if self.trace_allocations:
+            columns += ("KiB/call",)
+        rows = []
+        for method, profile in sorted(
+            self.methods.items(), key=lambda item: item[1].total, reverse=True
+        ):
+            phases = sum(getattr(profile, phase) for phase in PHASES)
+            span = max(profile.total, phases)
+            row = [
+                method,
+                str(profile.calls),
+                f"{profile.total / profile.calls * 1000:.2f}",
+                f"{phases / profile.calls * 1000:.2f}",
+            ]
+            for phase in PHASES:
+                row.append(_share(getattr(profile, phase), span))
+            row.append(_share(span - phases, span))
+            if self.trace_allocations:
+                row.append(f"{profile.allocated / profile.calls / 1024:.1f}")
+            rows.append(row)
+        header = ["method", *columns]
+        widths = [
+            max(len(row[i]) for row in [header, *rows]) for i in range(len(header))
+        ]
+        lines = [
+            "  ".join(
+                cell.ljust(width) if i == 0 else cell.rjust(width)
+                for i, (cell, width) in enumerate(zip(row, widths))
+            )
+            for row in [header, *rows]
+        ]
+        return "\n".join(lines)
+
+
+def _share(seconds: float, total: float) -> str:
+    return f"{seconds / total * 100:.0f}%" if total else "-"
+
+
+def resolve_profiler(profile: Union[bool, Profiler, None]) -> Optional[Profiler]:
+    """Turns the profile argument of Client into a Profiler or None."""
+    if profile is None:
+        return Profiler.from_env()
+    if profile is True:
+        return Profiler()
+    if profile is False:
+        return None
+    return profile
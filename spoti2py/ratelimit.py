@@ -0,0 +1,123 @@
+import asyncio
+import time
+from typing import Optional
+
+
+class RateLimiter:
+    """
+    Base class for client-side rate limiters.
+
+    The client awaits acquire() before sending every request.
+    Subclass it and override acquire() to plug in your own policy.
+    """
+
+    async def acquire(self) -> None:
+        raise NotImplementedError
+
+
+class TokenBucket(RateLimiter):
+    """
+    Token bucket rate limiter.
+
+    Tokens are added at rate per second up to capacity. Every request takes one token,
+    so short bursts of up to capacity requests go out at once and the long-run rate
+    never exceeds rate. Waiting requests are served in arrival order.
+
+    :ivar rate: Requests per second.
+    :ivar capacity: Maximum burst size. Defaults to rate rounded up (one second worth of requests).
+    """
+
+    def __init__(self, rate: float, capacity: Optional[float] = None) -> None:
+        if rate <= 0:
+            raise ValueError("rate needs to be a positive number.")
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(1, round(rate))
+        self._tokens = float(self.capacity)
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(
+            self.capacity, self._tokens + (now - self._updated) * self.rate
+        )
+        self._updated = now
+
+    async def acquire(self) -> None:
+        async with self._lock:
+            self._refill()
+            if self._tokens < 1:
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+                self._refill()
+            self._tokens -= 1
+
+
+class AdaptiveConcurrency:
+    """
+    AIMD (additive increase, multiplicative decrease) limit on the number of requests in flight.
+
+    Every healthy response grows the limit by increase / limit, i.e. by about increase
+    per round of requests. A throttled response multiplies it by decrease, at most once
+    per cooldown seconds so a burst of 429s counts as a single congestion signal.
+
+    Use it as an async context manager around a request.
+
+    :ivar limit: Current limit. Starts at initial.
+    :ivar minimum: Lower bound of the limit. Default is 1.
+    :ivar maximum: Upper bound of the limit. Default is 64.
+    :ivar increase: Additive increase per round of healthy responses. Default is 1.
+    :ivar decrease: Multiplicative decrease factor on throttling. Default is 0.5.
+    :ivar cooldown: Minimum number of seconds between two decreases. Default is 1.
+    """
+
+    def __init__(
+        self,
+        initial: int = 10,
+        minimum: int = 1,
+        maximum: int = 64,
+        increase: float = 1,
+        decrease: float = 0.5,
+        cooldown: float = 1,
+    ) -> None:
+        if not minimum <= initial <= maximum:
+            raise ValueError("initial needs to be between minimum and maximum.")
+        if not 0 < decrease < 1:
+            raise ValueError("decrease needs to be between 0 and 1.")
+        self.limit = float(initial)
+        self.minimum = minimum
+        self.maximum = maximum
+        self.increase = increase
+        self.decrease = decrease
+        self.cooldown = cooldown
+        self.in_flight = 0
+        self._last_decrease = float("-inf")
+        self._condition = asyncio.Condition()
+
+    async def acquire(self) -> None:
+        async with self._condition:
+            await self._condition.wait_for(lambda: self.in_flight < int(self.limit))
+            self.in_flight += 1
+
+    async def release(self) -> None:
+        async with self._condition:
+            self.in_flight -= 1
+            self._condition.notify_all()
+
+    async def __aenter__(self) -> "AdaptiveConcurrency":
+        await self.acquire()
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        await self.release()
+
+    def on_success(self) -> None:
+        """Additive increase."""
+        self.limit = min(self.maximum, self.limit + self.increase / self.limit)
+
+    def on_throttle(self) -> None:
+        """Multiplicative decrease."""
+        now = time.monotonic()
+        if now - self._last_decrease < self.cooldown:
+            return
+        self._last_decrease = now
+        self.limit = max(self.minimum, self.limit * self.decrease)
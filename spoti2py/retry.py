@@ -0,0 +1,80 @@
+import asyncio
+import random
+from collections import deque
+from typing import Iterable, Optional, Tuple, Type
+
+import aiohttp
+
+from .exceptions import SpotifyException
+
+
+class RetryPolicy:
+    """
+    Decides which failed requests are retried and how long to wait in between.
+
+    Waits use exponential backoff with full jitter: before retry n the client sleeps
+    a random duration between 0 and min(backoff_max, backoff_base * 2 ** n) seconds.
+
+    :ivar max_attempts: Total number of attempts, including the first one. 1 disables retries.
+                        Default is 3.
+    :ivar backoff_base: Seconds. Default is 0.5.
+    :ivar backoff_max: Upper bound of a single wait, in seconds. Default is 30.
+    :ivar retry_statuses: HTTP status codes worth retrying. Default is 500, 502, 503 and 504.
+    :ivar retry_exceptions: Exception classes worth retrying.
+                            Default is connection errors and timeouts.
+    """
+
+    def __init__(
+        self,
+        max_attempts: int = 3,
+        backoff_base: float = 0.5,
+        backoff_max: float = 30,
+        retry_statuses: Iterable[int] = (500, 502, 503, 504),
+        retry_exceptions: Tuple[Type[BaseException], ...] = (
+            aiohttp.ClientConnectionError,
+            aiohttp.ClientPayloadError,
+            asyncio.TimeoutError,
+        ),
+    ) -> None:
+        if max_attempts < 1:
+            raise ValueError("max_attempts needs to be at least 1.")
+        self.max_attempts = max_attempts
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.retry_statuses = frozenset(retry_statuses)
+        self.retry_exceptions = retry_exceptions
+
+    def is_retryable(self, error: BaseException) -> bool:
+        if isinstance(error, SpotifyException):
+            return error.status_code in self.retry_statuses
+        return isinstance(error, self.retry_exceptions)
+
+    def backoff(self, attempt: int) -> float:
+        """Seconds to wait before retry number attempt (starting at 0)."""
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * 2**attempt))
+
+
+class LatencyTracker:
+    """
+    Keeps the latencies of the most recent successful requests.
+    Used to decide when to send a hedged request.
+
+    :ivar window: Number of latencies kept. Default is 200.
+    :ivar min_samples: Number of latencies needed before quantile() returns a value.
+                       Default is 20.
+    """
+
+    def __init__(self, window: int = 200, min_samples: int = 20) -> None:
+        self.window = window
+        self.min_samples = min_samples
+        self._samples = deque(maxlen=window)
+
+    def record(self, seconds: float) -> None:
+        self._samples.append(seconds)
+
+    def quantile(self, q: float) -> Optional[float]:
+        """Returns the q quantile of recent latencies, or None if there aren't enough samples."""
+        if len(self._samples) < self.min_samples:
+            return None
+        samples = sorted(self._samples)
+        return samples[min(len(samples) - 1, int(q * len(samples)))]
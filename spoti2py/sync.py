@@ -0,0 +1,102 @@
+import asyncio
+import functools
+import inspect
+import threading
+from typing import Any, AsyncIterator, Coroutine, Iterator
+
+from .client import Client
+
+
+class SyncClient:
+    """
+    Blocking facade over :py:class:`~spoti2py.client.Client` for threaded code.
+
+    One background thread runs the client's event loop for the lifetime of the SyncClient.
+    Every call is submitted to that loop and waited for, so any number of threads can
+    share one instance, and with it one connection pool, access token, cache and rate limits.
+
+    It has a blocking version of every public Client coroutine with the same arguments,
+    and the iter_* methods return ordinary iterators.
+
+    .. code-block:: python
+
+       client = SyncClient(client_id, client_secret)
+       track = client.get_track("11dFghVXANMlKmJXsNCbNl")
+       client.close()
+
+    Arguments are passed to Client unchanged.
+
+    :ivar client: The wrapped Client. Only touch it from coroutines submitted with run().
+    """
+
+    def __init__(self, *args, **kwargs) -> None:
+        self.client = Client(*args, **kwargs)
+        self._loop = self.client.loop
+        self._lock = threading.Lock()
+        self._thread = threading.Thread(
+            target=self._loop.run_forever, name="spoti2py-loop", daemon=True
+        )
+        self._thread.start()
+
+    def run(self, coroutine: Coroutine) -> Any:
+        """Runs a coroutine on the client's loop and returns its result. Thread-safe."""
+        if threading.get_ident() == self._thread.ident or self._loop.is_closed():
+            coroutine.close()
+            if self._loop.is_closed():
+                raise RuntimeError("SyncClient is closed.")
+            raise RuntimeError("SyncClient can't be called from its own event loop.")
+        return asyncio.run_coroutine_threadsafe(coroutine, self._loop).result()
+
+    def _iterate(self, iterator: AsyncIterator) -> Iterator:
+        try:
+            while True:
+                try:
+                    yield self.run(iterator.__anext__())
+                except StopAsyncIteration:
+                    return
+        finally:
+            if not self._loop.is_closed():
+                self.run(iterator.aclose())
+
+    def close(self) -> None:
+        """Closes the client and stops the loop thread. Safe to call more than once."""
+        with self._lock:
+            if self._loop.is_closed():
+                return
+            try:
+                self.run(self.client.close())
+            finally:
+                self._loop.call_soon_threadsafe(self._loop.stop)
+                self._thread.join()
+                self._loop.close()
+
+    def __enter__(self) -> "SyncClient":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+
+def _blocking(method):
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        return self.run(method(self.client, *args, **kwargs))
+
+    return wrapper
+
+
+def _iterating(method):
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        return self._iterate(method(self.client, *args, **kwargs))
+
+    return wrapper
+
+
+for _name, _method in inspect.getmembers(Client, inspect.isfunction):
+    if _name.startswith("_") or hasattr(SyncClient, _name):
+        continue
+    if inspect.iscoroutinefunction(_method):
+        setattr(SyncClient, _name, _blocking(_method))
+    elif _name.startswith("iter_"):
+        setattr(SyncClient, _name, _iterating(_method))
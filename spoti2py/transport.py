@@ -0,0 +1,332 @@
+import asyncio
+import itertools
+import json
+import mmap
+import os
+import time
+from typing import Dict, List, Mapping, Optional, Tuple
+from urllib.parse import urlsplit, urlunsplit
+
+import aiohttp
+from multidict import CIMultiDict, CIMultiDictProxy
+from yarl import URL
+
+from .exceptions import NotRecorded
+from .pool import ConnectionPool
+from .utils import normalize_endpoint
+
+
+class Response:
+    """
+    A complete HTTP response, body included.
+
+    :ivar status: HTTP status code.
+    :ivar headers: Case-insensitive response headers.
+    :ivar body: Response body.
+    :ivar method: Method of the request.
+    :ivar url: URL of the request.
+    """
+
+    __slots__ = ("status", "headers", "body", "method", "url")
+
+    def __init__(
+        self,
+        status: int,
+        headers: Mapping[str, str],
+        body: bytes,
+        method: str,
+        url: str,
+    ) -> None:
+        self.status = status
+        self.headers = headers
+        self.body = body
+        self.method = method
+        self.url = url
+
+    def raise_for_status(self) -> None:
+        """Raises aiohttp.ClientResponseError for a 4xx or 5xx status, like aiohttp does."""
+        if self.status >= 400:
+            url = URL(self.url)
+            raise aiohttp.ClientResponseError(
+                aiohttp.RequestInfo(
+                    url, self.method, CIMultiDictProxy(CIMultiDict()), url
+                ),
+                (),
+                status=self.status,
+                headers=self.headers,
+            )
+
+
+class Transport:
+    """
+    Sends the HTTP requests of a :py:class:`~spoti2py.client.Client`.
+
+    The client retries, throttles and decodes; a transport only delivers one request
+    and returns the complete response, whatever its status. Subclass it to answer
+    requests from somewhere other than the network.
+    """
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        headers: Mapping[str, str],
+        data: Optional[Mapping[str, str]] = None,
+        trace_request_ctx: Optional[str] = None,
+    ) -> Response:
+        """
+        Sends a request and returns its response.
+
+        :param method: "GET" or "POST".
+        :param url: Absolute URL.
+        :param headers: Request headers.
+        :param data: Form fields of a POST request.
+        :param trace_request_ctx: Endpoint template of the request, for aiohttp tracing.
+        :rtype: :py:class:`Response`
+        """
+        raise NotImplementedError
+
+    async def close(self) -> None:
+        """Releases the transport's resources."""
+
+
+class AiohttpTransport(Transport):
+    """
+    Sends requests to the network with aiohttp.
+
+    :ivar pool: :py:class:`~spoti2py.pool.ConnectionPool` providing the session.
+                When neither pool nor session is given, one is created with trace_configs
+                and closed with the transport.
+    :ivar session: Optional aiohttp session to use instead of the pool's. It is not closed by the transport.
+    """
+
+    def __init__(
+        self,
+        pool: Optional[ConnectionPool] = None,
+        session: Optional[aiohttp.ClientSession] = None,
+        trace_configs: Optional[List[aiohttp.TraceConfig]] = None,
+    ) -> None:
+        self._owns_pool = pool is None and session is None
+        if pool is None:
+            pool = ConnectionPool(trace_configs=trace_configs)
+        self.pool = pool
+        self.session = session
+
+    async def get_session(self) -> aiohttp.ClientSession:
+        if self.session is not None:
+            return self.session
+        return await self.pool.get_session()
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        headers: Mapping[str, str],
+        data: Optional[Mapping[str, str]] = None,
+        trace_request_ctx: Optional[str] = None,
+    ) -> Response:
+        session = await self.get_session()
+        async with session.request(
+            method,
+            url,
+            headers=headers,
+            data=data,
+            trace_request_ctx=trace_request_ctx,
+        ) as response:
+            body = await response.read()
+            return Response(response.status, response.headers, body, method, url)
+
+    async def close(self) -> None:
+        if self._owns_pool:
+            await self.pool.close()
+
+
+def _request_key(method: str, url: str) -> Tuple[str, str]:
+    """Requests are matched on method, path and sorted query, whatever the host."""
+    parts = urlsplit(normalize_endpoint(url))
+    return method, urlunsplit(("", "", parts.path, parts.query, ""))
+
+
+class RecordingTransport(Transport):
+    """
+    Passes requests on to another transport and appends every request and response to a file,
+    for :py:class:`ReplayTransport` to serve later.
+
+    Each record is a line of JSON (method, URL, status, response headers, body length and
+    seconds taken) followed by the response body and a newline.
+    Request headers aren't recorded and access tokens are replaced, so no credentials end up in the file.
+    Records are flushed as they are written; a record cut short by a crash is ignored on replay.
+
+    :ivar path: File to append to. Created if it doesn't exist.
+    :ivar transport: Transport actually sending the requests. Default is AiohttpTransport().
+    :ivar count: Number of records written.
+    """
+
+    def __init__(self, path: str, transport: Optional[Transport] = None) -> None:
+        self.path = path
+        self.transport = transport if transport is not None else AiohttpTransport()
+        self.count = 0
+        self._file = open(path, "ab")
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        headers: Mapping[str, str],
+        data: Optional[Mapping[str, str]] = None,
+        trace_request_ctx: Optional[str] = None,
+    ) -> Response:
+        started = time.monotonic()
+        response = await self.transport.request(
+            method, url, headers, data=data, trace_request_ctx=trace_request_ctx
+        )
+        body = _redact_token(response.body) if method == "POST" else response.body
+        record = {
+            "method": method,
+            "url": url,
+            "status": response.status,
+            "headers": list(response.headers.items()),
+            "length": len(body),
+            "seconds": round(time.monotonic() - started, 6),
+        }
+        self._file.write(json.dumps(record).encode() + b"\n" + body + b"\n")
+        self._file.flush()
+        self.count += 1
+        return response
+
+    async def close(self) -> None:
+        if not self._file.closed:
+            self._file.flush()
+            os.fsync(self._file.fileno())
+            self._file.close()
+        await self.transport.close()
+
+
+def _redact_token(body: bytes) -> bytes:
+    """Replaces the access token of a token response, which is a credential."""
+    try:
+        data = json.loads(body)
+    except ValueError:
+        return body
+    if not isinstance(data, dict) or "access_token" not in data:
+        return body
+    data["access_token"] = "recorded"
+    return json.dumps(data).encode()
+
+
+class _Recorded:
+    __slots__ = ("status", "headers", "data", "offset", "length", "seconds")
+
+    def __init__(
+        self,
+        status: int,
+        headers: CIMultiDictProxy,
+        data: mmap.mmap,
+        offset: int,
+        length: int,
+        seconds: float,
+    ) -> None:
+        self.status = status
+        self.headers = headers
+        self.data = data
+        self.offset = offset
+        self.length = length
+        self.seconds = seconds
+
+
+class ReplayTransport(Transport):
+    """
+    Answers requests from files written by :py:class:`RecordingTransport`, without any network.
+
+    The files are memory-mapped and indexed once; bodies are sliced out of the mapping
+    when they are served, so processes replaying the same files share their pages.
+    Requests are matched on method, path and query parameters, in any order and whatever
+    the host. Responses recorded for the same request are served in the order they were
+    recorded, starting over once they have all been served.
+
+    .. code-block:: python
+
+       # Record
+       client = Client(client_id, client_secret, transport=RecordingTransport("session.rec"))
+       # Replay
+       client = Client("replay", "replay", transport=ReplayTransport("session.rec"))
+
+    :ivar paths: Recording files.
+    :ivar latency: Wait as long as the recorded request took before answering. Default is False,
+                   which replays as fast as the client can go.
+    """
+
+    def __init__(self, *paths: str, latency: bool = False) -> None:
+        if not paths:
+            raise ValueError("At least one recording is required.")
+        self.paths = paths
+        self.latency = latency
+        self._maps: List[mmap.mmap] = []
+        self._responses: Dict[Tuple[str, str], List[_Recorded]] = {}
+        self._cycles: Dict[Tuple[str, str], itertools.cycle] = {}
+        for path in paths:
+            self._index(path)
+
+    def __len__(self) -> int:
+        """Number of recorded responses."""
+        return sum(len(responses) for responses in self._responses.values())
+
+    def _index(self, path: str) -> None:
+        with open(path, "rb") as file:
+            if os.fstat(file.fileno()).st_size == 0:
+                return
+            data = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        self._maps.append(data)
+        position = 0
+        size = len(data)
+        while position < size:
+            end = data.find(b"\n", position)
+            if end == -1:
+                break
+            try:
+                record = json.loads(data[position:end])
+            except ValueError:
+                break
+            offset = end + 1
+            position = offset + record["length"] + 1
+            if position > size:
+                break
+            key = _request_key(record["method"], record["url"])
+            self._responses.setdefault(key, []).append(
+                _Recorded(
+                    record["status"],
+                    CIMultiDictProxy(CIMultiDict(record["headers"])),
+                    data,
+                    offset,
+                    record["length"],
+                    record["seconds"],
+                )
+            )
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        headers: Mapping[str, str],
+        data: Optional[Mapping[str, str]] = None,
+        trace_request_ctx: Optional[str] = None,
+    ) -> Response:
+        key = _request_key(method, url)
+        cycle = self._cycles.get(key)
+        if cycle is None:
+            responses = self._responses.get(key)
+            if not responses:
+                raise NotRecorded(f"No response recorded for {method} {url}.")
+            cycle = self._cycles[key] = itertools.cycle(responses)
+        recorded = next(cycle)
+        if self.latency:
+            await asyncio.sleep(recorded.seconds)
+        body = recorded.data[recorded.offset : recorded.offset + recorded.length]
+        return Response(recorded.status, recorded.headers, body, method, url)
+
+    async def close(self) -> None:
+        self._responses.clear()
+        self._cycles.clear()
+        for data in self._maps:
+            data.close()
+        self._maps.clear()
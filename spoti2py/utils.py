@@ -1,10 +1,20 @@
-from typing import Dict, List, Union
+import json
+import types
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Union
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
 
 from .exceptions import InvalidItemType
+from .identity import IdentityMap
+from .markets import as_market_set
 
 
 def parse_json(
-    item_type: str, json_response: Dict, models: Dict
+    item_type: str,
+    json_response: Dict,
+    models: Dict,
+    lazy: bool = False,
+    identity_map: Optional[IdentityMap] = None,
+    market_sets: bool = False,
 ) -> Union[List[object], object]:
     """
     Maps json response to python classes.
@@ -15,6 +25,12 @@ def parse_json(
     :param models: Dictionary of classes you want to initialize with json data.
                    Keys correspond to item_type.
                    For each item_type specify main class and extra (additonal) classes.
+    :param lazy: Build the extra classes on first attribute access instead of right away.
+                 Default is False.
+    :param identity_map: Optional :py:class:`~spoti2py.identity.IdentityMap` used to share
+                         extra classes with the same Spotify ID and identical market lists.
+    :param market_sets: Return available_markets as :py:class:`~spoti2py.markets.MarketSet`
+                        instead of a list of country codes. Default is False.
     :return: List of objects or a single object.
     :rtype: Object.
     """
@@ -23,41 +39,288 @@ def parse_json(
         raise InvalidItemType(
             "Allowed item_type values are: 'tracks', 'albums', 'artists'."
         )
+    if lazy:
+        cls = lazy_class(classes)
+        if cls is not None:
+            if isinstance(json_response, list):
+                items = [cls(**obj) for obj in json_response]
+            else:
+                items = [cls(**json_response)]
+            for item in items:
+                item._identity_map = identity_map
+                item._market_sets = market_sets
+                if market_sets:
+                    convert_markets(item)
+                if identity_map is not None:
+                    identity_map.intern_attributes(item)
+            return items if isinstance(json_response, list) else items[0]
     if isinstance(json_response, list):
         items = [classes["main"](**obj) for obj in json_response]
         for item in items:
-            set_additional_classes(classes=classes, item=item)
+            set_additional_classes(
+                classes=classes,
+                item=item,
+                identity_map=identity_map,
+                market_sets=market_sets,
+            )
         return items
     else:
         item = classes["main"](**json_response)
-        set_additional_classes(classes=classes, item=item)
+        set_additional_classes(
+            classes=classes,
+            item=item,
+            identity_map=identity_map,
+            market_sets=market_sets,
+        )
         return item
 
 
-def set_additional_classes(classes: Dict, item: object) -> object:
+def set_additional_classes(
+    classes: Dict,
+    item: object,
+    identity_map: Optional[IdentityMap] = None,
+    market_sets: bool = False,
+) -> object:
     """
     Maps json objects to additional classes specified in MODELS dictionary under the key "extra".
 
     :param classes: Dictonary of classes needed to parse item_type.
     :param item: A class. E.G Artist, Album, etc.
+    :param identity_map: Optional :py:class:`~spoti2py.identity.IdentityMap`.
+    :param market_sets: Convert available_markets to :py:class:`~spoti2py.markets.MarketSet`.
     :return: Instance of item class.
     :rtype: Object.
     """
     for attr_name, cls in classes["extra"].items():
         if getattr(item, attr_name, "optional") == "optional":
             pass
-        elif isinstance(getattr(item, attr_name), list):
-            try:
-                setattr(
-                    item,
-                    attr_name,
-                    [cls(**instance) for instance in getattr(item, attr_name)],
-                )
-            except TypeError:
-                setattr(item, attr_name, None)
         else:
+            setattr(
+                item,
+                attr_name,
+                build_additional_class(
+                    cls, getattr(item, attr_name), identity_map, market_sets
+                ),
+            )
+    if market_sets:
+        convert_markets(item)
+    if identity_map is not None:
+        identity_map.intern_attributes(item)
+    return item
+
+
+def build_additional_class(
+    cls: type,
+    value: Union[Dict, List[Dict], None],
+    identity_map: Optional[IdentityMap] = None,
+    market_sets: bool = False,
+):
+    """
+    Initializes cls with a JSON object, or with each JSON object of a list.
+    With an identity_map, objects already built for the same Spotify ID are reused.
+    With market_sets, their available_markets are converted to MarketSet.
+
+    :return: Instance of cls, list of instances, or None if value doesn't fit cls.
+    """
+    try:
+        if identity_map is not None:
+            if isinstance(value, list):
+                return [
+                    identity_map.build(cls, instance, market_sets) for instance in value
+                ]
+            return identity_map.build(cls, value, market_sets)
+        if isinstance(value, list):
+            built = [cls(**instance) for instance in value]
+            if market_sets:
+                for instance in built:
+                    convert_markets(instance)
+            return built
+        built = cls(**value)
+        return convert_markets(built) if market_sets else built
+    except TypeError:
+        return None
+
+
+def convert_markets(item: object) -> object:
+    """Replaces item.available_markets, if it is a list of codes, with a MarketSet."""
+    markets = getattr(item, "available_markets", None)
+    if isinstance(markets, (list, tuple)):
+        item.available_markets = as_market_set(markets)
+    return item
+
+
+_lazy_classes: Dict[tuple, type] = {}
+
+
+def lazy_class(classes: Dict) -> Union[type, None]:
+    """
+    Returns a subclass of classes["main"] that builds its extra classes on first access.
+
+    Attributes listed under classes["extra"] keep their raw JSON until they are read,
+    are then converted exactly like set_additional_classes would, and the result
+    is stored so the conversion happens once.
+    Returns None if the main class has no slot for some extra attribute.
+    Instances pickle and copy as fully built instances of the main class.
+
+    :param classes: Dictonary of classes needed to parse item_type.
+    :rtype: type
+    """
+    main = classes["main"]
+    key = (main, tuple(classes["extra"].items()))
+    if key in _lazy_classes:
+        return _lazy_classes[key]
+
+    namespace = {
+        "__slots__": ("_identity_map", "_market_sets"),
+        "__reduce__": _reduce_lazy,
+    }
+    for attr_name, cls in classes["extra"].items():
+        slot = getattr(main, attr_name, None)
+        if not isinstance(slot, types.MemberDescriptorType):
+            _lazy_classes[key] = None
+            return None
+        namespace[attr_name] = _hydrating_property(slot, cls)
+    lazy = type(main.__name__, (main,), namespace)
+    lazy.__qualname__ = f"Lazy{main.__qualname__}"
+    _lazy_classes[key] = lazy
+    return lazy
+
+
+def _reduce_lazy(self) -> tuple:
+    # The lazy class only exists in _lazy_classes, where pickle can't find it.
+    main = type(self).__mro__[1]
+    state = {}
+    for cls in main.__mro__:
+        for name in cls.__dict__.get("__slots__", ()):
             try:
-                setattr(item, attr_name, cls(**getattr(item, attr_name)))
-            except TypeError:
-                setattr(item, attr_name, None)
+                state[name] = getattr(self, name)
+            except AttributeError:
+                pass
+    return _unpickle_lazy, (main, state)
+
+
+def _unpickle_lazy(main: type, state: Dict[str, Any]) -> object:
+    item = main.__new__(main)
+    for name, value in state.items():
+        setattr(item, name, value)
     return item
+
+
+def _hydrating_property(slot: types.MemberDescriptorType, cls: type) -> property:
+    def get(self):
+        value = slot.__get__(self)
+        if isinstance(value, dict) or (
+            isinstance(value, list) and value and isinstance(value[0], dict)
+        ):
+            value = build_additional_class(
+                cls, value, self._identity_map, self._market_sets
+            )
+            slot.__set__(self, value)
+        return value
+
+    def set(self, value):
+        slot.__set__(self, value)
+
+    return property(get, set)
+
+
+def chunked(items: Sequence, size: int) -> Iterator[Sequence]:
+    """
+    Splits a sequence into consecutive chunks of at most size items.
+
+    :param items: Sequence to split.
+    :param size: Maximum length of a chunk.
+    :return: Iterator over chunks, in order.
+    """
+    for start in range(0, len(items), size):
+        yield items[start : start + size]
+
+
+def normalize_endpoint(endpoint: str) -> str:
+    """
+    Normalizes an endpoint URL so equivalent requests compare equal.
+    Scheme and host are lowercased, trailing slashes dropped and query parameters sorted.
+
+    :param endpoint: Absolute URL.
+    :return: Normalized URL.
+    :rtype: str
+    """
+    parts = urlsplit(endpoint)
+    query = urlencode(sorted(parse_qsl(parts.query, keep_blank_values=True)))
+    return urlunsplit(
+        (parts.scheme.lower(), parts.netloc.lower(), parts.path.rstrip("/"), query, "")
+    )
+
+
+def default_json_loads() -> Callable[[bytes], Any]:
+    """
+    Returns the fastest JSON decoder available.
+    orjson if it is installed, then msgspec, then the standard library json module.
+    """
+    try:
+        import orjson
+
+        return orjson.loads
+    except ImportError:
+        pass
+    try:
+        import msgspec
+
+        return msgspec.json.decode
+    except ImportError:
+        return json.loads
+
+
+def default_json_dumps() -> Callable[[Any], bytes]:
+    """
+    Returns the fastest JSON encoder available, producing bytes.
+    orjson if it is installed, then msgspec, then the standard library json module.
+    """
+    try:
+        import orjson
+
+        return orjson.dumps
+    except ImportError:
+        pass
+    try:
+        import msgspec
+
+        return msgspec.json.encode
+    except ImportError:
+        return lambda value: json.dumps(value, separators=(",", ":")).encode()
+
+
+def import_numpy():
+    """Imports NumPy, which the array based helpers need but spoti2py doesn't depend on."""
+    try:
+        import numpy
+    except ImportError:
+        raise ImportError(
+            "NumPy is required for this feature. Install it with 'pip install spoti2py[numpy]'."
+        ) from None
+    return numpy
+
+
+_UNDECODED = object()
+
+
+class Payload:
+    """
+    Body of a JSON response, decoded at most once and only when data is first read.
+
+    :ivar body: Response body, untouched.
+    """
+
+    __slots__ = ("body", "_loads", "_data")
+
+    def __init__(self, body: bytes, loads: Callable[[bytes], Any]) -> None:
+        self.body = body
+        self._loads = loads
+        self._data = _UNDECODED
+
+    @property
+    def data(self) -> Any:
+        """Decoded JSON response."""
+        if self._data is _UNDECODED:
+            self._data = self._loads(self.body)
+        return self._data
@@ -0,0 +1,153 @@
+import asyncio
+import inspect
+import json
+import time
+from typing import Callable, List, Mapping, Optional, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+import pytest
+from multidict import CIMultiDict, CIMultiDictProxy
+
+from benchmarks import fixtures
+from spoti2py.client import Client
+from spoti2py.transport import Response, Transport
+
+# (status, body, headers) of a fake response.
+Answer = Tuple[int, bytes, Mapping[str, str]]
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_pyfunc_call(pyfuncitem):
+    """Runs async test functions on a new event loop."""
+    if inspect.iscoroutinefunction(pyfuncitem.obj):
+        names = pyfuncitem._fixtureinfo.argnames
+        asyncio.run(
+            pyfuncitem.obj(**{name: pyfuncitem.funcargs[name] for name in names})
+        )
+        return True
+    return None
+
+
+def answer(
+    data, status: int = 200, headers: Optional[Mapping[str, str]] = None
+) -> Answer:
+    return status, json.dumps(data).encode(), headers or {}
+
+
+def error(status: int, headers: Optional[Mapping[str, str]] = None) -> Answer:
+    return answer({"error": {"status": status, "message": "fake"}}, status, headers)
+
+
+def _number(id: str) -> int:
+    return int(id[2:])
+
+
+def serve_fixtures(url: str, headers: Mapping[str, str]) -> Answer:
+    """
+    Answers like the Spotify Web API with the payloads of benchmarks.fixtures.
+    IDs starting with "missing" don't exist.
+    """
+    parts = urlsplit(url)
+    path = parts.path.split("/")[2:]
+    query = {name: values[0] for name, values in parse_qs(parts.query).items()}
+    builders = {
+        "tracks": fixtures.track,
+        "albums": fixtures.album,
+        "artists": fixtures.artist,
+    }
+    kind = path[0]
+    if kind in builders and len(path) == 1:
+        return answer(
+            {
+                kind: [
+                    None if id.startswith("missing") else builders[kind](_number(id))
+                    for id in query["ids"].split(",")
+                ]
+            }
+        )
+    if kind in builders and len(path) == 2:
+        if path[1].startswith("missing"):
+            return error(404)
+        return answer(builders[kind](_number(path[1])))
+    if kind == "artists" and path[2] == "related-artists":
+        return answer({"artists": []})
+    return error(404)
+
+
+class FakeTransport(Transport):
+    """
+    Answers GET requests with handler(url, headers) and token requests with a fixed token.
+    handler may be a coroutine function. Every GET request is recorded.
+
+    :ivar handler: Callable returning (status, body, headers). Default is serve_fixtures.
+    :ivar latency: Seconds every request takes. Default is 0.
+    :ivar requests: URL of every GET request, in the order they were sent.
+    :ivar sent_at: time.monotonic() at which every GET request was sent.
+    :ivar headers: Headers of every GET request.
+    :ivar tokens: Number of token requests.
+    """
+
+    def __init__(
+        self,
+        handler: Callable[[str, Mapping[str, str]], Answer] = serve_fixtures,
+        latency: float = 0.0,
+        expires_in: int = 3600,
+    ) -> None:
+        self.handler = handler
+        self.latency = latency
+        self.expires_in = expires_in
+        self.requests: List[str] = []
+        self.sent_at: List[float] = []
+        self.headers: List[Mapping[str, str]] = []
+        self.tokens = 0
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        headers: Mapping[str, str],
+        data: Optional[Mapping[str, str]] = None,
+        trace_request_ctx: Optional[str] = None,
+    ) -> Response:
+        if method == "POST":
+            self.tokens += 1
+            if self.latency:
+                await asyncio.sleep(self.latency)
+            status, body, response_headers = answer(
+                {
+                    "access_token": f"token-{self.tokens}",
+                    "token_type": "Bearer",
+                    "expires_in": self.expires_in,
+                }
+            )
+        else:
+            self.requests.append(url)
+            self.sent_at.append(time.monotonic())
+            self.headers.append(dict(headers))
+            if self.latency:
+                await asyncio.sleep(self.latency)
+            result = self.handler(url, headers)
+            if inspect.isawaitable(result):
+                result = await result
+            status, body, response_headers = result
+        return Response(
+            status, CIMultiDictProxy(CIMultiDict(response_headers)), body, method, url
+        )
+
+
+@pytest.fixture
+def transport() -> FakeTransport:
+    return FakeTransport()
+
+
+@pytest.fixture
+def make_client(transport: FakeTransport) -> Callable[..., Client]:
+    """Creates clients talking to the transport fixture unless given another one."""
+
+    def make(**kwargs) -> Client:
+        kwargs.setdefault("transport", transport)
+        kwargs.setdefault("token_refresh_margin", None)
+        kwargs.setdefault("profile", False)
+        return Client("client-id", "client-secret", **kwargs)
+
+    return make
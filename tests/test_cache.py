@@ -0,0 +1,70 @@
+from conftest import FakeTransport, serve_fixtures
+
+from benchmarks.fixtures import spotify_id
+from spoti2py.cache import ResponseCache
+
+ETAG = '"v1"'
+
+
+def etag_handler(url, headers):
+    if headers.get("If-None-Match") == ETAG:
+        return 304, b"", {"ETag": ETAG}
+    status, body, _ = serve_fixtures(url, headers)
+    return status, body, {"ETag": ETAG, "Cache-Control": "max-age=0"}
+
+
+async def test_fresh_entries_are_served_without_a_request(make_client, transport):
+    cache = ResponseCache()
+    client = make_client(cache=cache)
+    id = spotify_id("track", 1)
+
+    first = await client.get_track(id)
+    second = await client.get_track(id)
+
+    assert first.id == second.id == id
+    assert len(transport.requests) == 1
+    assert cache.hits == 1
+
+
+async def test_stale_entries_are_revalidated_with_their_etag(make_client):
+    transport = FakeTransport(etag_handler)
+    cache = ResponseCache()
+    client = make_client(transport=transport, cache=cache)
+    id = spotify_id("track", 1)
+
+    first = await client.get_track(id)
+    second = await client.get_track(id)
+    third = await client.get_track(id)
+
+    assert first.id == second.id == third.id == id
+    assert "If-None-Match" not in transport.headers[0]
+    assert transport.headers[1]["If-None-Match"] == ETAG
+    # The 304 made the entry fresh again, so the third call didn't go out.
+    assert len(transport.requests) == 2
+    assert cache.revalidations == 1
+
+
+async def test_no_store_responses_are_not_cached(make_client):
+    def handler(url, headers):
+        status, body, _ = serve_fixtures(url, headers)
+        return status, body, {"Cache-Control": "no-store"}
+
+    transport = FakeTransport(handler)
+    cache = ResponseCache()
+    client = make_client(transport=transport, cache=cache)
+
+    await client.get_track(spotify_id("track", 1))
+    await client.get_track(spotify_id("track", 1))
+
+    assert len(transport.requests) == 2
+    assert len(cache) == 0
+
+
+def test_least_recently_used_entry_is_evicted():
+    cache = ResponseCache(max_size=2)
+    for name in ("a", "b", "c"):
+        cache.store(cache.key(f"https://api.spotify.com/v1/tracks/{name}"), None, {})
+
+    assert len(cache) == 2
+    assert cache.evictions == 1
+    assert cache.lookup(cache.key("https://api.spotify.com/v1/tracks/a")) is None
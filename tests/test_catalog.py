@@ -0,0 +1,108 @@
+import asyncio
+import json
+
+import pytest
+from conftest import FakeTransport
+
+from benchmarks.fixtures import spotify_id
+from spoti2py.catalog import MAX_LOAD, CatalogStore
+
+
+def body(i: int) -> bytes:
+    return json.dumps({"id": spotify_id("track", i), "n": i}).encode()
+
+
+def test_index_grows_and_keeps_every_payload(tmp_path):
+    path = str(tmp_path / "catalog")
+    with CatalogStore(path, capacity=16) as store:
+        store.put_many(
+            "tracks", [(spotify_id("track", i), body(i)) for i in range(100)]
+        )
+
+        assert store.capacity > 16
+        assert len(store) / store.capacity <= MAX_LOAD
+        assert len(store) == 100
+        for i in range(100):
+            assert bytes(store.get("tracks", spotify_id("track", i))) == body(i)
+
+
+def test_storing_an_id_again_replaces_its_payload(tmp_path):
+    with CatalogStore(str(tmp_path / "catalog")) as store:
+        store.put("tracks", "a", b'{"v": 1}')
+        store.put("tracks", "a", b'{"v": 2}')
+
+        assert len(store) == 1
+        assert bytes(store.get("tracks", "a")) == b'{"v": 2}'
+        assert store.get("albums", "a") is None
+
+
+def test_readonly_reopen_sees_every_payload(tmp_path):
+    path = str(tmp_path / "catalog")
+    with CatalogStore(path, capacity=16) as store:
+        for i in range(40):
+            store.put("tracks", spotify_id("track", i), body(i))
+
+    with CatalogStore(path, readonly=True) as store:
+        assert len(store) == 40
+        assert sorted(id for _, id in store.keys()) == [
+            spotify_id("track", i) for i in range(40)
+        ]
+        assert bytes(store.get("tracks", spotify_id("track", 39))) == body(39)
+        with pytest.raises(PermissionError):
+            store.put("tracks", "x", b"{}")
+
+
+def test_readonly_store_sees_later_writes(tmp_path):
+    path = str(tmp_path / "catalog")
+    writer = CatalogStore(path, capacity=16)
+    reader = CatalogStore(path, readonly=True)
+    try:
+        writer.put_many(
+            "tracks", [(spotify_id("track", i), body(i)) for i in range(50)]
+        )
+
+        assert bytes(reader.get("tracks", spotify_id("track", 49))) == body(49)
+    finally:
+        reader.close()
+        writer.close()
+
+
+def test_stale_payloads_are_not_served(tmp_path):
+    with CatalogStore(str(tmp_path / "catalog"), max_ages={"tracks": 0}) as store:
+        store.put("tracks", "a", b"{}")
+        store.put("artists", "a", b"{}")
+
+        assert store.get("tracks", "a") is None
+        assert store.get("artists", "a") is not None
+
+
+async def test_client_serves_catalog_hits_without_a_request(
+    make_client, transport, tmp_path
+):
+    catalog = CatalogStore(str(tmp_path / "catalog"))
+    client = make_client(catalog=catalog)
+    ids = [spotify_id("track", i) for i in range(3)]
+
+    await client.get_tracks(ids)
+    tracks = await client.get_tracks(ids)
+    track = await client.get_track(ids[0])
+
+    assert [track.id for track in tracks] == ids
+    assert track.id == ids[0]
+    assert len(transport.requests) == 1
+    catalog.close()
+
+
+async def test_concurrent_callers_store_a_shared_response_once(make_client, tmp_path):
+    id = spotify_id("track", 1)
+    sizes = []
+    for callers in (1, 5):
+        path = str(tmp_path / f"catalog-{callers}")
+        catalog = CatalogStore(path)
+        client = make_client(transport=FakeTransport(latency=0.02), catalog=catalog)
+        await asyncio.gather(*(client.get_track(id) for _ in range(callers)))
+        catalog.close()
+        with open(f"{path}.data", "rb") as data:
+            sizes.append(len(data.read()))
+
+    assert sizes[0] == sizes[1]
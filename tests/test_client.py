@@ -0,0 +1,331 @@
+import asyncio
+import time
+
+import pytest
+from conftest import FakeTransport, error, serve_fixtures
+
+from benchmarks.fixtures import spotify_id
+from spoti2py.exceptions import SpotifyException
+from spoti2py.models import Track
+from spoti2py.ratelimit import AdaptiveConcurrency
+from spoti2py.retry import RetryPolicy
+
+
+class FixedBackoff(RetryPolicy):
+    def __init__(self, max_attempts: int, delay: float) -> None:
+        super().__init__(max_attempts=max_attempts)
+        self.delay = delay
+
+    def backoff(self, attempt: int) -> float:
+        return self.delay
+
+
+def track_ids(count: int, start: int = 0):
+    return [spotify_id("track", i) for i in range(start, start + count)]
+
+
+# Batching
+
+
+async def test_batches_keep_order_and_fill_missing_ids_with_none(
+    make_client, transport
+):
+    ids = track_ids(120)
+    ids[7] = "missing0000000000000"
+    client = make_client()
+
+    tracks = await client.get_tracks(ids)
+
+    assert len(transport.requests) == 3
+    assert [track.id if track else None for track in tracks] == [
+        None if id.startswith("missing") else id for id in ids
+    ]
+    assert tracks[7] is None
+
+
+async def test_duplicate_ids_are_requested_once(make_client, transport):
+    ids = track_ids(3) * 40
+    client = make_client()
+
+    tracks = await client.get_tracks(ids)
+
+    assert len(transport.requests) == 1
+    assert transport.requests[0].count(spotify_id("track", 0)) == 1
+    assert [track.id for track in tracks] == ids
+
+
+# Token
+
+
+async def test_concurrent_calls_refresh_the_token_once(make_client):
+    transport = FakeTransport(latency=0.02)
+    client = make_client(transport=transport)
+
+    await asyncio.gather(*(client.get_track(id) for id in track_ids(10)))
+
+    assert transport.tokens == 1
+    assert {headers["Authorization"] for headers in transport.headers} == {
+        "Bearer token-1"
+    }
+
+
+async def test_expired_token_is_renewed(make_client, transport):
+    client = make_client()
+    await client.get_track(spotify_id("track", 1))
+    client.access_token_expires = client.access_token_expires.replace(year=2000)
+
+    await client.get_track(spotify_id("track", 2))
+
+    assert transport.tokens == 2
+    assert transport.headers[-1]["Authorization"] == "Bearer token-2"
+
+
+def test_negative_token_refresh_margin_is_rejected(make_client):
+    with pytest.raises(ValueError):
+        make_client(token_refresh_margin=-1)
+
+
+async def test_token_refresh_margin_is_capped_at_half_the_token_lifetime(make_client):
+    client = make_client(
+        transport=FakeTransport(expires_in=10), token_refresh_margin=60
+    )
+
+    await client.refresh_access_token()
+
+    assert client._token_refresh_margin() == 5
+
+
+async def test_background_token_refresh_keeps_going_after_a_failure(
+    make_client, caplog
+):
+    transport = FakeTransport(expires_in=1)
+    client = make_client(
+        transport=transport,
+        token_refresh_margin=60,
+        retry_policy=FixedBackoff(max_attempts=3, delay=0.05),
+    )
+    await client.get_track(spotify_id("track", 1))
+    authenticate = client.authenticate
+    failures = []
+
+    async def fail_once():
+        if not failures:
+            failures.append(True)
+            raise SpotifyException(400, client.token_url, "invalid_client")
+        return await authenticate()
+
+    client.authenticate = fail_once
+    await asyncio.sleep(1.2)
+
+    assert failures
+    assert "Background token refresh failed" in caplog.text
+    assert transport.tokens == 2
+    assert not client._token_refresh_task.done()
+
+
+# Coalescing
+
+
+async def test_identical_concurrent_requests_are_coalesced(make_client):
+    transport = FakeTransport(latency=0.02)
+    client = make_client(transport=transport)
+    id = spotify_id("track", 1)
+
+    tracks = await asyncio.gather(*(client.get_track(id) for _ in range(5)))
+
+    assert len(transport.requests) == 1
+    assert all(track.id == id for track in tracks)
+    assert not client._in_flight
+
+
+async def test_cancelled_caller_does_not_cancel_the_shared_request(make_client):
+    transport = FakeTransport(latency=0.05)
+    client = make_client(transport=transport)
+    id = spotify_id("track", 1)
+
+    first = asyncio.ensure_future(client.get_track(id))
+    second = asyncio.ensure_future(client.get_track(id))
+    await asyncio.sleep(0.01)
+    first.cancel()
+
+    assert (await second).id == id
+    assert first.cancelled()
+    assert len(transport.requests) == 1
+
+
+async def test_caller_deadline_does_not_apply_to_other_callers(make_client):
+    transport = FakeTransport(latency=0.05)
+    client = make_client(transport=transport)
+    id = spotify_id("track", 1)
+
+    short = asyncio.ensure_future(client.get_track(id, deadline=0.01))
+    patient = asyncio.ensure_future(client.get_track(id))
+
+    with pytest.raises(TimeoutError):
+        await short
+    assert (await patient).id == id
+    assert len(transport.requests) == 1
+
+
+async def test_shared_request_is_cancelled_when_every_caller_leaves(make_client):
+    async def slow(url, headers):
+        await asyncio.sleep(1)
+        return serve_fixtures(url, headers)
+
+    client = make_client(transport=FakeTransport(slow))
+    id = spotify_id("track", 1)
+    callers = [asyncio.ensure_future(client.get_track(id)) for _ in range(2)]
+    await asyncio.sleep(0.01)
+    (shared,) = client._in_flight.values()
+
+    callers[0].cancel()
+    await asyncio.sleep(0)
+    assert not shared.task.done()
+    callers[1].cancel()
+    await asyncio.gather(*callers, return_exceptions=True)
+    await asyncio.sleep(0)
+
+    assert shared.task.cancelled()
+    assert not client._in_flight
+
+
+async def test_shared_request_stops_retrying_at_the_latest_deadline(make_client):
+    transport = FakeTransport(lambda url, headers: error(503))
+    client = make_client(
+        transport=transport,
+        retry_policy=FixedBackoff(max_attempts=100, delay=0.02),
+    )
+    id = spotify_id("track", 1)
+
+    results = await asyncio.gather(
+        client.get_track(id, deadline=0.05),
+        client.get_track(id, deadline=0.15),
+        return_exceptions=True,
+    )
+    sent = len(transport.requests)
+    await asyncio.sleep(0.1)
+
+    assert all(isinstance(result, TimeoutError) for result in results)
+    # About one request per backoff until the later deadline, then nothing more.
+    assert 3 <= sent <= 9
+    assert len(transport.requests) == sent
+    assert not client._in_flight
+
+
+async def test_coalescing_can_be_disabled(make_client):
+    transport = FakeTransport(latency=0.01)
+    client = make_client(transport=transport, coalesce_requests=False)
+    id = spotify_id("track", 1)
+
+    await asyncio.gather(*(client.get_track(id) for _ in range(3)))
+
+    assert len(transport.requests) == 3
+
+
+# Rate limiting
+
+
+async def test_429_pauses_every_request_and_decreases_concurrency(make_client):
+    throttled_at = []
+
+    def handler(url, headers):
+        if not throttled_at:
+            throttled_at.append(time.monotonic())
+            return error(429, {"Retry-After": "0.1"})
+        return serve_fixtures(url, headers)
+
+    transport = FakeTransport(handler, latency=0.01)
+    concurrency = AdaptiveConcurrency(initial=8, cooldown=10)
+    client = make_client(transport=transport, concurrency=concurrency)
+
+    tracks = await asyncio.gather(*(client.get_track(id) for id in track_ids(4)))
+
+    assert all(isinstance(track, Track) for track in tracks)
+    # Every request but the throttled one went out before it was answered or after the pause.
+    resent = [sent for sent in transport.sent_at if sent > throttled_at[0] + 0.011]
+    assert resent and min(resent) >= throttled_at[0] + 0.1
+    # Halved once, then grown a little by the successful responses.
+    assert 4 <= concurrency.limit < 6
+
+
+def test_429_responses_count_as_one_congestion_signal_per_cooldown():
+    concurrency = AdaptiveConcurrency(initial=16, cooldown=10)
+    concurrency.on_throttle()
+    concurrency.on_throttle()
+
+    assert concurrency.limit == 8
+
+
+# Retries
+
+
+async def test_transient_errors_are_retried(make_client):
+    calls = []
+
+    def handler(url, headers):
+        calls.append(url)
+        if len(calls) < 3:
+            return error(503)
+        return serve_fixtures(url, headers)
+
+    client = make_client(
+        transport=FakeTransport(handler),
+        retry_policy=RetryPolicy(max_attempts=3, backoff_base=0.001),
+    )
+
+    track = await client.get_track(spotify_id("track", 1))
+
+    assert track.id == spotify_id("track", 1)
+    assert len(calls) == 3
+
+
+async def test_client_errors_are_not_retried(make_client):
+    transport = FakeTransport(lambda url, headers: error(400))
+    client = make_client(transport=transport)
+
+    with pytest.raises(SpotifyException):
+        await client.get_track(spotify_id("track", 1))
+    assert len(transport.requests) == 1
+
+
+async def test_retries_stop_at_the_deadline(make_client):
+    transport = FakeTransport(lambda url, headers: error(503), latency=0.01)
+    client = make_client(
+        transport=transport,
+        retry_policy=RetryPolicy(max_attempts=100, backoff_base=0.02, backoff_max=0.02),
+    )
+
+    started = time.monotonic()
+    with pytest.raises(TimeoutError):
+        await client.get_track(spotify_id("track", 1), deadline=0.1)
+
+    assert time.monotonic() - started < 0.2
+    assert len(transport.requests) < 100
+
+
+@pytest.mark.parametrize("coalesce_requests", [True, False])
+async def test_deadline_too_close_to_retry_raises_timeout_error(
+    make_client, coalesce_requests
+):
+    transport = FakeTransport(lambda url, headers: error(503))
+    client = make_client(
+        transport=transport,
+        coalesce_requests=coalesce_requests,
+        retry_policy=FixedBackoff(max_attempts=3, delay=1),
+    )
+
+    started = time.monotonic()
+    with pytest.raises(TimeoutError):
+        await client.get_track(spotify_id("track", 1), deadline=0.5)
+
+    # Raised right away instead of sleeping until the deadline.
+    assert time.monotonic() - started < 0.1
+    assert len(transport.requests) == 1
+
+
+async def test_not_found_single_resource_raises(make_client):
+    client = make_client()
+
+    with pytest.raises(SpotifyException) as raised:
+        await client.get_track("missing0000000000000")
+    assert raised.value.status_code == 404
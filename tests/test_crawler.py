@@ -0,0 +1,97 @@
+from urllib.parse import urlsplit
+
+import pytest
+from conftest import FakeTransport, answer, error
+
+from benchmarks import fixtures
+from spoti2py.crawler import ArtistCrawler
+from spoti2py.exceptions import SpotifyException
+from spoti2py.retry import RetryPolicy
+
+SEED = fixtures.spotify_id("artist", 1)
+
+
+def related(number: int):
+    """Every artist n is related to 2n and 2n + 1."""
+    return answer(
+        {"artists": [fixtures.artist(2 * number), fixtures.artist(2 * number + 1)]}
+    )
+
+
+def artist_number(url: str) -> int:
+    return int(urlsplit(url).path.split("/")[3][2:])
+
+
+def graph_handler(url, headers):
+    return related(artist_number(url))
+
+
+def edges(crawler: ArtistCrawler):
+    return sorted(
+        (crawler.ids[source], crawler.ids[target])
+        for source, target in zip(crawler.sources, crawler.targets)
+    )
+
+
+async def test_crawl_is_breadth_first_and_bounded_by_depth(make_client):
+    client = make_client(transport=FakeTransport(graph_handler))
+
+    crawler = await ArtistCrawler(client, [SEED], max_depth=3).run()
+
+    assert crawler.done
+    assert len(crawler) == 15
+    assert list(crawler.depths) == [0, 1, 1, 2, 2, 2, 2, 3, 3, 3, 3, 3, 3, 3, 3]
+    assert len(crawler.sources) == 14
+
+
+async def test_crawl_resumes_from_its_checkpoint(make_client, tmp_path):
+    checkpoint = str(tmp_path / "graph")
+    failing = fixtures.spotify_id("artist", 5)
+
+    def flaky(url, headers):
+        if f"/{failing}/" in url:
+            return error(500)
+        return graph_handler(url, headers)
+
+    client = make_client(
+        transport=FakeTransport(flaky), retry_policy=RetryPolicy(max_attempts=1)
+    )
+    first = ArtistCrawler(
+        client, [SEED], max_depth=3, max_concurrency=1, checkpoint=checkpoint
+    )
+    with pytest.raises(SpotifyException):
+        await first.run()
+    assert not first.done
+
+    transport = FakeTransport(graph_handler)
+    resumed = ArtistCrawler(
+        make_client(transport=transport),
+        [SEED],
+        max_depth=3,
+        checkpoint=checkpoint,
+    )
+    assert len(resumed) == len(first)
+    await resumed.run()
+
+    expected = await ArtistCrawler(
+        make_client(transport=FakeTransport(graph_handler)), [SEED], max_depth=3
+    ).run()
+    assert resumed.done
+    assert sorted(resumed.ids) == sorted(expected.ids)
+    assert edges(resumed) == edges(expected)
+    # Artists expanded before the failure weren't fetched again.
+    assert len(transport.requests) < 7
+
+
+async def test_unknown_artists_are_skipped(make_client):
+    def handler(url, headers):
+        if artist_number(url) == 2:
+            return error(404)
+        return graph_handler(url, headers)
+
+    client = make_client(transport=FakeTransport(handler))
+
+    crawler = await ArtistCrawler(client, [SEED], max_depth=2).run()
+
+    assert crawler.done
+    assert len(crawler) == 5
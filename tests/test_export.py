@@ -0,0 +1,68 @@
+import json
+
+import pytest
+
+from benchmarks import fixtures
+from spoti2py.export import NDJSONWriter, NPZWriter, export, to_json
+from spoti2py.models import Track
+
+np = pytest.importorskip("numpy")
+
+
+def tracks(count: int):
+    return [Track(**fixtures.track(i)) for i in range(count)]
+
+
+async def test_export_writes_ndjson_lines_and_skips_none(tmp_path):
+    path = str(tmp_path / "tracks.ndjson")
+
+    count = await export([*tracks(3), None], NDJSONWriter(path, chunk_size=2))
+
+    with open(path, encoding="utf-8") as file:
+        lines = [json.loads(line) for line in file]
+    assert count == 3
+    assert [line["id"] for line in lines] == [
+        fixtures.spotify_id("track", i) for i in range(3)
+    ]
+    assert lines[0] == to_json(tracks(1)[0])
+
+
+async def test_export_writes_npz_shards_of_chunk_size(tmp_path):
+    directory = str(tmp_path / "shards")
+
+    async def items():
+        for track in tracks(5):
+            yield track
+
+    with NPZWriter(directory, chunk_size=2) as writer:
+        await export(items(), writer)
+
+    shards = [
+        np.load(str(tmp_path / "shards" / f"shard-{n:05d}.npz")) for n in range(3)
+    ]
+    assert writer.shards == 3
+    assert [len(shard["id"]) for shard in shards] == [2, 2, 1]
+    ids = np.concatenate([shard["id"] for shard in shards])
+    assert list(ids) == [fixtures.spotify_id("track", i) for i in range(5)]
+    assert list(shards[0]["popularity"]) == [0, 1]
+    assert shards[0]["album_id"][0] == fixtures.spotify_id("album", 0)
+
+
+def test_npz_missing_values_use_column_defaults(tmp_path):
+    directory = str(tmp_path / "shards")
+    with NPZWriter(directory) as writer:
+        writer.write({"id": "a", "artists": []})
+
+    shard = np.load(str(tmp_path / "shards" / "shard-00000.npz"))
+    assert shard["duration_ms"][0] == -1
+    assert shard["artist_id"][0] == ""
+    assert not shard["explicit"][0]
+
+
+def test_npz_writer_continues_numbering_existing_shards(tmp_path):
+    directory = str(tmp_path / "shards")
+    for _ in range(2):
+        with NPZWriter(directory) as writer:
+            writer.write(tracks(1)[0])
+
+    assert writer.shards == 2
@@ -0,0 +1,47 @@
+import pytest
+
+from spoti2py.markets import (
+    MarketSet,
+    as_market_set,
+    filter_by_market,
+    market_mask,
+    market_matrix,
+)
+
+np = pytest.importorskip("numpy")
+
+
+class Item:
+    def __init__(self, available_markets):
+        self.available_markets = available_markets
+
+
+def test_lists_with_unknown_codes_stay_lists():
+    assert as_market_set(["US", "ZZ"]) == ["US", "ZZ"]
+    assert as_market_set(["US", "SE"]) == MarketSet.from_codes(["US", "SE"])
+
+
+def test_matrix_skips_unknown_codes():
+    items = [
+        Item(as_market_set(["US", "ZZ"])),
+        Item(as_market_set(["US", "SE"])),
+        Item(None),
+    ]
+
+    matrix = market_matrix(items)
+
+    assert MarketSet.from_bytes(matrix[0].tobytes()) == MarketSet.from_codes(["US"])
+    assert not matrix[2].any()
+
+
+def test_mask_agrees_with_filter_by_market_for_unknown_codes():
+    items = [
+        Item(as_market_set(["US", "ZZ"])),
+        Item(as_market_set(["SE", "ZZ"])),
+        Item(as_market_set(["US", "SE"])),
+    ]
+
+    mask = market_mask(items, "US")
+
+    assert mask.tolist() == [True, False, True]
+    assert [items[i] for i in np.flatnonzero(mask)] == filter_by_market(items, "US")
@@ -0,0 +1,87 @@
+import asyncio
+from urllib.parse import parse_qsl, urlsplit
+
+import pytest
+
+from spoti2py.pagination import fetch_all_pages, paginate, with_offset
+
+TOTAL = 10
+LIMIT = 2
+
+
+def page(endpoint: str):
+    query = dict(parse_qsl(urlsplit(endpoint).query))
+    offset, limit = int(query["offset"]), int(query["limit"])
+    next = None
+    if offset + limit < TOTAL:
+        next = with_offset(endpoint, offset + limit, limit)
+    return {
+        "items": list(range(offset, min(offset + limit, TOTAL))),
+        "limit": limit,
+        "offset": offset,
+        "total": TOTAL,
+        "next": next,
+    }
+
+
+class Pages:
+    """get_page recording the offset of every page requested."""
+
+    def __init__(self) -> None:
+        self.requested = []
+
+    async def __call__(self, endpoint: str):
+        self.requested.append(page(endpoint)["offset"])
+        await asyncio.sleep(0)
+        return page(endpoint)
+
+
+FIRST = with_offset("https://api.spotify.com/v1/albums/x/tracks", 0, LIMIT)
+
+
+async def test_paginate_follows_next_links_in_order():
+    items = [item async for page in paginate(Pages(), FIRST) for item in page["items"]]
+
+    assert items == list(range(TOTAL))
+
+
+async def test_paginate_prefetches_at_most_max_buffered_pages():
+    get_page = Pages()
+    pages = paginate(get_page, FIRST, max_buffered_pages=2)
+
+    first = await pages.__anext__()
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+    assert first["offset"] == 0
+    # The first page was handed out, so two more were downloaded ahead and no further.
+    assert get_page.requested == [0, 2, 4]
+    await pages.aclose()
+
+
+async def test_paginate_raises_the_error_of_a_failed_page():
+    async def get_page(endpoint: str):
+        if "offset=4" in endpoint:
+            raise RuntimeError("page failed")
+        return page(endpoint)
+
+    seen = []
+    with pytest.raises(RuntimeError):
+        async for result in paginate(get_page, FIRST):
+            seen.append(result["offset"])
+    assert seen == [0, 2]
+
+
+async def test_fetch_all_pages_requests_known_offsets():
+    get_page = Pages()
+
+    pages = await fetch_all_pages(get_page, FIRST, max_concurrency=3)
+
+    assert [page["offset"] for page in pages] == [0, 2, 4, 6, 8]
+    assert sorted(get_page.requested) == [0, 2, 4, 6, 8]
+
+
+async def test_fetch_all_pages_stops_at_max_total():
+    pages = await fetch_all_pages(Pages(), FIRST, max_total=5)
+
+    assert [item for page in pages for item in page["items"]] == [0, 1, 2, 3, 4]
@@ -0,0 +1,66 @@
+import asyncio
+import time
+
+from conftest import FakeTransport, error, serve_fixtures
+
+import spoti2py.client
+from benchmarks.fixtures import spotify_id
+from spoti2py.models import Track
+
+
+async def test_iterators_are_profiled_as_one_call(make_client):
+    client = make_client(profile=True)
+    ids = [spotify_id("track", i) for i in range(120)]
+
+    tracks = [
+        track async for track in client.iter_several_resources(ids, batch_size=50)
+    ]
+
+    assert len(tracks) == 120
+    profile = client.profiler.methods["iter_several_resources"]
+    assert profile.calls == 1
+    assert profile.models > 0
+    assert "get_several_resources" not in client.profiler.methods
+
+
+async def test_time_spent_consuming_an_iterator_is_not_profiled(make_client):
+    client = make_client(profile=True)
+    ids = [spotify_id("track", i) for i in range(3)]
+
+    async for _ in client.iter_several_resources(ids):
+        await asyncio.sleep(0.05)
+
+    assert client.profiler.methods["iter_several_resources"].total < 0.05
+
+
+async def test_album_tracks_count_as_building_models(make_client, monkeypatch):
+    class SlowTrack(Track):
+        def __init__(self, **kwargs):
+            time.sleep(0.002)
+            super().__init__(**kwargs)
+
+    monkeypatch.setattr(spoti2py.client, "Track", SlowTrack)
+    client = make_client(profile=True)
+
+    await client.get_album(spotify_id("album", 1))
+
+    assert client.profiler.methods["get_album"].models >= 12 * 0.002
+
+
+async def test_waits_of_a_coalesced_request_are_not_network_time(make_client):
+    throttled = []
+
+    def handler(url, headers):
+        if not throttled:
+            throttled.append(url)
+            return error(429, {"Retry-After": "0.1"})
+        return serve_fixtures(url, headers)
+
+    client = make_client(transport=FakeTransport(handler, latency=0.01), profile=True)
+    id = spotify_id("track", 1)
+
+    await asyncio.gather(*(client.get_track(id) for _ in range(2)))
+
+    profile = client.profiler.methods["get_track"]
+    assert profile.network < 0.1
+    assert profile.other >= 0.2
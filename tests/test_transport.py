@@ -0,0 +1,56 @@
+import pytest
+from conftest import FakeTransport
+
+from benchmarks.fixtures import spotify_id
+from spoti2py.exceptions import NotRecorded
+from spoti2py.transport import RecordingTransport, ReplayTransport
+
+
+async def test_recorded_session_replays_without_the_network(make_client, tmp_path):
+    path = str(tmp_path / "session.rec")
+    ids = [spotify_id("track", i) for i in range(3)]
+    recording = RecordingTransport(path, transport=FakeTransport())
+    client = make_client(transport=recording)
+    recorded = await client.get_tracks(ids)
+    album = await client.get_album(spotify_id("album", 1))
+    await client.close()
+
+    replay = ReplayTransport(path)
+    client = make_client(transport=replay)
+    replayed = await client.get_tracks(ids)
+    replayed_album = await client.get_album(spotify_id("album", 1))
+
+    assert len(replay) == recording.count == 3
+    assert [track.id for track in replayed] == [track.id for track in recorded]
+    assert replayed_album.name == album.name
+    with pytest.raises(NotRecorded):
+        await client.get_track(spotify_id("track", 99))
+    await client.close()
+
+
+async def test_recordings_contain_no_credentials(make_client, tmp_path):
+    path = str(tmp_path / "session.rec")
+    client = make_client(transport=RecordingTransport(path, transport=FakeTransport()))
+    await client.get_track(spotify_id("track", 1))
+    await client.close()
+
+    with open(path, "rb") as file:
+        contents = file.read()
+    assert b"token-1" not in contents
+    assert b"client-secret" not in contents
+
+
+async def test_replay_ignores_a_truncated_last_record(make_client, tmp_path):
+    path = str(tmp_path / "session.rec")
+    client = make_client(transport=RecordingTransport(path, transport=FakeTransport()))
+    await client.get_track(spotify_id("track", 1))
+    await client.get_track(spotify_id("track", 2))
+    await client.close()
+    with open(path, "r+b") as file:
+        file.truncate(file.seek(0, 2) - 10)
+
+    replay = ReplayTransport(path)
+
+    # The token and the first track are intact.
+    assert len(replay) == 2
+    await replay.close()